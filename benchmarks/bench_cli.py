@@ -0,0 +1,258 @@
+"""
+End-to-end benchmark of the EpicEvents CLI at realistic data sizes.
+
+For each size N (number of customers), the benchmark database is seeded with
+epicevents.utils.create_dataset, then every command below is timed in-process
+through typer's CliRunner and as a subprocess. Wall time, SQL query count and
+peak memory are compared against a stored baseline and regressions are flagged
+(exit code 1).
+
+    python -m benchmarks.bench_cli --sizes 1000 100000 1000000
+    python -m benchmarks.bench_cli --sizes 1000 --update-baseline
+
+By default a SQLite file is used (benchmarks/.data/bench.db); --postgres runs
+against the database configured in .env, which must be a dedicated one.
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.harness import DB_ENV, QueryCounter, bind_database, skip_pagination
+
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = Path(__file__).resolve().parent / ".data"
+BASELINE_FILE = Path(__file__).resolve().parent / "baseline.json"
+
+# (role running the command, command template)
+COMMANDS = [
+    ("sales", ["user", "login", "-u", "{sales_username}", "-p", "{sales_password}"]),
+    ("admin", ["user", "list"]),
+    ("sales", ["user", "read", "{sales_id}"]),
+    ("sales", ["customer", "list"]),
+    ("sales", ["customer", "list", "--fi"]),
+    ("sales", ["customer", "read", "{customer_id}"]),
+    ("sales", ["customer", "update", "{customer_id}", "-p", "0600000000"]),
+    ("management", ["contract", "list"]),
+    ("management", ["contract", "list", "--fi"]),
+    ("management", ["contract", "read", "{contract_id}"]),
+    ("management", ["contract", "update", "{contract_id}", "-s"]),
+    ("support", ["event", "list"]),
+    ("support", ["event", "list", "--fi"]),
+    ("support", ["event", "read", "{event_id}"]),
+    ("support", ["event", "read", "{event_range}"]),
+    ("support", ["event", "update", "{event_id}", "-a", "100"]),
+    ("admin", ["debug", "permissions"]),
+]
+
+# Differences below this many seconds are considered noise
+NOISE_FLOOR = 0.02
+
+console = Console()
+
+
+def seed_database(size: int) -> dict:
+    """Seeds the bound database up to `size` customers and returns command placeholders."""
+    from peewee import fn
+    from epicevents.models.role import Role
+    from epicevents.models.user import User
+    from epicevents.models.customer import Customer
+    from epicevents.models.contract import Contract
+    from epicevents.models.event import Event
+    from epicevents.utils.create_dataset import generate_dataset
+
+    existing = Customer.select().count()
+    if existing < size:
+        console.print(f"[blue]Seeding {size - existing} customers...[/blue]")
+        generate_dataset(customers=size - existing, seed=size)
+
+    admin, _ = User.get_or_create(
+        username="bench_admin",
+        defaults={
+            "password": "BENCH_ADMIN_PASS",
+            "email": "bench_admin@epicevents.com",
+            "first_name": "Bench",
+            "last_name": "Admin",
+            "phone": "0600000000",
+            "role": Role.get(name="admin"),
+        },
+    )
+
+    # Users owning at least one record, so ownership rules pass
+    customer = Customer.select().where(Customer.team_contact_id.is_null(False)).order_by(Customer.id).first()
+    event = Event.select().where(Event.team_contact_id.is_null(False)).order_by(Event.id).first()
+    contract = Contract.select().order_by(Contract.id).first()
+    sales = customer.team_contact_id
+    first_event_id = Event.select(fn.MIN(Event.id)).scalar()
+
+    return {
+        "users": {
+            "admin": admin,
+            "sales": sales,
+            "management": User.select().join(Role).where(Role.name == "management").first(),
+            "support": event.team_contact_id,
+        },
+        "placeholders": {
+            "sales_username": sales.username,
+            "sales_password": f"{sales.username.split('_')[0].upper()}_PASS{sales.username.split('_')[-1]}",
+            "sales_id": sales.id,
+            "customer_id": customer.id,
+            "contract_id": contract.id,
+            "event_id": event.id,
+            "event_range": f"{first_event_id}-{first_event_id + 49}",
+        },
+    }
+
+
+def resolve(template: list, placeholders: dict) -> list:
+    """Replaces {placeholders} in a command template."""
+    return [arg.format(**placeholders) for arg in template]
+
+
+def measure_inprocess(app, database, args: list, repeat: int) -> dict:
+    """Times a command through CliRunner, then measures its peak Python allocations once."""
+    from typer.testing import CliRunner
+
+    runner = CliRunner()
+    sys.argv = ["epicevents", *args]  # check_auth reads the target ID from sys.argv
+    timings = []
+    queries = 0
+    exit_code = 0
+    for _ in range(repeat):
+        with QueryCounter(database) as counter:
+            start = time.perf_counter()
+            result = runner.invoke(app, args, obj={})
+            timings.append(time.perf_counter() - start)
+        queries = counter.count
+        exit_code = result.exit_code
+
+    # Separate run: tracemalloc slows execution down
+    tracemalloc.start()
+    runner.invoke(app, args, obj={})
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "wall_time": statistics.median(timings),
+        "queries": queries,
+        "peak_kb": peak // 1024,
+        "exit_code": exit_code,
+    }
+
+
+def measure_subprocess(args: list, repeat: int, workdir: str, db_path: str) -> dict:
+    """Times a command in a fresh interpreter, as a user would run it."""
+    env = dict(os.environ, PYTHONPATH=str(ROOT), **{DB_ENV: db_path or ""})
+    reports = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        process = subprocess.run(
+            [sys.executable, "-m", "benchmarks.harness", *args],
+            cwd=workdir, env=env, capture_output=True, text=True
+        )
+        elapsed = time.perf_counter() - start
+        report = json.loads(process.stderr.strip().splitlines()[-1])
+        report["process_time"] = elapsed
+        reports.append(report)
+
+    return {
+        "wall_time": statistics.median(report["process_time"] for report in reports),
+        "queries": reports[-1]["queries"],
+        "peak_kb": max(report["peak_rss_kb"] for report in reports),
+        "exit_code": reports[-1]["exit_code"],
+    }
+
+
+def compare(key: str, result: dict, baseline: dict, tolerance: float) -> list:
+    """Returns the list of regressions of a result against its baseline entry."""
+    reference = baseline.get(key)
+    if not reference:
+        return []
+
+    regressions = []
+    wall_delta = result["wall_time"] - reference["wall_time"]
+    if wall_delta > NOISE_FLOOR and result["wall_time"] > reference["wall_time"] * (1 + tolerance):
+        regressions.append(f"temps {reference['wall_time']:.3f}s → {result['wall_time']:.3f}s")
+    if result["queries"] > reference["queries"]:
+        regressions.append(f"requêtes {reference['queries']} → {result['queries']}")
+    if reference["peak_kb"] and result["peak_kb"] > reference["peak_kb"] * (1 + tolerance):
+        regressions.append(f"mémoire {reference['peak_kb']} → {result['peak_kb']} KB")
+
+    return regressions
+
+
+def main(
+    sizes: list[int] = typer.Option([1000], "--sizes", help="Nombres de clients à tester (ex: 1000 100000)"),
+    repeat: int = typer.Option(3, "--repeat", help="Exécutions par commande (médiane retenue)"),
+    modes: list[str] = typer.Option(["runner", "subprocess"], "--mode", help="runner et/ou subprocess"),
+    tolerance: float = typer.Option(0.25, "--tolerance", help="Marge tolérée avant de signaler une régression"),
+    postgres: bool = typer.Option(False, "--postgres", help="Utilise la base PostgreSQL du .env (base dédiée !)"),
+    baseline_file: Path = typer.Option(BASELINE_FILE, "--baseline", help="Fichier JSON de référence"),
+    update_baseline: bool = typer.Option(False, "--update-baseline", help="Enregistre les résultats comme référence"),
+):
+    """Benchmarks every CLI command at each data size."""
+    from epicevents.cli import init_cli
+    from epicevents.permissions.auth import generate_token
+
+    DATA_DIR.mkdir(exist_ok=True)
+    db_path = None if postgres else str(DATA_DIR / "bench.db")
+    database = bind_database(db_path)
+    skip_pagination()
+    app = init_cli()
+
+    baseline = json.loads(baseline_file.read_text()) if baseline_file.exists() else {}
+    results = {}
+    regressions = {}
+    workdir = tempfile.mkdtemp(prefix="epicevents-bench-")
+    os.chdir(workdir)  # The CLI stores its token in the working directory
+
+    for size in sorted(sizes):
+        seeded = seed_database(size)
+
+        for role, template in COMMANDS:
+            args = resolve(template, seeded["placeholders"])
+            label = " ".join(template)
+            generate_token(seeded["users"][role])
+
+            for mode in modes:
+                key = f"{size}|{mode}|{label}"
+                if mode == "runner":
+                    result = measure_inprocess(app, database, args, repeat)
+                else:
+                    result = measure_subprocess(args, repeat, workdir, db_path)
+                results[key] = result
+                regressions[key] = compare(key, result, baseline, tolerance)
+
+    table = Table(title="Benchmark CLI EpicEvents", header_style="blue bold", title_style="purple bold")
+    for column in ["N", "Mode", "Commande", "Temps (s)", "Requêtes", "Mémoire (KB)", "Régressions"]:
+        table.add_column(column)
+    for key, result in results.items():
+        size, mode, label = key.split("|")
+        style = "red" if regressions[key] else ("yellow" if result["exit_code"] else "white")
+        table.add_row(
+            size, mode, label, f"{result['wall_time']:.3f}", str(result["queries"]),
+            str(result["peak_kb"]), ", ".join(regressions[key]), style=style
+        )
+    console.print(table)
+
+    if update_baseline:
+        baseline.update(results)
+        baseline_file.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        console.print(f"[green]✅ Référence mise à jour : {baseline_file}[/green]")
+    elif any(regressions.values()):
+        console.print("[bold red]❌ Régressions détectées.[/bold red]")
+        raise typer.Exit(1)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,113 @@
+"""
+Helpers shared by the benchmark runner and its subprocess entry point.
+
+Run as a module, this file executes one EpicEvents CLI command on the
+benchmark database and prints its cost (wall time, queries, peak RSS) as a
+JSON line on stderr:
+
+    EPICEVENTS_BENCH_DB=bench.db python -m benchmarks.harness customer list
+"""
+import json
+import os
+import sys
+import time
+
+try:
+    import resource  # Not available on Windows
+except ImportError:
+    resource = None
+
+os.environ.setdefault("SECRET_KEY", "epicevents-benchmark-secret-key")
+
+from peewee import SqliteDatabase  # noqa: E402
+from epicevents.models.database import BaseModel  # noqa: E402
+from epicevents.models.role import Role  # noqa: E402
+from epicevents.models.user import User  # noqa: E402
+from epicevents.models.company import Company  # noqa: E402
+from epicevents.models.customer import Customer  # noqa: E402
+from epicevents.models.contract import Contract  # noqa: E402
+from epicevents.models.event import Event  # noqa: E402
+from epicevents.models.tombstone import Tombstone  # noqa: E402
+from epicevents.models.checkpoint import Checkpoint  # noqa: E402
+
+
+MODELS = [Role, User, Company, Customer, Contract, Event, Tombstone, Checkpoint]
+DB_ENV = "EPICEVENTS_BENCH_DB"
+
+
+def bind_database(path: str = None):
+    """Binds every model to a SQLite file, or keeps the configured PostgreSQL database."""
+    if not path:
+        return BaseModel._meta.database
+
+    database = SqliteDatabase(path, pragmas={"journal_mode": "wal", "synchronous": "off"})
+    database.bind([BaseModel] + MODELS, bind_refs=False, bind_backrefs=False)
+    database.create_tables(MODELS)
+    return database
+
+
+def skip_pagination():
+    """Answers 'Echap' to the pagination prompt, so list commands stop after the first page."""
+    import keyboard
+    keyboard.is_pressed = lambda key: key == "escape"
+
+
+class QueryCounter:
+    """Counts statements sent through database.execute_sql."""
+
+    def __init__(self, database):
+        self.database = database
+        self.count = 0
+
+    def __enter__(self):
+        original_execute_sql = self.database.execute_sql
+
+        def counting_execute_sql(sql, params=None, *args, **kwargs):
+            self.count += 1
+            return original_execute_sql(sql, params, *args, **kwargs)
+
+        self.database.execute_sql = counting_execute_sql
+        return self
+
+    def __exit__(self, *exc):
+        del self.database.execute_sql
+
+
+def peak_rss_kb() -> int:
+    """Returns the peak resident set size of this process in KB (0 if unknown)."""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def run_cli():
+    """Subprocess entry point: runs the CLI with sys.argv and reports its cost on stderr."""
+    from epicevents.cli import init_cli
+
+    database = bind_database(os.getenv(DB_ENV))
+    skip_pagination()
+    app = init_cli()
+
+    start = time.perf_counter()
+    exit_code = 0
+    with QueryCounter(database) as counter:
+        try:
+            # Without standalone mode, click returns typer.Exit codes instead of raising
+            exit_code = app(args=sys.argv[1:], obj={}, standalone_mode=False) or 0
+        except SystemExit as e:
+            exit_code = e.code or 0
+        except Exception:
+            exit_code = 1
+
+    report = {
+        "wall_time": time.perf_counter() - start,
+        "queries": counter.count,
+        "peak_rss_kb": peak_rss_kb(),
+        "exit_code": exit_code,
+    }
+    sys.stderr.write(json.dumps(report) + "\n")
+
+
+if __name__ == "__main__":
+    run_cli()
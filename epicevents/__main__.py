@@ -1,7 +1,8 @@
 import sys
 import sentry_sdk
 from epicevents.cli import init_cli
-from epicevents.config import SENTRY_DSN, SENTRY_ENV
+from epicevents.permissions.security import security_events
+from epicevents.config import SENTRY_DSN, SENTRY_ENV, SENTRY_TRACES_SAMPLE_RATE
 
 
 # Initialising Sentry
@@ -10,15 +11,28 @@ def sentry_init():
     Sentry has a few entries in the app :
     - In the __main__ script to log unhandled errors.
     - In epicevents.permissions.auth.check_auth() & authenticate_user()
-      to log forbidden activities & authentication failures.
+      to log forbidden activities & authentication failures, aggregated by
+      epicevents.permissions.security before being sent.
+
+    With SENTRY_TRACES_SAMPLE_RATE > 0, each command is traced as a
+    'resource.action' transaction with spans for JWT verification,
+    permissions, SQL statements, argon2 hashing and Rich rendering.
     """
     if SENTRY_DSN != "https://SENTRYKEY.ingest.de.sentry.io/PROJECTCODE":
         sentry_sdk.init(
             dsn=SENTRY_DSN,
             environment=SENTRY_ENV,
-            traces_sample_rate=0.0  # deactivates perf tracking
+            traces_sample_rate=SENTRY_TRACES_SAMPLE_RATE  # 0.0 deactivates perf tracking
         )
 
+        # Reports security events buffered by earlier calls once their window has elapsed
+        security_events.register()
+
+        if SENTRY_TRACES_SAMPLE_RATE > 0:
+            from epicevents.models.database import BaseModel
+            from epicevents.utils.tracing import trace_queries
+            trace_queries(BaseModel._meta.database)
+
 
 # Main app entry point
 def main():
@@ -9,9 +9,29 @@ app = typer.Typer(
 )
 
 
+@app.callback()
+def main_callback(
+    ctx: typer.Context,
+    profile: bool = typer.Option(False, "--profile", help="Affiche le profil SQL de la commande"),
+):
+    """Global options, applied before every command."""
+    from epicevents.config import PROFILE
+    from epicevents.models.database import BaseModel
+    from epicevents.utils.profiler import QueryProfiler
+    from epicevents.utils.metrics import metrics
+    from epicevents.utils.tracing import start_command_transaction
+
+    start_command_transaction(ctx)
+    metrics.start(ctx, BaseModel._meta.database)
+
+    if profile or PROFILE:
+        profiler = QueryProfiler(BaseModel._meta.database).start()
+        ctx.call_on_close(profiler.report)
+
+
 def init_cli():
     from epicevents.permissions.auth import check_auth
-    from epicevents.cli import users, customers, contracts, events, debug
+    from epicevents.cli import users, customers, contracts, events, debug, db, exports, search, dashboard
 
     # Adding sub-commands
     app.add_typer(users.app, name="user", help="Gestion des utilisateurs", callback=check_auth)
@@ -19,5 +39,10 @@ def init_cli():
     app.add_typer(contracts.app, name="contract", help="Gestion des contrats", callback=check_auth)
     app.add_typer(events.app, name="event", help="Gestion des événements", callback=check_auth)
     app.add_typer(debug.app, name="debug", help="Fonctions de debug", callback=check_auth)
+    app.add_typer(db.app, name="db", help="Maintenance de la base de données", callback=check_auth)
+    app.add_typer(exports.app, name="export", help="Export des données", callback=check_auth)
+    # Top-level commands, authorized by the commands themselves
+    app.command("search", help="Recherche clients, entreprises et événements")(search.search_all)
+    app.command("dashboard", help="Tableau de bord des contrats et événements")(dashboard.show_dashboard)
 
     return app
@@ -1,4 +1,6 @@
 import typer
+from datetime import datetime
+from typing import List
 from rich.console import Console
 from rich.prompt import Confirm
 from peewee import DoesNotExist
@@ -6,7 +8,10 @@ from peewee import IntegrityError
 from epicevents.models.contract import Contract
 from epicevents.models.customer import Customer
 from epicevents.models.user import User
-from epicevents.cli.utils import display_list, format_text
+from epicevents.models.serializer import batch_get_data
+from epicevents.permissions.perm import filter_permitted
+from epicevents.cli.utils import display_list, display_jsonl, format_contact, format_text
+from epicevents.cli.utils import ids_condition, parse_ids
 from dotenv import get_key
 
 
@@ -70,68 +75,103 @@ def create_contract(
         raise typer.Exit(1)
 
 
+def display_contract(contract: Contract):
+    """Displays the details of a single contract."""
+    customer = contract.customer
+
+    customer_contact = "Aucun"
+    if customer and customer.team_contact_id:
+        customer_contact = format_contact(customer.team_contact_id)
+
+    contract_data = [
+        {"Champ": "ID", "Valeur": contract.id},
+        {
+            "Champ": "Client",
+            "Valeur": f"{customer.first_name} {customer.last_name.upper()}" if customer else "Aucun"
+        },
+        {"Champ": "Montant total", "Valeur": f"{contract.amount_total:.2f} {CURRENCY}"},
+        {"Champ": "Montant dû", "Valeur": f"{contract.amount_due:.2f} {CURRENCY}"},
+        {"Champ": "Signé", "Valeur": "✅ Oui" if contract.signed else "❌ Non"},
+        {"Champ": "Epic Contact", "Valeur": format_contact(contract.team_contact_id)},
+        {"Champ": "Contact du client", "Valeur": f" {customer_contact}"},
+    ]
+    display_list(f"Contrat {contract.id}", contract_data)
+
+
+def read_query(ids: list, ranges: list):
+    """Returns the query of 'contract read': contracts, customers and both contacts in a single query."""
+    return Contract.select_detailed().where(ids_condition(Contract.id, ids, ranges)).order_by(Contract.id)
+
+
 @app.command("read")
 def read_contract(
-    contract_id: int = typer.Argument(None, help="ID du contrat à afficher")
+    ctx: typer.Context,
+    contract_ids: List[str] = typer.Argument(None, help="ID(s) ou plages d'IDs des contrats (ex: 12 15 20-40)"),
+    jsonl: bool = typer.Option(False, "--jsonl", help="Affiche les contrats au format JSONL"),
 ):
-    """Shows contract details given contract uid."""
-
-    if contract_id is not None:
-        try:
-            contract = Contract.get_by_id(contract_id)
-
-            # Get contract contact
-            team_contact = User.get_or_none(User.id == contract.team_contact_id)
-
-            # Get customer and customer contact
-            customer = contract.customer
-            customer_contact = "Aucun"
-            if customer and customer.team_contact_id:
-                user = User.get_or_none(User.id == customer.team_contact_id)
-                if user:
-                    customer_contact = f"{user.first_name} {user.last_name.upper()} ({user.id})"
-
-            contract = Contract.get_by_id(contract_id)
-            team_contact = User.get_or_none(User.id == contract.team_contact_id)
-            contract_data = [
-                {"Champ": "ID", "Valeur": contract.id},
-                {"Champ": "Client", "Valeur": f"{contract.customer.first_name} {contract.customer.last_name.upper()}"},
-                {"Champ": "Montant total", "Valeur": f"{contract.amount_total:.2f} {CURRENCY}"},
-                {"Champ": "Montant dû", "Valeur": f"{contract.amount_due:.2f} {CURRENCY}"},
-                {"Champ": "Signé", "Valeur": "✅ Oui" if contract.signed else "❌ Non"},
-                {
-                    "Champ": "Epic Contact",
-                    "Valeur": (
-                        f"{team_contact.first_name} {team_contact.last_name.upper()} ({team_contact.id})"
-                        if team_contact
-                        else "Aucun"
-                    )
-                },
-                {"Champ": "Contact du client", "Valeur": f" {customer_contact}"},
-            ]
-            display_list(f"Contrat {contract.id}", contract_data)
+    """Shows one or several contracts given their uid."""
 
-        except DoesNotExist:
-            console.print(format_text('bold', 'red', f"❌ Erreur : Le contrat ID {contract_id} n'existe pas."))
-            raise typer.Exit()
-    else:
+    if not contract_ids:
         console.print(format_text('bold', 'red', "❌ Erreur : Vous n'avez pas fourni d'ID de contrat."))
+        return
 
+    try:
+        ids, ranges = parse_ids(contract_ids)
+    except ValueError as e:
+        console.print(format_text('bold', 'red', f"{str(e)}"))
+        raise typer.Exit(1)
 
-@app.command("list")
-def list_contracts(
-    ctx: typer.Context,
-    filter_on: bool = typer.Option(False, "--fi", help="Filtre automatiquement les contrats selon votre rôle"),
-):
-    """List all contracts."""
+    contracts = list(read_query(ids, ranges))
+    contracts, denied = filter_permitted(ctx.obj, "contract", "read", contracts)
 
-    contracts = Contract.select()
+    found_ids = {contract.id for contract in contracts} | {contract.id for contract in denied}
+    missing_ids = [str(contract_id) for contract_id in ids if contract_id not in found_ids]
+
+    if denied:
+        denied_ids = ", ".join(str(contract.id) for contract in denied)
+        console.print(format_text('bold', 'red', f"❌ Accès refusé aux contrats : {denied_ids}"))
+
+    if not contracts:
+        if not denied:
+            console.print(
+                format_text('bold', 'red', f"❌ Erreur : Le contrat ID {' '.join(contract_ids)} n'existe pas.")
+            )
+        raise typer.Exit()
+
+    if missing_ids:
+        console.print(format_text('bold', 'yellow', f"⚠  Contrat(s) introuvable(s) : {', '.join(missing_ids)}"))
+
+    if jsonl:
+        display_jsonl(batch_get_data(contracts))
+    elif len(contracts) == 1 and not ranges:
+        display_contract(contracts[0])
+    else:
+        contracts_list = [
+            {
+                "ID": contract.id,
+                "CLIENT": (
+                    f"{contract.customer.first_name} {contract.customer.last_name.upper()} ({contract.customer.id})"
+                    if contract.customer
+                    else "Aucun"
+                ),
+                "MONTANT TOTAL": f"{contract.amount_total:.2f} {CURRENCY}",
+                "MONTANT DÛ": f"{contract.amount_due:.2f} {CURRENCY}",
+                "SIGNÉ": "✅ Oui" if contract.signed else "❌ Non",
+                "EPIC CONTACT": format_contact(contract.team_contact_id),
+            }
+            for contract in contracts
+        ]
+        display_list(f"Contrats ({len(contracts_list)})", contracts_list)
+
+
+def list_query(user: User, filter_on: bool) -> tuple:
+    """Returns the query of 'contract list' for the user, with its title and empty message."""
+    # Customer and contacts are joined, so the rows are built without a query per contract
+    contracts = Contract.select_detailed()
     nothing_message = "❌ Aucun contrat n'est enregistré dans la bdd."
     title_str = "Liste des contrats"
 
     if filter_on:
-        user = ctx.obj
-
         if user.role.name == "sales":
             contracts = contracts.where((not Contract.signed) | (Contract.amount_due > 0))
             nothing_message = "❌ Aucun contrat 'problématique' dans la bdd."
@@ -149,6 +189,17 @@ def list_contracts(
             nothing_message = "❌ Aucun contrat avec agent dans la bdd."
             title_str = title_str + " (Avec agents attribués)"
 
+    return contracts, title_str, nothing_message
+
+
+@app.command("list")
+def list_contracts(
+    ctx: typer.Context,
+    filter_on: bool = typer.Option(False, "--fi", help="Filtre automatiquement les contrats selon votre rôle"),
+):
+    """List all contracts."""
+
+    contracts, title_str, nothing_message = list_query(ctx.obj, filter_on)
     contracts = list(contracts)
     if not contracts:
         console.print(
@@ -189,6 +240,125 @@ def list_contracts(
     display_list(title_str, contracts_list, use_context=True)
 
 
+def report_label(by: str, row: dict) -> str:
+    """Returns the name of a report group."""
+    if by == "month":
+        return str(row["month"])[:7]
+    if row["id"] is None:
+        return "Aucun"
+    if by == "company":
+        return f"{row['name']} ({row['id']})"
+    return f"{row['first_name']} {row['last_name'].upper()} ({row['id']})"
+
+
+@app.command("report")
+def report_contracts(
+    by: str = typer.Option("rep", "--by", help="Regroupement : rep, customer, company ou month"),
+    date_from: str = typer.Option(None, "--from", help="Contrats créés à partir du (YYYY-MM-DD)"),
+    date_to: str = typer.Option(None, "--to", help="Contrats créés avant le (YYYY-MM-DD)"),
+):
+    """Totals signed/unsigned contracts, billed and outstanding amounts per rep, customer, company or month."""
+
+    try:
+        start = datetime.strptime(date_from, "%Y-%m-%d") if date_from else None
+        end = datetime.strptime(date_to, "%Y-%m-%d") if date_to else None
+        rows = list(Contract.report(by, start, end))
+    except ValueError as e:
+        message = str(e) if str(e).startswith("❌") else "❌ Erreur : Date invalide (YYYY-MM-DD)."
+        console.print(format_text('bold', 'red', message))
+        raise typer.Exit(1)
+
+    if not rows:
+        console.print(format_text('bold', 'red', "❌ Aucun contrat sur cette période."))
+        return
+
+    report_list = [
+        {
+            "GROUPE": report_label(by, row),
+            "SIGNÉS": row["signed_count"],
+            "NON SIGNÉS": row["unsigned_count"],
+            "FACTURÉ": f"{row['billed']:.2f} {CURRENCY}",
+            "RESTANT DÛ": f"{row['outstanding']:.2f} {CURRENCY}",
+            "NON SIGNÉ": f"{row['unsigned_total']:.2f} {CURRENCY}",
+        }
+        for row in rows
+    ]
+
+    period = f" du {date_from or '…'} au {date_to or '…'}" if date_from or date_to else ""
+    display_list(f"Rapport des contrats par {by}{period}", report_list)
+
+
+@app.command("aging")
+def aging_contracts(
+    by: str = typer.Option("customer", "--by", help="Regroupement : customer ou rep"),
+    as_of: str = typer.Option(None, "--as-of", help="Date de référence (YYYY-MM-DD), aujourd'hui par défaut"),
+    output: str = typer.Option("rich", "--format", help="Format de sortie : rich, csv ou json"),
+):
+    """Ages the amounts due of signed contracts in 0-30/31-60/61-90/90+ day buckets per customer or rep."""
+    import csv
+    import json
+    import sys
+    from epicevents.utils.aging import BUCKET_LABELS, compute_aging
+
+    if output not in ["rich", "csv", "json"]:
+        console.print(format_text('bold', 'red', "❌ Erreur : Format invalide (rich, csv, json)."))
+        raise typer.Exit(1)
+
+    try:
+        reference = datetime.strptime(as_of, "%Y-%m-%d") if as_of else None
+        rows = compute_aging(by, reference)
+    except ValueError as e:
+        message = str(e) if str(e).startswith("❌") else "❌ Erreur : Date invalide (YYYY-MM-DD)."
+        console.print(format_text('bold', 'red', message))
+        raise typer.Exit(1)
+
+    # Group names in one query
+    model = Customer if by == "customer" else User
+    keys = [row["key"] for row in rows if row["key"] is not None]
+    names = {
+        item.id: f"{item.first_name} {item.last_name.upper()} ({item.id})"
+        for item in model.select(model.id, model.first_name, model.last_name).where(model.id.in_(keys))
+    } if keys else {}
+
+    records = [
+        {
+            "group_id": row["key"],
+            "group": names.get(row["key"], "Aucun"),
+            "contracts": row["count"],
+            **{label: round(amount, 2) for label, amount in zip(BUCKET_LABELS, row["buckets"])},
+            "due": round(row["due"], 2),
+            "weighted_age_days": round(row["weighted_age"], 1),
+            "due_ratio": round(row["due"] / row["total"], 4) if row["total"] else 0.0,
+        }
+        for row in rows
+    ]
+
+    if output == "json":
+        console.out(json.dumps(records, ensure_ascii=False), highlight=False)
+        return
+    if output == "csv":
+        writer = csv.DictWriter(sys.stdout, fieldnames=list(records[0]) if records else ["group_id"])
+        writer.writeheader()
+        writer.writerows(records)
+        return
+
+    if not records:
+        console.print(format_text('bold', 'green', "✅ Aucun montant dû."))
+        return
+
+    aging_list = [
+        {
+            "GROUPE": record["group"],
+            **{label: f"{record[label]:.2f}" for label in BUCKET_LABELS},
+            "TOTAL DÛ": f"{record['due']:.2f}",
+            "ÂGE MOY.": f"{record['weighted_age_days']:.0f} j",
+            "% DÛ": f"{record['due_ratio']:.0%}",
+        }
+        for record in records
+    ]
+    display_list(f"Balance âgée par {by} ({CURRENCY})", aging_list)
+
+
 @app.command("update")
 def update_contract(
     contract_id: int = typer.Argument(..., help="ID du contrat à modifier"),
@@ -241,6 +411,38 @@ def update_contract(
         raise typer.Exit(1)
 
 
+@app.command("reassign")
+def reassign_contracts(
+    from_id: int = typer.Option(..., "--from", help="ID du gestionnaire actuel"),
+    to_id: int = typer.Option(..., "--to", help="ID du nouveau gestionnaire"),
+    customer_id: int = typer.Option(None, "-c", help="Limiter aux contrats de ce client"),
+    due_only: bool = typer.Option(False, "--due", help="Limiter aux contrats non réglés"),
+):
+    """Reassigns all contracts of a manager to another one."""
+
+    try:
+        new_contact = User.get_by_id(to_id)
+    except DoesNotExist:
+        console.print(format_text('bold', 'red', f"❌ Erreur : L'utilisateur ID {to_id} n'existe pas."))
+        raise typer.Exit()
+
+    conditions = []
+    if customer_id:
+        conditions.append(Contract.customer == customer_id)
+    if due_only:
+        conditions.append(Contract.amount_due > 0)
+
+    try:
+        count = Contract.reassign(from_id, new_contact, *conditions)
+    except ValueError as e:
+        console.print(format_text('bold', 'red', f"{str(e)}"))
+        raise typer.Exit(1)
+
+    console.print(
+        format_text('bold', 'green', f"✅ {count} contrat(s) réattribué(s) de l'utilisateur {from_id} à {to_id}.")
+    )
+
+
 @app.command("delete")
 def delete_contract(
     contract_id: int = typer.Argument(..., help="ID du contrat à supprimer")
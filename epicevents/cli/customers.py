@@ -1,15 +1,24 @@
 import typer
+from typing import List
 from rich.console import Console
 from rich.prompt import Confirm
 from peewee import DoesNotExist
 from epicevents.models.customer import Customer
 from epicevents.models.company import Company
 from epicevents.models.user import User
+from epicevents.models.serializer import batch_get_data
+from epicevents.permissions.perm import filter_permitted
 from epicevents.cli.utils import display_list
+from epicevents.cli.utils import display_jsonl
+from epicevents.cli.utils import format_contact
 from epicevents.cli.utils import format_text
+from epicevents.cli.utils import ids_condition
+from epicevents.cli.utils import parse_ids
+from dotenv import get_key
 
 
 app = typer.Typer(help="Gestion des clients")
+CURRENCY = get_key(".env", "CURRENCY")
 console = Console()
 
 
@@ -89,46 +98,136 @@ def create_customer(
         raise typer.Exit(1)
 
 
+def display_customer(customer: Customer):
+    """Displays the details of a single customer."""
+    customer_data = [
+        {"Champ": "ID", "Valeur": customer.id},
+        {"Champ": "Email", "Valeur": customer.email},
+        {"Champ": "Téléphone", "Valeur": customer.phone},
+        {"Champ": "Entreprise", "Valeur": customer.company.name if customer.company else "Aucune"},
+        {"Champ": "Epic Contact", "Valeur": format_contact(customer.team_contact_id)},
+    ]
+    display_list(f"Client {customer.first_name} {customer.last_name.upper()}", customer_data)
+
+
+def read_query(ids: list, ranges: list):
+    """Returns the query of 'customer read': customers, companies and contacts in a single query."""
+    return Customer.select_detailed().where(ids_condition(Customer.id, ids, ranges)).order_by(Customer.id)
+
+
 @app.command("read")
-def read_customer(customer_id: int = typer.Argument(None, help="ID du client à afficher")):
-    """Shows customer details given customer uid."""
+def read_customer(
+    ctx: typer.Context,
+    customer_ids: List[str] = typer.Argument(..., help="ID(s) ou plages d'IDs des clients (ex: 12 15 20-40)"),
+    jsonl: bool = typer.Option(False, "--jsonl", help="Affiche les clients au format JSONL"),
+):
+    """Shows one or several customers given their uid."""
+
     try:
-        customer = Customer.get_by_id(customer_id)
-        customer_data = [
-            {"Champ": "ID", "Valeur": customer.id},
-            {"Champ": "Email", "Valeur": customer.email},
-            {"Champ": "Téléphone", "Valeur": customer.phone},
-            {"Champ": "Entreprise", "Valeur": customer.company.name},
+        ids, ranges = parse_ids(customer_ids)
+    except ValueError as e:
+        console.print(format_text('bold', 'red', f"{str(e)}"))
+        raise typer.Exit(1)
+
+    customers = list(read_query(ids, ranges))
+    customers, denied = filter_permitted(ctx.obj, "customer", "read", customers)
+
+    found_ids = {customer.id for customer in customers} | {customer.id for customer in denied}
+    missing_ids = [str(customer_id) for customer_id in ids if customer_id not in found_ids]
+
+    if denied:
+        denied_ids = ", ".join(str(customer.id) for customer in denied)
+        console.print(format_text('bold', 'red', f"❌ Accès refusé aux clients : {denied_ids}"))
+
+    if not customers:
+        if not denied:
+            console.print(format_text('bold', 'red', f"❌ Client ID {' '.join(customer_ids)} introuvable."))
+        raise typer.Exit()
+
+    if missing_ids:
+        console.print(format_text('bold', 'yellow', f"⚠  Client(s) introuvable(s) : {', '.join(missing_ids)}"))
+
+    if jsonl:
+        display_jsonl(batch_get_data(customers))
+    elif len(customers) == 1 and not ranges:
+        display_customer(customers[0])
+    else:
+        customers_list = [
             {
-                "Champ": "Epic Contact",
-                "Valeur": (
-                    f"{customer.team_contact_id.first_name} {customer.team_contact_id.last_name.upper()} "
-                    f"({customer.team_contact_id.id})"
-                    if isinstance(customer.team_contact_id, User)
-                    else f"ID: {customer.team_contact_id}"
-                    if customer.team_contact_id
-                    else "Aucun"
-                )
+                "ID": customer.id,
+                "FIRST NAME": customer.first_name,
+                "LAST NAME": customer.last_name.upper(),
+                "EMAIL": customer.email,
+                "TÉLÉPHONE": customer.phone,
+                "COMPANY": customer.company.name if customer.company else "Aucune",
+                "EPIC CONTACT": format_contact(customer.team_contact_id),
             }
+            for customer in customers
         ]
-        display_list(f"Client {customer.first_name} {customer.last_name.upper()}", customer_data)
-    except DoesNotExist:
-        console.print(format_text('bold', 'red', f"❌ Client ID {customer_id} introuvable."))
-        raise typer.Exit()
+        display_list(f"Clients ({len(customers_list)})", customers_list)
 
 
-@app.command("list")
-def list_customers(
-    ctx: typer.Context,
-    filter_on: bool = typer.Option(False, "--fi", help="Filtre automatiquement les clients selon votre rôle")
+def tree_contact(contact: dict) -> str:
+    """Formats a contact of customer_tree()."""
+    if not contact:
+        return "Aucun"
+    return f"{contact['first_name']} {contact['last_name'].upper()} ({contact['id']})"
+
+
+@app.command("view")
+def view_customer(
+    customer_id: int = typer.Argument(..., help="ID du client"),
+    as_json: bool = typer.Option(False, "--json", help="Affiche la vue au format JSON"),
 ):
-    """Lists all customers."""
-    customers = Customer.select().join(Company, on=(Customer.company_id == Company.id))
+    """Shows a customer with its company, sales contact, contracts and their events as a tree."""
+    import json
+    from rich.tree import Tree
+    from epicevents.models.serializer import customer_tree
+
+    data = customer_tree(customer_id)
+    if data is None:
+        console.print(format_text('bold', 'red', f"❌ Erreur : Le client ID {customer_id} n'existe pas."))
+        raise typer.Exit()
+
+    if as_json:
+        console.out(json.dumps(data, ensure_ascii=False), highlight=False)
+        return
+
+    customer = data["customer"]
+    company = data["company"]
+    tree = Tree(
+        f"[bold blue]{customer['first_name']} {customer['last_name'].upper()} ({customer['id']})[/] "
+        f"- {customer['email']} - {customer['phone']}"
+    )
+    tree.add(f"Entreprise : {company['name'] if company else 'Aucune'}")
+    tree.add(f"Commercial : {tree_contact(data['sales_contact'])}")
+
+    contracts = tree.add(f"[bold]Contrats ({len(data['contracts'])})[/]")
+    for contract in data["contracts"]:
+        due = contract["amount_due"] or 0.0
+        branch = contracts.add(
+            f"Contrat {contract['id']} - {'✅ signé' if contract['signed'] else '❌ non signé'} - "
+            f"{contract['amount_total']:.2f} {CURRENCY} (dû : {due:.2f} {CURRENCY}) - "
+            f"Gestionnaire : {tree_contact(contract['manager'])}"
+        )
+        for event in contract["events"]:
+            branch.add(
+                f"{event['event_date'][:16].replace('T', ' ')} - {event['name']} ({event['id']}) - "
+                f"{event['location']} - {event['attendees']} participants - "
+                f"Support : {tree_contact(event['support'])}"
+            )
+
+    console.print(tree, highlight=False)
+
+
+def list_query(user: User, filter_on: bool) -> tuple:
+    """Returns the query of 'customer list' for the user, with its title and empty message."""
+    # Company and sales contact are joined, so the rows are built without a query per customer
+    customers = Customer.select_detailed()
     nobody_message = "❌ Aucun client n'est enregistré dans la bdd."
     title_str = "Liste des clients"
 
     if filter_on:
-        user = ctx.obj
         if user.role.name == "sales":
             customers = customers.where(Customer.team_contact_id == user.id)
             nobody_message = "❌ Aucun client ne vous est attribué."
@@ -142,6 +241,17 @@ def list_customers(
             nobody_message = "❌ Aucun client avec agent n'est enregistré dans la bdd."
             title_str = title_str + " (Avec agents attribués)"
 
+    return customers, title_str, nobody_message
+
+
+@app.command("list")
+def list_customers(
+    ctx: typer.Context,
+    filter_on: bool = typer.Option(False, "--fi", help="Filtre automatiquement les clients selon votre rôle")
+):
+    """Lists all customers."""
+    customers, title_str, nobody_message = list_query(ctx.obj, filter_on)
+
     if not customers.exists():
         console.print(format_text('bold', 'red', f"{nobody_message}"))
         return
@@ -228,6 +338,35 @@ def update_customer(
         raise typer.Exit(1)
 
 
+@app.command("reassign")
+def reassign_customers(
+    from_id: int = typer.Option(..., "--from", help="ID du commercial actuel"),
+    to_id: int = typer.Option(..., "--to", help="ID du nouveau commercial"),
+    company: str = typer.Option(None, "-c", help="Limiter aux clients de cette entreprise"),
+):
+    """Reassigns all customers of a sales user to another one."""
+
+    try:
+        new_contact = User.get_by_id(to_id)
+    except DoesNotExist:
+        console.print(format_text('bold', 'red', f"❌ Erreur : L'utilisateur ID {to_id} n'existe pas."))
+        raise typer.Exit()
+
+    conditions = []
+    if company:
+        conditions.append(Customer.company.in_(Company.select(Company.id).where(Company.name == company)))
+
+    try:
+        count = Customer.reassign(from_id, new_contact, *conditions)
+    except ValueError as e:
+        console.print(format_text('bold', 'red', f"{str(e)}"))
+        raise typer.Exit(1)
+
+    console.print(
+        format_text('bold', 'green', f"✅ {count} client(s) réattribué(s) de l'utilisateur {from_id} à {to_id}.")
+    )
+
+
 @app.command("delete")
 def delete_customer(
     customer_id: int = typer.Argument(..., help="ID du client à supprimer")
@@ -0,0 +1,83 @@
+import typer
+from datetime import datetime
+from dotenv import get_key
+from rich.console import Console
+from epicevents.cli.utils import display_list, format_text
+from epicevents.config import DASHBOARD_MAX_AGE
+
+
+app = typer.Typer(help="Tableau de bord")
+console = Console()
+CURRENCY = get_key(".env", "CURRENCY")
+
+STATUS_LABELS = {"unsigned": "Non signés", "due": "À encaisser", "paid": "Soldés"}
+UNASSIGNED_LABELS = {
+    "event": "Événements à venir sans support",
+    "contract": "Contrats sans gestionnaire",
+    "customer": "Clients sans commercial",
+}
+
+
+def staleness(refreshed_at: datetime) -> str:
+    """Formats the age of the dashboard data, flagged when older than DASHBOARD_MAX_AGE minutes."""
+    minutes = int((datetime.now() - refreshed_at).total_seconds() // 60)
+    text = f"Données du {refreshed_at:%d/%m/%y %H:%M} (il y a {minutes} min)"
+    if minutes > DASHBOARD_MAX_AGE:
+        return format_text('bold', 'yellow', f"⚠ {text}, périmées : relancez avec --refresh")
+    return format_text('bold', 'blue', f"🕒 {text}")
+
+
+@app.command("dashboard")
+def show_dashboard(
+    ctx: typer.Context,
+    refresh: bool = typer.Option(False, "--refresh", help="Recalcule les vues avant l'affichage"),
+    months: int = typer.Option(12, "--months", help="Nombre de mois de chiffre d'affaires"),
+    weeks: int = typer.Option(8, "--weeks", help="Nombre de semaines d'événements à venir"),
+):
+    """Shows the contract pipeline, monthly revenue, upcoming weeks and unassigned counts from the dashboard views."""
+    from epicevents.models.database import BaseModel
+    from epicevents.permissions.auth import authorize
+    from epicevents.utils.dashboard import ensure_dashboard_views, last_refresh, load_dashboard, refresh_dashboard
+
+    authorize(ctx, "dashboard", "dashboard")
+
+    database = BaseModel._meta.database
+    # The views come with create_db and db upgrade: only a database not upgraded yet lacks them
+    ensure_dashboard_views(database)
+    if refresh:
+        refresh_dashboard(database)
+
+    dashboard = load_dashboard(database, months, weeks)
+    console.print(staleness(last_refresh(database)))
+
+    display_list("Pipeline des contrats", [
+        {
+            "STATUT": STATUS_LABELS[row["status"]],
+            "CONTRATS": row["contracts"],
+            "TOTAL": f"{row['total']:.2f} {CURRENCY}",
+            "DÛ": f"{row['due']:.2f} {CURRENCY}",
+        }
+        for row in dashboard["pipeline"]
+    ])
+    display_list("Chiffre d'affaires par mois", [
+        {
+            "MOIS": row["month"],
+            "CONTRATS": row["contracts"],
+            "FACTURÉ": f"{row['billed']:.2f} {CURRENCY}",
+            "DÛ": f"{row['due']:.2f} {CURRENCY}",
+        }
+        for row in dashboard["revenue"]
+    ])
+    display_list("Événements par semaine", [
+        {
+            "SEMAINE DU": row["week"],
+            "ÉVÉNEMENTS": row["events"],
+            "INVITÉS": row["attendees"],
+            "SANS SUPPORT": row["unassigned"],
+        }
+        for row in dashboard["weeks"]
+    ])
+    display_list("À attribuer", [
+        {"ÉLÉMENT": UNASSIGNED_LABELS[row["kind"]], "NOMBRE": row["total"]}
+        for row in dashboard["unassigned"]
+    ])
@@ -0,0 +1,44 @@
+import typer
+from rich.console import Console
+from epicevents.cli.utils import format_text
+
+app = typer.Typer(help="Maintenance de la base de données (admin)")
+console = Console()
+
+
+@app.command("upgrade")
+def upgrade_database():
+    """Creates the tables, indexes and columns added since the database was created."""
+    from epicevents.models.database import BaseModel
+    from epicevents.utils.create_db import MODELS
+    from epicevents.utils.dashboard import ensure_dashboard_views
+    from epicevents.utils.rollups import ensure_rollup_columns
+    from epicevents.utils.search import ensure_search_index
+
+    database = BaseModel._meta.database
+    # Existing tables are kept, their missing indexes are created
+    database.create_tables(MODELS, safe=True)
+    added = ensure_rollup_columns(database)
+    if added:
+        console.print(format_text('bold', 'blue', f"Colonnes ajoutées : {', '.join(added)}"))
+    ensure_search_index(database)
+    ensure_dashboard_views(database)
+    console.print(format_text('bold', 'green', "✅ Base de données à jour."))
+
+
+@app.command("rebuild-rollups")
+def rebuild_rollups():
+    """Recomputes the customer and contract rollup columns from scratch, adding them if missing."""
+    from epicevents.models.database import BaseModel
+    from epicevents.utils import rollups
+
+    database = BaseModel._meta.database
+    added = rollups.ensure_rollup_columns(database)
+    if added:
+        console.print(format_text('bold', 'blue', f"Colonnes ajoutées : {', '.join(added)}"))
+
+    corrected = rollups.rebuild_rollups(database)
+    console.print(format_text(
+        'bold', 'green',
+        f"✅ Agrégats recalculés : {corrected['customers']} client(s) et {corrected['contracts']} contrat(s) corrigé(s)."
+    ))
@@ -1,4 +1,5 @@
 import typer
+from typing import List
 from rich.console import Console
 from datetime import datetime
 from epicevents.permissions.auth import verify_token
@@ -140,6 +141,102 @@ def list_commands(ctx: typer.Context):
         filtered_command_groups = role_commands_filter(user_role, command_groups)
         print_command_list(user_role, filtered_command_groups)
 
+
+@app.command("metrics")
+def debug_metrics(
+    hours: float = typer.Option(None, "--since", help="Ne garde que les dernières heures"),
+):
+    """Summarises command latency (p50/p95/p99), errors and auth counters from the metrics log."""
+    import time
+    from epicevents.utils.metrics import metrics, read_log, summarize
+
+    records = read_log(metrics.log_path)
+    if hours is not None:
+        records = [record for record in records if record["ts"] >= time.time() - hours * 3600]
+
+    if not records:
+        console.print(format_text('bold', 'red', "❌ Aucune mesure enregistrée."))
+        return
+
+    rows, counters = summarize(records)
+    display_list(f"Métriques des commandes en ms ({len(records)} appels)", rows)
+    if counters:
+        display_list(
+            "Compteurs",
+            [{"Compteur": name, "Total": value} for name, value in sorted(counters.items())]
+        )
+
+
+@app.command("explain")
+def debug_explain(
+    ctx: typer.Context,
+    resource: str = typer.Argument(..., help="customer, contract ou event"),
+    action: str = typer.Argument(..., help="list ou read"),
+    target_ids: List[str] = typer.Argument(None, help="ID(s) ou plages d'IDs pour read"),
+    filter_on: bool = typer.Option(False, "--fi", help="Requête filtrée selon votre rôle (list --fi)"),
+):
+    """Prints the EXPLAIN plan of the query a list/read command would run, and flags sequential scans."""
+    from epicevents.cli import customers, contracts, events
+    from epicevents.cli.utils import parse_ids
+    from epicevents.models.database import BaseModel
+    from epicevents.utils.explain import explain, sequential_scans, suggest_index
+
+    modules = {"customer": customers, "contract": contracts, "event": events}
+    if resource not in modules or action not in ["list", "read"]:
+        console.print(format_text(
+            'bold', 'red', "❌ Erreur : Ressource (customer, contract, event) ou action (list, read) invalide."
+        ))
+        raise typer.Exit(1)
+
+    if action == "list":
+        query, _, _ = modules[resource].list_query(ctx.obj, filter_on)
+    else:
+        try:
+            query = modules[resource].read_query(*parse_ids(target_ids or []))
+        except ValueError as e:
+            console.print(format_text('bold', 'red', f"{str(e)}"))
+            raise typer.Exit(1)
+
+    database = BaseModel._meta.database
+    sql, params = query.sql()
+    plan = explain(query, database)
+
+    console.print(format_text('bold', 'blue', f"{resource} {action}{' --fi' if filter_on else ''}"))
+    console.out(f"{sql} {params}", highlight=False)
+    console.print(format_text('bold', 'purple', "Plan d'exécution"))
+    for line in plan:
+        console.out(line, highlight=False)
+
+    scans = sequential_scans(plan, sql)
+    if not scans:
+        console.print(format_text('bold', 'green', "✅ Aucun parcours séquentiel sur event, contract ou customer."))
+        return
+
+    display_list(
+        "Parcours séquentiels",
+        [{"Table": table, "Correctif": suggest_index(table, sql, database)} for table in scans]
+    )
+
+
+@app.command("doctor")
+def debug_doctor():
+    """Checks the database for performance problems and prints prioritised recommendations."""
+    from epicevents.models.database import BaseModel
+    from epicevents.utils.doctor import PRIORITIES, diagnose, source_for
+
+    measures, findings = diagnose(source_for(BaseModel._meta.database))
+    display_list("Santé de la base de données", measures)
+
+    if not findings:
+        console.print(format_text('bold', 'green', "✅ Aucun problème détecté."))
+        return
+
+    console.print(format_text('bold', 'purple', "Recommandations"))
+    for number, (priority, finding, fix) in enumerate(findings, start=1):
+        console.print(f"{number}. [{PRIORITIES[priority]}] {finding}", markup=False, highlight=False)
+        console.out(f"   {fix}", highlight=False)
+
+
 @app.command("sentry")
 def sentry_error():
     """Simple error test sent to sentry."""
@@ -3,11 +3,17 @@ from datetime import datetime
 from rich.console import Console
 from rich.prompt import Confirm
 from peewee import DoesNotExist
-from typing import Optional
+from typing import List, Optional
 from epicevents.models.event import Event
 from epicevents.models.user import User
+from epicevents.models.serializer import batch_get_data
+from epicevents.permissions.perm import filter_permitted
 from epicevents.cli.utils import display_list
+from epicevents.cli.utils import display_jsonl
+from epicevents.cli.utils import format_contact
 from epicevents.cli.utils import format_text
+from epicevents.cli.utils import ids_condition
+from epicevents.cli.utils import parse_ids
 
 
 app = typer.Typer(help="Gestion des événements")
@@ -44,77 +50,110 @@ def create_event(
         raise typer.Exit(1)
 
 
+def display_event(event: Event):
+    """Displays the details of a single event."""
+
+    # Access contract
+    contract = event.contract
+    contract_id = contract.id if contract else "Aucun"
+
+    # Access contract contact
+    contract_contact = "Aucun"
+    if contract and contract.team_contact_id:
+        contract_contact = format_contact(contract.team_contact_id)
+
+    # Access customer through contract
+    customer_id = "Aucun"
+    customer_contact = "Aucun"
+    if contract and contract.customer:
+        customer = contract.customer
+        customer_id = customer.id
+
+        # Access customer contact
+        if customer.team_contact_id:
+            customer_contact = format_contact(customer.team_contact_id)
+
+    event_data = [
+        {"Champ": "ID", "Valeur": event.id},
+        {"Champ": "Date", "Valeur": event.event_date},
+        {"Champ": "Nom", "Valeur": event.name},
+        {"Champ": "Localisation", "Valeur": event.location},
+        {"Champ": "Participants", "Valeur": event.attendees},
+        {"Champ": "Notes", "Valeur": event.notes},
+        {"Champ": "Contact Epic", "Valeur": format_contact(event.team_contact_id)},
+        {"Champ": "Contrat ID", "Valeur": f" {contract_id}"},
+        {"Champ": "Contact du contrat", "Valeur": f" {contract_contact}"},
+        {"Champ": "Customer ID", "Valeur": f" {customer_id}"},
+        {"Champ": "Contact du client", "Valeur": f" {customer_contact}"},
+    ]
+    display_list(f"Événement {event.id} : {event.name}", event_data)
+
+
+def read_query(ids: list, ranges: list):
+    """Returns the query of 'event read': events, contracts, customers and every contact in a single query."""
+    return Event.select_detailed().where(ids_condition(Event.id, ids, ranges)).order_by(Event.id)
+
+
 @app.command("read")
-def read_event(event_id: int = typer.Argument(..., help="ID de l'événement à afficher")):
-    """Shows a specific event."""
+def read_event(
+    ctx: typer.Context,
+    event_ids: List[str] = typer.Argument(..., help="ID(s) ou plages d'IDs des événements (ex: 12 15 20-40)"),
+    jsonl: bool = typer.Option(False, "--jsonl", help="Affiche les événements au format JSONL"),
+):
+    """Shows one or several events."""
 
     try:
-        event = Event.get_by_id(event_id)
+        ids, ranges = parse_ids(event_ids)
+    except ValueError as e:
+        console.print(format_text('bold', 'red', f"{str(e)}"))
+        raise typer.Exit(1)
+
+    events = list(read_query(ids, ranges))
+    events, denied = filter_permitted(ctx.obj, "event", "read", events)
+
+    found_ids = {event.id for event in events} | {event.id for event in denied}
+    missing_ids = [str(event_id) for event_id in ids if event_id not in found_ids]
+
+    if denied:
+        denied_ids = ", ".join(str(event.id) for event in denied)
+        console.print(format_text('bold', 'red', f"❌ Accès refusé aux événements : {denied_ids}"))
+
+    if not events:
+        if not denied:
+            console.print(format_text('bold', 'red', f"❌ L'événement {' '.join(event_ids)} n'existe pas."))
+        raise typer.Exit()
+
+    if missing_ids:
+        console.print(format_text('bold', 'yellow', f"⚠  Événement(s) introuvable(s) : {', '.join(missing_ids)}"))
 
-        # Access contract
-        contract = event.contract
-        contract_id = contract.id if contract else "Aucun"
-
-        # Access contract contact
-        contract_contact = "Aucun"
-        if contract and contract.team_contact_id:
-            user = contract.team_contact_id
-            contract_contact = f"{user.first_name} {user.last_name.upper()} ({user.id})"
-
-        # Access customer through contract
-        customer_id = "Aucun"
-        customer_contact = "Aucun"
-        if contract and contract.customer:
-            customer = contract.customer
-            customer_id = customer.id
-
-            # Access customer contact
-            if customer.team_contact_id:
-                user = customer.team_contact_id
-                customer_contact = f"{user.first_name} {user.last_name.upper()} ({user.id})"
-
-        event_data = [
-            {"Champ": "ID", "Valeur": event.id},
-            {"Champ": "Date", "Valeur": event.event_date},
-            {"Champ": "Nom", "Valeur": event.name},
-            {"Champ": "Localisation", "Valeur": event.location},
-            {"Champ": "Participants", "Valeur": event.attendees},
-            {"Champ": "Notes", "Valeur": event.notes},
+    if jsonl:
+        display_jsonl(batch_get_data(events))
+    elif len(events) == 1 and not ranges:
+        display_event(events[0])
+    else:
+        events_list = [
             {
-                "Champ": "Contact Epic",
-                "Valeur": (
-                    f"{event.team_contact_id.first_name} {event.team_contact_id.last_name.upper()} "
-                    f"({event.team_contact_id.id})"
-                    if isinstance(event.team_contact_id, User)
-                    else f"ID: {event.team_contact_id}"
-                    if event.team_contact_id
-                    else "Aucun"
-                )
-            },
-            {"Champ": "Contrat ID", "Valeur": f" {contract_id}"},
-            {"Champ": "Contact du contrat", "Valeur": f" {contract_contact}"},
-            {"Champ": "Customer ID", "Valeur": f" {customer_id}"},
-            {"Champ": "Contact du client", "Valeur": f" {customer_contact}"},
+                "ID": event.id,
+                "Date": f"{event.event_date:%Y-%m-%d %H:%M}",
+                "Nom": event.name,
+                "Participants": event.attendees,
+                "Contact Epic": format_contact(event.team_contact_id),
+                "Contrat ID": event.contract.id if event.contract else "Aucun",
+            }
+            for event in events
         ]
-        display_list(f"Événement {event.id} : {event.name}", event_data)
-    except DoesNotExist:
-        console.print(format_text('bold', 'red', f"❌ L'événement {event_id} n'existe pas."))
-        raise typer.Exit()
+        display_list(f"Événements ({len(events_list)})", events_list)
 
 
-@app.command("list")
-def list_events(
-    ctx: typer.Context,
-    filter_on: bool = typer.Option(False, "--fi", help="Filtre automatiquement les événement selon votre rôle")
-):
-    """List all events."""
-    events = Event.select()
+def list_query(user: User, filter_on: bool) -> tuple:
+    """Returns the query of 'event list' for the user, with its title and empty message."""
+    # Contacts are joined, so team_contact_id checks do not query each event's user
+    events = Event.select_detailed()
     current_date = datetime.now()
     nothing_message = "❌ Aucun événement n'est enregistré dans la bdd."
     title_str = "Liste des événements"
 
     if filter_on:
-        user = ctx.obj
         if user.role.name == "sales":
             events = events.where(Event.event_date > current_date)
             nothing_message = "❌ Aucun événement futur n'est enregistré dans la bdd."
@@ -128,6 +167,18 @@ def list_events(
             nothing_message = "❌ Aucun événement ne vous est attribué."
             title_str = title_str + " (Attribués)"
 
+    return events, title_str, nothing_message
+
+
+@app.command("list")
+def list_events(
+    ctx: typer.Context,
+    filter_on: bool = typer.Option(False, "--fi", help="Filtre automatiquement les événement selon votre rôle")
+):
+    """List all events."""
+    events, title_str, nothing_message = list_query(ctx.obj, filter_on)
+    current_date = datetime.now()
+
     if not events.count():
         console.print(format_text('bold', 'red', f"{nothing_message}"))
         return
@@ -174,6 +225,213 @@ def list_events(
     display_list(title_str, event_list, use_context=True)
 
 
+@app.command("workload")
+def events_workload():
+    """Shows each support user's upcoming load and the unassigned events to staff, soonest first."""
+    now = datetime.now()
+
+    workload_list = [
+        {
+            "Support": f"{row['first_name']} {row['last_name'].upper()} ({row['id']})",
+            "À venir": row["upcoming"],
+            "Participants": row["attendees"],
+            "7 jours": row["next_7_days"],
+            "30 jours": row["next_30_days"],
+        }
+        for row in Event.workload(now)
+    ]
+    if workload_list:
+        display_list("Charge des supports", workload_list)
+    else:
+        console.print(format_text('bold', 'red', "❌ Aucun utilisateur support dans la bdd."))
+
+    unassigned_list = [
+        {
+            "ID": event.id,
+            "Date": f"{event.event_date:%Y-%m-%d %H:%M}",
+            "Nom": event.name,
+            "Participants": event.attendees,
+        }
+        for event in Event.unassigned(now)
+    ]
+    if unassigned_list:
+        display_list(f"Événements à venir sans support ({len(unassigned_list)})", unassigned_list)
+    else:
+        console.print(format_text('bold', 'green', "✅ Tous les événements à venir ont un support."))
+
+
+@app.command("auto-assign")
+def auto_assign_events(
+    window: str = typer.Option("30d", "--window", help="Horizon en jours (ex: 30d)"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Affiche le plan sans l'appliquer"),
+):
+    """Assigns the unassigned upcoming events to support users, balancing attendees and avoiding overlapping events."""
+    from datetime import timedelta
+    from epicevents.models.event import EVENT_DURATION
+    from epicevents.models.role import Role
+    from epicevents.utils.planner import plan_assignments
+
+    try:
+        days = int(window.lower().removesuffix("d"))
+    except ValueError:
+        console.print(format_text('bold', 'red', "❌ Erreur : Horizon invalide (ex: 30d)."))
+        raise typer.Exit(1)
+
+    now = datetime.now()
+    end = now + timedelta(days=days)
+    events = list(Event.unassigned(now).where(Event.event_date < end))
+    if not events:
+        console.print(format_text('bold', 'green', f"✅ Aucun événement sans support dans les {days} jours."))
+        return
+
+    supports = {
+        user.id: user
+        for user in User.select(User.id, User.first_name, User.last_name).join(Role).where(Role.name == "support")
+    }
+    if not supports:
+        console.print(format_text('bold', 'red', "❌ Aucun utilisateur support dans la bdd."))
+        raise typer.Exit(1)
+
+    # Existing schedules over the same window, and the events overlapping its bounds
+    schedules = {support_id: [] for support_id in supports}
+    scheduled = (
+        Event.select(Event.team_contact_id, Event.event_date, Event.attendees)
+        .where(
+            Event.team_contact_id.in_(list(supports)),
+            Event.event_date > now - EVENT_DURATION,
+            Event.event_date < end + EVENT_DURATION,
+        )
+        .tuples()
+    )
+    for support_id, event_date, attendees in scheduled:
+        schedules[support_id].append((event_date, attendees))
+
+    assignments, conflicts = plan_assignments(
+        [(event.id, event.event_date, event.attendees) for event in events], schedules, EVENT_DURATION
+    )
+
+    plan_list = [
+        {
+            "ID": event.id,
+            "Date": f"{event.event_date:%Y-%m-%d %H:%M}",
+            "Nom": event.name,
+            "Participants": event.attendees,
+            "Support": format_contact(supports[assignments[event.id]]) if event.id in assignments else "Aucun",
+        }
+        for event in events
+    ]
+    display_list(f"Plan d'attribution ({len(assignments)}/{len(events)})", plan_list)
+
+    if conflicts:
+        console.print(
+            format_text(
+                'bold', 'yellow',
+                "⚠  Aucun support libre à l'heure des événements : "
+                f"{', '.join(str(event_id) for event_id in conflicts)}"
+            )
+        )
+
+    if dry_run:
+        console.print(format_text('bold', 'blue', "Simulation : aucune modification enregistrée."))
+        return
+
+    try:
+        count = Event.assign_bulk(assignments)
+    except ValueError as e:
+        console.print(format_text('bold', 'red', f"{str(e)}"))
+        raise typer.Exit(1)
+    console.print(format_text('bold', 'green', f"✅ {count} événement(s) attribué(s)."))
+
+
+@app.command("conflicts")
+def events_conflicts():
+    """Reports every pair of overlapping events assigned to the same support user."""
+    pairs = Event.conflicts()
+    if not pairs:
+        console.print(format_text('bold', 'green', "✅ Aucun conflit de planning."))
+        return
+
+    # Names and dates of the events involved, in one query
+    event_ids = {event_id for _, first, second in pairs for event_id in (first, second)}
+    events = {
+        event.id: event
+        for event in Event.select(Event.id, Event.name, Event.event_date).where(Event.id.in_(list(event_ids)))
+    }
+
+    conflicts_list = [
+        {
+            "Support": support_id,
+            "Événement 1": f"{events[first].name} ({first})",
+            "Événement 2": f"{events[second].name} ({second})",
+            "Date": f"{events[second].event_date:%Y-%m-%d %H:%M}",
+        }
+        for support_id, first, second in pairs
+    ]
+    display_list(f"Conflits de planning ({len(pairs)})", conflicts_list)
+
+
+WEEKDAYS = ["lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi", "dimanche"]
+
+
+def calendar_group(event_date: datetime, by: str) -> str:
+    """Returns the day or ISO week heading of an event date."""
+    if by == "week":
+        year, week, _ = event_date.isocalendar()
+        return f"Semaine {week} ({year})"
+    return f"{WEEKDAYS[event_date.weekday()].capitalize()} {event_date:%Y-%m-%d}"
+
+
+@app.command("calendar")
+def events_calendar(
+    date_from: str = typer.Option(None, "--from", help="Premier jour (YYYY-MM-DD), aujourd'hui par défaut"),
+    date_to: str = typer.Option(None, "--to", help="Dernier jour inclus (YYYY-MM-DD), 7 jours par défaut"),
+    contact_id: int = typer.Option(None, "--user", help="ID du support"),
+    by: str = typer.Option("day", "--by", help="Regroupement : day ou week"),
+):
+    """Shows the events of a date range grouped by day or week."""
+    from datetime import timedelta
+    from itertools import groupby
+
+    if by not in ["day", "week"]:
+        console.print(format_text('bold', 'red', "❌ Erreur : Regroupement invalide (day, week)."))
+        raise typer.Exit(1)
+
+    try:
+        start = datetime.strptime(date_from, "%Y-%m-%d") if date_from else datetime.now().replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        end = datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=1) if date_to else start + timedelta(days=7)
+    except ValueError:
+        console.print(format_text('bold', 'red', "❌ Erreur : Date invalide (YYYY-MM-DD)."))
+        raise typer.Exit(1)
+
+    # Rows are streamed in date order and printed group by group
+    events = Event.calendar(start, end, contact_id).iterator()
+    found = False
+    for heading, group in groupby(events, key=lambda event: calendar_group(event.event_date, by)):
+        found = True
+        day_list = [
+            {
+                "Date": (
+                    f"{event.event_date:%H:%M}" if by == "day"
+                    else f"{WEEKDAYS[event.event_date.weekday()][:3]} {event.event_date:%d %H:%M}"
+                ),
+                "ID": event.id,
+                "Nom": event.name,
+                "Lieu": event.location,
+                "Participants": event.attendees,
+                "Support": format_contact(event.team_contact_id),
+            }
+            for event in group
+        ]
+        display_list(f"{heading} ({len(day_list)})", day_list)
+
+    if not found:
+        console.print(
+            format_text('bold', 'red', f"❌ Aucun événement du {start:%Y-%m-%d} au {end - timedelta(days=1):%Y-%m-%d}.")
+        )
+
+
 @app.command("update")
 def update_event(
     ctx: typer.Context,
@@ -233,6 +491,38 @@ def update_event(
         raise typer.Exit(1)
 
 
+@app.command("reassign")
+def reassign_events(
+    from_id: int = typer.Option(..., "--from", help="ID du support actuel"),
+    to_id: int = typer.Option(..., "--to", help="ID du nouveau support"),
+    contract_id: int = typer.Option(None, "-ct", help="Limiter aux événements de ce contrat"),
+    future_only: bool = typer.Option(False, "--future", help="Limiter aux événements futurs"),
+):
+    """Reassigns all events of a support user to another one."""
+
+    try:
+        new_contact = User.get_by_id(to_id)
+    except DoesNotExist:
+        console.print(format_text('bold', 'red', f"❌ Erreur : L'utilisateur ID {to_id} n'existe pas."))
+        raise typer.Exit()
+
+    conditions = []
+    if contract_id:
+        conditions.append(Event.contract == contract_id)
+    if future_only:
+        conditions.append(Event.event_date > datetime.now())
+
+    try:
+        count = Event.reassign(from_id, new_contact, *conditions)
+    except ValueError as e:
+        console.print(format_text('bold', 'red', f"{str(e)}"))
+        raise typer.Exit(1)
+
+    console.print(
+        format_text('bold', 'green', f"✅ {count} événement(s) réattribué(s) de l'utilisateur {from_id} à {to_id}.")
+    )
+
+
 @app.command("delete")
 def delete_event(
     event_id: int = typer.Argument(..., help="N° de l'événement à supprimer")
@@ -0,0 +1,73 @@
+import typer
+from rich.console import Console
+from epicevents.cli.utils import display_jsonl, display_list, format_text
+
+app = typer.Typer(help="Export des données")
+console = Console()
+
+KIND_LABELS = {"customer": "Client", "contract": "Contrat", "event": "Événement"}
+OP_LABELS = {"upsert": "Créé/modifié", "delete": "Supprimé"}
+
+
+@app.command("changes")
+def export_changes(
+    since: str = typer.Option(
+        ..., "--since", help="Date (YYYY-MM-DD ou YYYY-MM-DD_HH:MM) ou nom d'un point de reprise"
+    ),
+    checkpoint: str = typer.Option(
+        None, "--checkpoint", help="Enregistre la position sous ce nom, le crée si besoin (défaut : celui de --since)"
+    ),
+    output: str = typer.Option("json", "--format", help="Format de sortie : json (une ligne par changement) ou rich"),
+    page_size: int = typer.Option(500, "--page-size", help="Lignes lues par requête"),
+):
+    """Exports the customers, contracts and events changed or deleted since a date or a saved checkpoint."""
+    from epicevents.utils import changes
+
+    if output not in ["json", "rich"]:
+        console.print(format_text('bold', 'red', "❌ Erreur : Format invalide (json, rich)."))
+        raise typer.Exit(1)
+
+    try:
+        since_date = changes.parse_since(since)
+    except ValueError as e:
+        console.print(format_text('bold', 'red', f"{str(e)}"))
+        raise typer.Exit(1)
+
+    if since_date:
+        positions = changes.positions_since(since_date)
+    else:
+        # A mistyped name would silently export everything: only --checkpoint creates one
+        if not checkpoint and not changes.checkpoint_exists(since):
+            console.print(format_text(
+                'bold', 'red', f"❌ Erreur : Point de reprise '{since}' inconnu (--checkpoint {since} pour le créer)."
+            ))
+            raise typer.Exit(1)
+        positions = changes.load_checkpoint(since)
+        checkpoint = checkpoint or since
+
+    exported = changes.export_changes(positions, page_size=page_size)
+    if output == "json":
+        # Streamed page by page
+        display_jsonl(exported)
+    else:
+        exported = [
+            {
+                "TYPE": KIND_LABELS[change["kind"]],
+                "OPÉRATION": OP_LABELS[change["op"]],
+                "ID": change["id"],
+                "DATE": f"{change['date']:%Y-%m-%d %H:%M:%S}",
+            }
+            for change in exported
+        ]
+
+    # Saved once every change was written, so an interrupted export is replayed
+    if checkpoint:
+        changes.save_checkpoint(checkpoint, positions)
+
+    if output == "rich":
+        if exported:
+            display_list(f"Changements depuis {since} ({len(exported)})", exported)
+        else:
+            console.print(format_text('bold', 'green', f"✅ Aucun changement depuis {since}."))
+        if checkpoint:
+            console.print(format_text('bold', 'blue', f"Point de reprise '{checkpoint}' enregistré."))
@@ -0,0 +1,41 @@
+import typer
+from typing import List
+from rich.console import Console
+from epicevents.cli.utils import display_list, format_text
+
+
+app = typer.Typer(help="Recherche globale")
+console = Console()
+
+KIND_LABELS = {"customer": "Client", "company": "Entreprise", "event": "Événement"}
+
+
+@app.command("search")
+def search_all(
+    ctx: typer.Context,
+    words: List[str] = typer.Argument(..., help="Texte recherché (ex: Dupont Lyon)"),
+    limit: int = typer.Option(20, "-n", help="Nombre maximum de résultats"),
+):
+    """Searches customers, companies and events at once, best matches first."""
+    from epicevents.models.database import BaseModel
+    from epicevents.permissions.auth import authorize
+    from epicevents.utils.search import search
+
+    authorize(ctx, "search", "search")
+
+    text = " ".join(words)
+    results = search(text, BaseModel._meta.database, limit)
+    if not results:
+        console.print(format_text('bold', 'red', f"❌ Aucun résultat pour '{text}'."))
+        return
+
+    results_list = [
+        {
+            "Type": KIND_LABELS[result["kind"]],
+            "ID": result["id"],
+            "Nom": result["title"],
+            "Détail": result["detail"],
+        }
+        for result in results
+    ]
+    display_list(f"Résultats pour '{text}' ({len(results_list)})", results_list)
@@ -1,4 +1,5 @@
 import typer
+import sentry_sdk
 from rich.console import Console
 from rich.prompt import Confirm
 from peewee import DoesNotExist
@@ -84,9 +85,12 @@ def create_user(
         )
         raise typer.Exit()
 
+    with sentry_sdk.start_span(op="auth.argon2", name="hash"):
+        hashed_password = ph.hash(password)
+
     user = User(
         username=username,
-        password=ph.hash(password),
+        password=hashed_password,
         email=email,
         first_name=first_name,
         last_name=last_name,
@@ -113,7 +117,7 @@ def read_user(ctx: typer.Context, uid: int = typer.Argument(None, help="ID de l'
     if uid is not None:
         ctx.obj = {"target_id": uid}
         try:
-            user = User.get_by_id(uid)
+            user = User.select_detailed().where(User.id == uid).get()
             user_data = [
                 {"Champ": "ID", "Valeur": user.id},
                 {"Champ": "Nom d'utilisateur", "Valeur": user.username},
@@ -148,10 +152,10 @@ def list_users(
 
     if filter_on:
         user = ctx.obj
-        users = User.select().join(Role).where(Role.name == user.role.name)
+        users = User.select_detailed().where(Role.name == user.role.name)
         title_str = title_str + f" ({user.role.name})"
     else:
-        users = User.select()
+        users = User.select_detailed()
 
     if not users.exists():
         console.print(format_text('bold', 'red', f"{nobody_message}"))
@@ -204,7 +208,8 @@ def update_user(
     if email:
         updates["email"] = email
     if password:
-        updates["password"] = ph.hash(password)
+        with sentry_sdk.start_span(op="auth.argon2", name="hash"):
+            updates["password"] = ph.hash(password)
     if first_name:
         updates["first_name"] = first_name
     if last_name:
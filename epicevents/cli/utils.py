@@ -1,5 +1,7 @@
+import json
 import time
 import keyboard
+import sentry_sdk
 from rich.color import ANSI_COLOR_NAMES
 from rich import print
 from rich.console import Console
@@ -61,7 +63,8 @@ def display_list(title: str, items: list, use_context: bool = False):
             style = color if use_context else "white"
             table.add_row(*values, style=style)
 
-        console.print(table)
+        with sentry_sdk.start_span(op="ui.render", name=title_str):
+            console.print(table)
 
         if current_page < total_pages:
             console.print(format_text('bold', 'yellow', "Appuyez sur 'Backspace' pour continuer, 'Echap' pour quitter."))
@@ -81,6 +84,57 @@ def display_list(title: str, items: list, use_context: bool = False):
             current_page += 1
 
 
+def format_contact(user) -> str:
+    """Formats a team contact (loaded user or raw ID) for display."""
+    if hasattr(user, "first_name"):
+        return f"{user.first_name} {user.last_name.upper()} ({user.id})"
+    return f"ID: {user}" if user else "Aucun"
+
+
+def display_jsonl(items: list):
+    """Prints one JSON document per line (dates are written as strings)."""
+    with sentry_sdk.start_span(op="ui.render", name="jsonl"):
+        for item in items:
+            console.out(json.dumps(item, default=str, ensure_ascii=False), highlight=False)
+
+
+def parse_ids(values: list) -> tuple:
+    """
+    Parses IDs and ID ranges given on the command line.
+
+    Args:
+        values (list): Strings such as ['12', '15', '20-40']
+
+    Returns:
+        tuple: (ids, ranges) where ids is a list of int and ranges a list of (low, high) tuples
+    """
+    ids = []
+    ranges = []
+
+    for value in values:
+        start, separator, end = value.partition("-")
+        try:
+            if separator:
+                low, high = sorted((int(start), int(end)))
+                ranges.append((low, high))
+            else:
+                ids.append(int(value))
+        except ValueError:
+            raise ValueError(f"❌ Erreur : ID ou plage d'IDs invalide : '{value}'.")
+
+    return ids, ranges
+
+
+def ids_condition(field, ids: list, ranges: list):
+    """Builds a single WHERE clause matching IDs (IN) and ID ranges (BETWEEN)."""
+    condition = field.in_(ids) if ids else None
+    for low, high in ranges:
+        clause = field.between(low, high)
+        condition = clause if condition is None else (condition | clause)
+
+    return condition
+
+
 def format_text(style: str, color: str, text: str) -> None:
     """
     Formats text with a Rich style and color.
@@ -1,4 +1,5 @@
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
 
@@ -15,6 +16,16 @@ CURRENCY = os.getenv('CURRENCY')
 ITEMS_PER_PAGE = int(os.getenv("ITEMS_PER_PAGE", 20))
 SENTRY_DSN = os.getenv('SENTRY_DSN')
 SENTRY_ENV = os.getenv('SENTRY_ENV', "production")
+SENTRY_TRACES_SAMPLE_RATE = float(os.getenv('SENTRY_TRACES_SAMPLE_RATE', 0.0))
+STATE_DIR = Path(os.getenv('EPICEVENTS_STATE_DIR') or Path.home() / ".epicevents")
+SECURITY_EVENTS_FILE = Path(os.getenv('SECURITY_EVENTS_FILE') or STATE_DIR / "security_events.json")
+SECURITY_EVENTS_WINDOW = int(os.getenv('SECURITY_EVENTS_WINDOW', 300))
+METRICS_LOG = Path(os.getenv('METRICS_LOG') or STATE_DIR / "metrics.jsonl")
+METRICS_LOG_MAX_BYTES = int(os.getenv('METRICS_LOG_MAX_BYTES', 5_000_000))
+METRICS_PROM_FILE = os.getenv('METRICS_PROM_FILE')
+EVENT_DURATION_HOURS = float(os.getenv('EVENT_DURATION_HOURS', 4))
+DASHBOARD_MAX_AGE = int(os.getenv('DASHBOARD_MAX_AGE', 15))
+PROFILE = os.getenv('EPICEVENTS_PROFILE', "").lower() in ("1", "true", "yes")
 
 if not SECRET_KEY:
     raise ValueError("La clé secrète JWT n'est pas définie dans les variables d'environnement")
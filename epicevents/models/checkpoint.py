@@ -0,0 +1,16 @@
+from peewee import CharField, DateTimeField, IntegerField
+from epicevents.models.database import BaseModel
+
+
+class Checkpoint(BaseModel):
+    """Position of a change feed consumer in one table: the last (date_updated, id) exported."""
+
+    name = CharField(max_length=50)
+    kind = CharField(max_length=20)
+    date_updated = DateTimeField(null=True)  # Null for tombstones, positioned by id only
+    last_id = IntegerField(default=0)
+
+    class Meta:
+        indexes = (
+            (("name", "kind"), True),
+        )
@@ -2,13 +2,18 @@ from datetime import datetime
 from peewee import (
     BooleanField,
     FloatField,
+    IntegerField,
     DateTimeField,
     ForeignKeyField,
     DoesNotExist,
-    IntegrityError
+    IntegrityError,
+    JOIN,
+    fn
 )
 from epicevents.models.database import BaseModel
+from epicevents.models.company import Company
 from epicevents.models.customer import Customer
+from epicevents.models.tombstone import Tombstone
 from epicevents.models.user import User
 
 
@@ -22,7 +27,7 @@ class Contract(BaseModel):
         null=True
     )
     signed = BooleanField(default=False)
-    date_created = DateTimeField(default=datetime.now)
+    date_created = DateTimeField(default=datetime.now, index=True)
     date_updated = DateTimeField(default=datetime.now)
     amount_total = FloatField()
     amount_due = FloatField(null=True)
@@ -32,15 +37,68 @@ class Contract(BaseModel):
         on_delete="SET NULL",
         null=True
     )
+    # Rollup of the contract's events, kept up to date by Event.save/delete_instance
+    events_count = IntegerField(default=0)
+
+    class Meta:
+        # Keyset scans of the change feed
+        indexes = (
+            (("date_updated", "id"), False),
+        )
 
     def save(self, *args, **kwargs):
-        """Saves the contract's data with validation checks."""
-        self._validate_signed()
-        self._validate_amounts()
-        self._validate_date()
-        self._validate_team_contact()
+        """Saves the contract's data, validating only the changed fields, and updates the customer rollups."""
+        if self.has_changed("signed"):
+            self._validate_signed()
+        if self.has_changed("amount_total", "amount_due"):
+            self._validate_amounts()
+        if self.has_changed("date_created"):
+            self._validate_date()
+        if self.has_changed("team_contact_id"):
+            self._validate_team_contact()
         self.date_updated = datetime.now()
-        super().save(*args, **kwargs)
+
+        before = (None, 0.0) if self.is_new() else self._balance(original=True)
+        if before == self._balance():
+            super().save(*args, **kwargs)
+            return
+
+        with self._meta.database.atomic():
+            super().save(*args, **kwargs)
+            self._move_balance(before, self._balance())
+
+    def delete_instance(self, *args, **kwargs):
+        """Deletes the contract, removes it from its customer's rollups and leaves a tombstone."""
+        with self._meta.database.atomic():
+            rows = super().delete_instance(*args, **kwargs)
+            self._move_balance(self._balance(original=True), (None, 0.0))
+            Tombstone.record(self)
+        return rows
+
+    def _balance(self, original: bool = False) -> tuple:
+        """Returns (customer id, outstanding amount) as counted in the customer rollups."""
+        value = self.get_original if original else self.__data__.get
+        return value("customer"), (value("amount_due") or 0.0) if value("signed") else 0.0
+
+    @staticmethod
+    def _move_balance(before: tuple, after: tuple):
+        """
+        Applies the change of a contract's balance to its customers' rollups, as
+        relative UPDATEs. date_updated is bumped so the change feed exports them.
+        """
+        deltas = {}
+        for (customer_id, due), sign in [(before, -1), (after, 1)]:
+            if customer_id is not None:
+                count, total = deltas.get(customer_id, (0, 0.0))
+                deltas[customer_id] = (count + sign, total + sign * due)
+
+        for customer_id, (count, due) in deltas.items():
+            if count or due:
+                Customer.update(
+                    contracts_count=Customer.contracts_count + count,
+                    outstanding_total=Customer.outstanding_total + due,
+                    date_updated=datetime.now(),
+                ).where(Customer.id == customer_id).execute()
 
     def _validate_signed(self):
         if not self.signed:
@@ -68,6 +126,84 @@ class Contract(BaseModel):
         except DoesNotExist:
             self.team_contact_id = None
 
+    @classmethod
+    def reassign(cls, from_user_id: int, to_user: User, *conditions) -> int:
+        """Reassigns in one UPDATE every contract of a manager matching the conditions."""
+        # Target role is checked once, the same way a single save would
+        cls(team_contact_id=to_user)._validate_team_contact()
+
+        query = (
+            cls.update(team_contact_id=to_user, date_updated=datetime.now())
+            .where(cls.team_contact_id == from_user_id, *conditions)
+        )
+        with cls._meta.database.atomic():
+            return query.execute()
+
+    @classmethod
+    def select_detailed(cls):
+        """Returns a query loading contracts with their customer and both contacts in one round-trip."""
+        contract_contact = User.alias()
+        customer_contact = User.alias()
+        return (
+            cls.select(cls, Customer, contract_contact, customer_contact)
+            .join(Customer, JOIN.LEFT_OUTER, on=(cls.customer == Customer.id))
+            .join(customer_contact, JOIN.LEFT_OUTER, on=(Customer.team_contact_id == customer_contact.id))
+            .switch(cls)
+            .join(contract_contact, JOIN.LEFT_OUTER, on=(cls.team_contact_id == contract_contact.id))
+        )
+
+    @classmethod
+    def report(cls, by: str, date_from: datetime = None, date_to: datetime = None):
+        """
+        Returns the revenue and receivables totals grouped by sales rep, customer,
+        company or month, computed by the database in a single GROUP BY query.
+
+        Each row (a dict) holds the group columns, the signed and unsigned
+        contract counts, the billed total and the outstanding amount of the
+        signed contracts and the total of the unsigned ones.
+        """
+        signed = cls.signed == True  # noqa: E712
+        unsigned = cls.signed == False  # noqa: E712
+        totals = [
+            fn.COUNT(cls.id).filter(signed).alias("signed_count"),
+            fn.COUNT(cls.id).filter(unsigned).alias("unsigned_count"),
+            fn.COALESCE(fn.SUM(cls.amount_total).filter(signed), 0).alias("billed"),
+            fn.COALESCE(fn.SUM(cls.amount_due).filter(signed), 0).alias("outstanding"),
+            fn.COALESCE(fn.SUM(cls.amount_total).filter(unsigned), 0).alias("unsigned_total"),
+        ]
+
+        if by == "rep":
+            # The sales rep is the customer's contact, the contract's one is a manager
+            keys = [User.id, User.first_name, User.last_name]
+            query = (
+                cls.select(*keys, *totals)
+                .join(Customer, JOIN.LEFT_OUTER, on=(cls.customer == Customer.id))
+                .join(User, JOIN.LEFT_OUTER, on=(Customer.team_contact_id == User.id))
+            )
+        elif by == "customer":
+            keys = [Customer.id, Customer.first_name, Customer.last_name]
+            query = cls.select(*keys, *totals).join(Customer, JOIN.LEFT_OUTER, on=(cls.customer == Customer.id))
+        elif by == "company":
+            keys = [Company.id, Company.name]
+            query = (
+                cls.select(*keys, *totals)
+                .join(Customer, JOIN.LEFT_OUTER, on=(cls.customer == Customer.id))
+                .join(Company, JOIN.LEFT_OUTER, on=(Customer.company == Company.id))
+            )
+        elif by == "month":
+            keys = [cls.date_created.truncate("month")]
+            query = cls.select(keys[0].alias("month"), *totals)
+        else:
+            raise ValueError(f"❌ Erreur : Regroupement '{by}' invalide (rep, customer, company, month).")
+
+        if date_from:
+            query = query.where(cls.date_created >= date_from)
+        if date_to:
+            query = query.where(cls.date_created < date_to)
+
+        order = keys[0] if by == "month" else fn.SUM(cls.amount_total).desc()
+        return query.group_by(*keys).order_by(order).dicts()
+
     def get_data(self):
         """Returns a dictionary with the contract's information."""
         return {
@@ -3,11 +3,15 @@ from datetime import datetime
 from peewee import (
     CharField,
     DateTimeField,
+    FloatField,
+    IntegerField,
     ForeignKeyField,
-    DoesNotExist
+    DoesNotExist,
+    JOIN
 )
 from epicevents.models.database import BaseModel
 from epicevents.models.company import Company
+from epicevents.models.tombstone import Tombstone
 from epicevents.models.user import User
 
 
@@ -27,17 +31,39 @@ class Customer(BaseModel):
         on_delete="SET NULL",
         null=True
     )
+    # Rollups of the customer's contracts, kept up to date by Contract.save/delete_instance
+    contracts_count = IntegerField(default=0)
+    outstanding_total = FloatField(default=0.0)
+
+    class Meta:
+        # Keyset scans of the change feed
+        indexes = (
+            (("date_updated", "id"), False),
+        )
 
     def save(self, *args, **kwargs):
-        """Saves the customer's data with validation checks."""
-        self._validate_name()
-        self._validate_email()
-        self._validate_phone()
-        self._validate_date()
-        self._validate_team_contact()
+        """Saves the customer's data, validating only the changed fields."""
+        if self.has_changed("first_name", "last_name"):
+            self._validate_name()
+        if self.has_changed("email"):
+            self._validate_email()
+        if self.has_changed("phone"):
+            self._validate_phone()
+        if self.has_changed("date_created"):
+            self._validate_date()
+        if self.has_changed("team_contact_id"):
+            self._validate_team_contact()
         self.date_updated = datetime.now()
         super().save(*args, **kwargs)
 
+    def delete_instance(self, *args, **kwargs):
+        """Deletes the customer, detaches its contracts and leaves a tombstone for the change feed."""
+        with self._meta.database.atomic():
+            self.detach_dependents()
+            rows = super().delete_instance(*args, **kwargs)
+            Tombstone.record(self)
+        return rows
+
     def _validate_name(self):
         """Validates the first name and last name."""
         if not self.first_name.isalpha() or not self.last_name.isalpha():
@@ -76,6 +102,30 @@ class Customer(BaseModel):
         except DoesNotExist:
             self.team_contact_id = None
 
+    @classmethod
+    def reassign(cls, from_user_id: int, to_user: User, *conditions) -> int:
+        """Reassigns in one UPDATE every customer of a sales user matching the conditions."""
+        # Target role is checked once, the same way a single save would
+        cls(team_contact_id=to_user)._validate_team_contact()
+
+        query = (
+            cls.update(team_contact_id=to_user, date_updated=datetime.now())
+            .where(cls.team_contact_id == from_user_id, *conditions)
+        )
+        with cls._meta.database.atomic():
+            return query.execute()
+
+    @classmethod
+    def select_detailed(cls):
+        """Returns a query loading customers with their company and sales contact in one round-trip."""
+        contact = User.alias()
+        return (
+            cls.select(cls, Company, contact)
+            .join(Company, JOIN.LEFT_OUTER, on=(cls.company == Company.id))
+            .switch(cls)
+            .join(contact, JOIN.LEFT_OUTER, on=(cls.team_contact_id == contact.id))
+        )
+
     def get_data(self):
         """Returns a dictionary with the customer's information."""
         return {
@@ -1,3 +1,4 @@
+from datetime import datetime
 from peewee import (
     Model,
     PostgresqlDatabase,
@@ -11,8 +12,76 @@ psql_migrator = PostgresqlMigrator(psql_db)
 
 
 class BaseModel(Model):
-    """The base model for Peewee models using PostgreSQL."""
+    """
+    The base model for Peewee models using PostgreSQL.
+
+    Only dirty fields are written on update, and the persisted value of each
+    field is kept on its first change so validators can compare against it
+    without re-querying the row.
+    """
 
     class Meta:
         database = psql_db
         migrator = psql_migrator
+        only_save_dirty = True
+
+    def __setattr__(self, name, value):
+        """Keeps the persisted value of a field before its first change."""
+        if name in self._meta.fields:
+            data = self.__data__
+            if name in data and name not in self._dirty:
+                self.__dict__.setdefault("_original", {}).setdefault(name, data[name])
+        super().__setattr__(name, value)
+
+    def is_new(self) -> bool:
+        """Returns True if the instance has not been saved yet."""
+        return self._pk is None
+
+    def get_original(self, field_name: str):
+        """Returns the persisted value of a field (current value if unchanged)."""
+        original = self.__dict__.get("_original", {})
+        if field_name in original:
+            return original[field_name]
+        return self.__data__.get(field_name)
+
+    def has_changed(self, *field_names: str) -> bool:
+        """Checks if any of the given fields differs from its persisted value."""
+        if self.is_new():
+            return True
+
+        original = self.__dict__.get("_original", {})
+        for name in field_names:
+            if name not in self._dirty:
+                continue
+            if name not in original or original[name] != self.__data__.get(name):
+                return True
+
+        return False
+
+    def save(self, *args, **kwargs):
+        """Saves changed fields only and resets the original values."""
+        if not self.is_new():
+            # Fields set back to their persisted value are not written
+            original = self.__dict__.get("_original", {})
+            self._dirty -= {
+                name for name in original
+                if name in self._dirty and original[name] == self.__data__.get(name)
+            }
+
+        rows = super().save(*args, **kwargs)
+        self.__dict__.pop("_original", None)
+        return rows
+
+    def detach_dependents(self) -> None:
+        """
+        Sets to NULL the nullable foreign keys referencing this row, as ON
+        DELETE SET NULL would, and bumps date_updated on the referencing rows
+        so the change feed exports them again.
+        """
+        for fk, model in self._meta.backrefs.items():
+            if not fk.null:
+                continue
+            values = {fk: None}
+            if "date_updated" in model._meta.fields:
+                values[model._meta.fields["date_updated"]] = datetime.now()
+            model.update(values).where(fk == self._pk).execute()
@@ -1,15 +1,26 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from peewee import (
+    Case,
     CharField,
     TextField,
     IntegerField,
     DateTimeField,
     ForeignKeyField,
-    DoesNotExist
+    DoesNotExist,
+    JOIN,
+    fn
 )
+from epicevents.config import EVENT_DURATION_HOURS
 from epicevents.models.database import BaseModel
 from epicevents.models.contract import Contract
+from epicevents.models.customer import Customer
+from epicevents.models.role import Role
+from epicevents.models.tombstone import Tombstone
 from epicevents.models.user import User
+from epicevents.utils.planner import overlapping_pairs
+
+
+EVENT_DURATION = timedelta(hours=EVENT_DURATION_HOURS)
 
 
 class Event(BaseModel):
@@ -18,7 +29,7 @@ class Event(BaseModel):
     contract = ForeignKeyField(Contract, backref="events")
     name = CharField(max_length=150)
     location = CharField(max_length=150)
-    event_date = DateTimeField()
+    event_date = DateTimeField(index=True)
     attendees = IntegerField()
     notes = TextField(null=True)
     team_contact_id = ForeignKeyField(
@@ -30,17 +41,62 @@ class Event(BaseModel):
     date_created = DateTimeField(null=True)  # Allow null for new objects
     date_updated = DateTimeField(null=True)  # Allow null for new objects
 
+    class Meta:
+        # Serves per-contact date ranges and unassigned events ordered by date,
+        # and the keyset scans of the change feed
+        indexes = (
+            (("team_contact_id", "event_date"), False),
+            (("date_updated", "id"), False),
+        )
+
     def save(self, *args, **kwargs):
-        """Saves the event's data with validation checks."""
-        self._validate_contract()
-        self._validate_name()
-        self._validate_event_date()
-        self._validate_attendees()
-        self._validate_team_contact()
+        """Saves the event's data, validating only the changed fields, and updates the contract rollup."""
+        if self.has_changed("contract"):
+            self._validate_contract()
+        if self.has_changed("name"):
+            self._validate_name()
+        if self.has_changed("event_date"):
+            self._validate_event_date()
+        if self.has_changed("attendees"):
+            self._validate_attendees()
+        if self.has_changed("team_contact_id"):
+            self._validate_team_contact()
+        if self.has_changed("team_contact_id", "event_date"):
+            self._validate_schedule()
         if not self.id:
             self.date_created = datetime.now()  # Auto date_created
         self.date_updated = datetime.now()  # Auto date_updated
-        super().save(*args, **kwargs)
+
+        before = None if self.is_new() else self.get_original("contract")
+        if before == self.__data__.get("contract"):
+            super().save(*args, **kwargs)
+            return
+
+        with self._meta.database.atomic():
+            super().save(*args, **kwargs)
+            self._move_count(before, self.__data__.get("contract"))
+
+    def delete_instance(self, *args, **kwargs):
+        """Deletes the event, removes it from its contract's rollup and leaves a tombstone."""
+        with self._meta.database.atomic():
+            rows = super().delete_instance(*args, **kwargs)
+            self._move_count(self.get_original("contract"), None)
+            Tombstone.record(self)
+        return rows
+
+    @staticmethod
+    def _move_count(before: int, after: int):
+        """
+        Moves the event from the events_count of its previous contract to its
+        current one, bumping their date_updated for the change feed.
+        """
+        if before == after:
+            return
+        for contract_id, sign in [(before, -1), (after, 1)]:
+            if contract_id is not None:
+                Contract.update(
+                    events_count=Contract.events_count + sign, date_updated=datetime.now()
+                ).where(Contract.id == contract_id).execute()
 
     def _validate_contract(self):
         """Validates contract."""
@@ -68,14 +124,9 @@ class Event(BaseModel):
             except ValueError:
                 raise ValueError("❌ Erreur : Format de date invalide. Utilisez 'YYYY-MM-DD' ou 'YYYY-MM-DD_HH:MM'.")
 
-        # Check if date is updated
-        if self.id:
-            try:
-                original_event = Event.get(Event.id == self.id)
-                if original_event.event_date == self.event_date:
-                    return self.event_date
-            except Event.DoesNotExist:
-                pass  # Goto normal check (not in the past)
+        # Check if date is updated (original value is tracked by BaseModel)
+        if self.id and self.get_original("event_date") == self.event_date:
+            return self.event_date
 
         # Check if the date is in the past
         if self.event_date < datetime.now():
@@ -96,6 +147,172 @@ class Event(BaseModel):
         except DoesNotExist:
             self.team_contact_id = None
 
+    def _validate_schedule(self):
+        """Validates that the support contact has no other event overlapping this one."""
+        contact_id = self.__data__.get("team_contact_id")
+        if not contact_id or not isinstance(self.event_date, datetime):
+            return
+
+        conflict = self.overlapping(contact_id, self.event_date, exclude_id=self.id).first()
+        if conflict:
+            raise ValueError(
+                f"❌ Erreur : Le support a déjà l'événement {conflict.id} le {conflict.event_date:%Y-%m-%d %H:%M}."
+            )
+
+    @classmethod
+    def overlapping(cls, contact_id: int, event_date: datetime, exclude_id: int = None):
+        """
+        Returns the events of a support contact overlapping an event starting at
+        event_date. Events last EVENT_DURATION, so this is a range scan on the
+        (team_contact_id, event_date) index.
+        """
+        query = cls.select(cls.id, cls.event_date).where(
+            cls.team_contact_id == contact_id,
+            cls.event_date > event_date - EVENT_DURATION,
+            cls.event_date < event_date + EVENT_DURATION,
+        )
+        if exclude_id:
+            query = query.where(cls.id != exclude_id)
+        return query.order_by(cls.event_date)
+
+    @classmethod
+    def conflicts(cls) -> list:
+        """Returns every (support id, event id, event id) pair of overlapping events, across the whole calendar."""
+        rows = (
+            cls.select(cls.team_contact_id, cls.event_date, cls.id)
+            .where(cls.team_contact_id.is_null(False))
+            .order_by(cls.team_contact_id, cls.event_date, cls.id)
+            .tuples()
+            .iterator()
+        )
+        return overlapping_pairs(rows, EVENT_DURATION)
+
+    @classmethod
+    def reassign(cls, from_user_id: int, to_user: User, *conditions) -> int:
+        """Reassigns in one UPDATE every event of a support user matching the conditions."""
+        # Target role is checked once, the same way a single save would
+        cls(team_contact_id=to_user)._validate_team_contact()
+
+        query = (
+            cls.update(team_contact_id=to_user, date_updated=datetime.now())
+            .where(cls.team_contact_id == from_user_id, *conditions)
+        )
+        with cls._meta.database.atomic():
+            return query.execute()
+
+    @classmethod
+    def assign_bulk(cls, assignments: dict) -> int:
+        """
+        Assigns unassigned events to support users ({event_id: user_id}) in one
+        UPDATE. Events assigned meanwhile by someone else are left untouched.
+
+        The schedules of the support users are then checked in one query, as a
+        single save would: an overlap rolls the whole assignment back.
+        """
+        if not assignments:
+            return 0
+
+        dates = [event.event_date for event in cls.select(cls.event_date).where(cls.id.in_(list(assignments)))]
+        if not dates:
+            return 0
+
+        query = (
+            cls.update(team_contact_id=Case(cls.id, list(assignments.items())), date_updated=datetime.now())
+            .where(cls.id.in_(list(assignments)), cls.team_contact_id.is_null(True))
+        )
+        with cls._meta.database.atomic():
+            count = query.execute()
+            rows = (
+                cls.select(cls.team_contact_id, cls.event_date, cls.id)
+                .where(
+                    cls.team_contact_id.in_(list(set(assignments.values()))),
+                    cls.event_date > min(dates) - EVENT_DURATION,
+                    cls.event_date < max(dates) + EVENT_DURATION,
+                )
+                .order_by(cls.team_contact_id, cls.event_date, cls.id)
+                .tuples()
+            )
+            for support_id, first_id, second_id in overlapping_pairs(rows, EVENT_DURATION):
+                for event_id, other_id in ((first_id, second_id), (second_id, first_id)):
+                    if assignments.get(event_id) == support_id:
+                        raise ValueError(
+                            f"❌ Erreur : Le support {support_id} a déjà l'événement {other_id} "
+                            f"qui chevauche l'événement {event_id}."
+                        )
+        return count
+
+    @classmethod
+    def select_detailed(cls):
+        """Returns a query loading events with their contract, customer and every contact in one round-trip."""
+        event_contact = User.alias()
+        contract_contact = User.alias()
+        customer_contact = User.alias()
+        return (
+            cls.select(cls, Contract, Customer, event_contact, contract_contact, customer_contact)
+            .join(Contract, JOIN.LEFT_OUTER, on=(cls.contract == Contract.id))
+            .join(contract_contact, JOIN.LEFT_OUTER, on=(Contract.team_contact_id == contract_contact.id))
+            .switch(Contract)
+            .join(Customer, JOIN.LEFT_OUTER, on=(Contract.customer == Customer.id))
+            .join(customer_contact, JOIN.LEFT_OUTER, on=(Customer.team_contact_id == customer_contact.id))
+            .switch(cls)
+            .join(event_contact, JOIN.LEFT_OUTER, on=(cls.team_contact_id == event_contact.id))
+        )
+
+    @classmethod
+    def workload(cls, now: datetime = None):
+        """
+        Returns, for every support user, the number of upcoming events, their
+        attendees and the events of the next 7 and 30 days, in one GROUP BY.
+
+        Support users without any event are kept (0) by the outer join, whose
+        condition starts from now so only upcoming rows are read.
+        """
+        now = now or datetime.now()
+        week = cls.event_date < now + timedelta(days=7)
+        month = cls.event_date < now + timedelta(days=30)
+        return (
+            User.select(
+                User.id, User.first_name, User.last_name,
+                fn.COUNT(cls.id).alias("upcoming"),
+                fn.COALESCE(fn.SUM(cls.attendees), 0).alias("attendees"),
+                fn.COUNT(cls.id).filter(week).alias("next_7_days"),
+                fn.COUNT(cls.id).filter(month).alias("next_30_days"),
+            )
+            .join(Role, on=(User.role == Role.id))
+            .switch(User)
+            .join(cls, JOIN.LEFT_OUTER, on=((cls.team_contact_id == User.id) & (cls.event_date >= now)))
+            .where(Role.name == "support")
+            .group_by(User.id, User.first_name, User.last_name)
+            .order_by(fn.COUNT(cls.id).filter(month).desc(), User.id)
+            .dicts()
+        )
+
+    @classmethod
+    def unassigned(cls, now: datetime = None):
+        """Returns the upcoming events without support contact, soonest first."""
+        now = now or datetime.now()
+        return (
+            cls.select(cls.id, cls.name, cls.event_date, cls.attendees)
+            .where(cls.team_contact_id.is_null(True), cls.event_date >= now)
+            .order_by(cls.event_date)
+        )
+
+    @classmethod
+    def calendar(cls, start: datetime, end: datetime, contact_id: int = None):
+        """
+        Returns the events from start (included) to end (excluded), with their
+        support contact, ordered by date: a range scan on the event_date index,
+        or on (team_contact_id, event_date) for a single contact.
+        """
+        query = (
+            cls.select(cls.id, cls.name, cls.location, cls.event_date, cls.attendees, User)
+            .join(User, JOIN.LEFT_OUTER, on=(cls.team_contact_id == User.id))
+            .where(cls.event_date >= start, cls.event_date < end)
+        )
+        if contact_id:
+            query = query.where(cls.team_contact_id == contact_id)
+        return query.order_by(cls.event_date, cls.id)
+
     def get_data(self):
         """Returns a dictionary with the event's information."""
         return {
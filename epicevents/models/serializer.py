@@ -0,0 +1,190 @@
+from peewee import JOIN, PostgresqlDatabase, chunked
+from epicevents.models.company import Company
+from epicevents.models.customer import Customer
+from epicevents.models.contract import Contract
+from epicevents.models.event import Event
+from epicevents.models.user import User
+
+
+# Max IDs sent in a single IN clause (SQLite limits bound parameters)
+BATCH_SIZE = 900
+
+
+def prefetch_related(instances: list, field_name: str, rel_model) -> list:
+    """
+    Resolves a foreign key over a list of instances with one IN query.
+
+    Related objects already loaded (by a join or a previous level) are reused,
+    and the resolved objects are cached on each instance so that get_data()
+    doesn't lazy-load them again.
+
+    Args:
+        instances (list): Model instances sharing the foreign key field_name
+        field_name (str): Name of the foreign key field
+        rel_model: Model targeted by the foreign key
+
+    Returns:
+        list: The distinct related instances
+    """
+    loaded = {}
+    missing = set()
+
+    for instance in instances:
+        related = instance.__rel__.get(field_name)
+        if related is not None:
+            loaded[related.id] = related
+        elif instance.__data__.get(field_name) is not None:
+            missing.add(instance.__data__[field_name])
+
+    missing -= loaded.keys()
+    for batch in chunked(sorted(missing), BATCH_SIZE):
+        for related in rel_model.select().where(rel_model.id.in_(batch)):
+            loaded[related.id] = related
+
+    for instance in instances:
+        fk_id = instance.__data__.get(field_name)
+        if fk_id is not None:
+            # Dangling keys are cached as None instead of raising on access
+            instance.__rel__[field_name] = loaded.get(fk_id)
+
+    return list(loaded.values())
+
+
+def batch_get_data(instances: list) -> list:
+    """
+    Returns the get_data() dictionary of each instance, dataloader style.
+
+    Each nested level (contracts, customers, companies, then every team contact
+    at once) is resolved with one IN query, so serializing N events costs at
+    most 4 queries instead of ~5N.
+    """
+    events = [instance for instance in instances if isinstance(instance, Event)]
+    contracts = [instance for instance in instances if isinstance(instance, Contract)]
+    customers = [instance for instance in instances if isinstance(instance, Customer)]
+
+    contracts += prefetch_related(events, "contract", Contract)
+    customers += prefetch_related(contracts, "customer", Customer)
+    prefetch_related(customers, "company", Company)
+    prefetch_related(events + contracts + customers, "team_contact_id", User)
+
+    return [instance.get_data() for instance in instances]
+
+
+def contact_data(user) -> dict:
+    """Returns the identity of a team contact (None if unassigned)."""
+    if user is None or user.id is None:
+        return None
+    return {"id": user.id, "first_name": user.first_name, "last_name": user.last_name, "email": user.email}
+
+
+def json_contact(alias: str) -> str:
+    """PostgreSQL expression building contact_data() from a joined user alias."""
+    return (
+        f"CASE WHEN {alias}.id IS NULL THEN NULL ELSE json_build_object("
+        f"'id', {alias}.id, 'first_name', {alias}.first_name, "
+        f"'last_name', {alias}.last_name, 'email', {alias}.email) END"
+    )
+
+
+def customer_tree_json(customer_id: int, database):
+    """Builds the customer tree server-side in one query, nesting rows with json_agg."""
+    contract_contact = Contract.team_contact_id.column_name
+    event_contact = Event.team_contact_id.column_name
+    customer_contact = Customer.team_contact_id.column_name
+
+    events = (
+        "SELECT json_agg(json_build_object("
+        "'id', e.id, 'name', e.name, 'location', e.location, 'event_date', e.event_date, "
+        f"'attendees', e.attendees, 'support', {json_contact('es')}) ORDER BY e.event_date) "
+        f'FROM "event" e LEFT JOIN "user" es ON es.id = e.{event_contact} WHERE e.contract_id = ct.id'
+    )
+    contracts = (
+        "SELECT json_agg(json_build_object("
+        "'id', ct.id, 'signed', ct.signed, 'amount_total', ct.amount_total, 'amount_due', ct.amount_due, "
+        f"'date_created', ct.date_created, 'manager', {json_contact('m')}, "
+        f"'events', COALESCE(({events}), '[]'::json)) ORDER BY ct.id) "
+        f'FROM "contract" ct LEFT JOIN "user" m ON m.id = ct.{contract_contact} WHERE ct.customer_id = c.id'
+    )
+    sql = (
+        "SELECT json_build_object("
+        "'customer', json_build_object('id', c.id, 'first_name', c.first_name, 'last_name', c.last_name, "
+        "'email', c.email, 'phone', c.phone), "
+        "'company', CASE WHEN co.id IS NULL THEN NULL ELSE json_build_object('id', co.id, 'name', co.name) END, "
+        f"'sales_contact', {json_contact('s')}, "
+        f"'contracts', COALESCE(({contracts}), '[]'::json)) "
+        'FROM "customer" c LEFT JOIN "company" co ON co.id = c.company_id '
+        f'LEFT JOIN "user" s ON s.id = c.{customer_contact} WHERE c.id = %s'
+    )
+    row = database.execute_sql(sql, (customer_id,)).fetchone()
+    return row[0] if row else None
+
+
+def customer_tree_batched(customer_id: int):
+    """Builds the same tree as customer_tree_json() with one query per level."""
+    customer = Customer.select_detailed().where(Customer.id == customer_id).first()
+    if customer is None:
+        return None
+
+    manager = User.alias()
+    contracts = list(
+        Contract.select(Contract, manager)
+        .join(manager, JOIN.LEFT_OUTER, on=(Contract.team_contact_id == manager.id))
+        .where(Contract.customer == customer_id)
+        .order_by(Contract.id)
+    )
+
+    events_by_contract = {contract.id: [] for contract in contracts}
+    for batch in chunked(list(events_by_contract), BATCH_SIZE):
+        support = User.alias()
+        events = (
+            Event.select(Event, support)
+            .join(support, JOIN.LEFT_OUTER, on=(Event.team_contact_id == support.id))
+            .where(Event.contract.in_(batch))
+            .order_by(Event.event_date)
+        )
+        for event in events:
+            events_by_contract[event.__data__["contract"]].append({
+                "id": event.id,
+                "name": event.name,
+                "location": event.location,
+                "event_date": event.event_date.isoformat(),
+                "attendees": event.attendees,
+                "support": contact_data(event.team_contact_id),
+            })
+
+    return {
+        "customer": {
+            "id": customer.id,
+            "first_name": customer.first_name,
+            "last_name": customer.last_name,
+            "email": customer.email,
+            "phone": customer.phone,
+        },
+        "company": {"id": customer.company.id, "name": customer.company.name} if customer.company else None,
+        "sales_contact": contact_data(customer.team_contact_id),
+        "contracts": [
+            {
+                "id": contract.id,
+                "signed": contract.signed,
+                "amount_total": contract.amount_total,
+                "amount_due": contract.amount_due,
+                "date_created": contract.date_created.isoformat(),
+                "manager": contact_data(contract.team_contact_id),
+                "events": events_by_contract[contract.id],
+            }
+            for contract in contracts
+        ],
+    }
+
+
+def customer_tree(customer_id: int) -> dict:
+    """
+    Returns a customer with its company, sales contact, contracts (with their
+    manager) and each contract's events (with their support contact), as
+    nested dicts. PostgreSQL nests it in one query, other databases use
+    3 queries (customer, contracts, events by batches of contract IDs).
+    """
+    database = Customer._meta.database
+    if isinstance(database, PostgresqlDatabase):
+        return customer_tree_json(customer_id, database)
+    return customer_tree_batched(customer_id)
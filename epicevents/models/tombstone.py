@@ -0,0 +1,16 @@
+from datetime import datetime
+from peewee import CharField, DateTimeField, IntegerField
+from epicevents.models.database import BaseModel
+
+
+class Tombstone(BaseModel):
+    """Records a deleted customer, contract or event, so the change feed can export deletes."""
+
+    kind = CharField(max_length=20)
+    ref_id = IntegerField()
+    deleted_at = DateTimeField(default=datetime.now, index=True)
+
+    @classmethod
+    def record(cls, instance: BaseModel):
+        """Records the deletion of a model instance."""
+        return cls.create(kind=instance._meta.table_name, ref_id=instance.id)
@@ -1,5 +1,6 @@
 import re
-from peewee import CharField, ForeignKeyField
+import sentry_sdk
+from peewee import CharField, ForeignKeyField, JOIN
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 from epicevents.models.database import BaseModel
@@ -20,18 +21,29 @@ class User(BaseModel):
     role = ForeignKeyField(Role, backref="list_users", on_delete="SET NULL")
 
     def save(self, *args, **kwargs):
-        """Saves the user's data with validation checks."""
-        self._validate_name()
-        self._validate_email()
-        self._validate_phone()
-        self._validate_role()
+        """Saves the user's data, validating only the changed fields."""
+        if self.has_changed("first_name", "last_name"):
+            self._validate_name()
+        if self.has_changed("email"):
+            self._validate_email()
+        if self.has_changed("phone"):
+            self._validate_phone()
+        if self.has_changed("role"):
+            self._validate_role()
 
         # Hashing password if not already hashed
         if not self.password.startswith("$argon2id$"):
-            self.password = ph.hash(self.password)
+            with sentry_sdk.start_span(op="auth.argon2", name="hash"):
+                self.password = ph.hash(self.password)
 
         super().save(*args, **kwargs)
 
+    def delete_instance(self, *args, **kwargs):
+        """Deletes the user, unassigning its customers, contracts and events for the change feed."""
+        with self._meta.database.atomic():
+            self.detach_dependents()
+            return super().delete_instance(*args, **kwargs)
+
     def _validate_name(self):
         """Validates the first name and last name."""
         pattern = r"^[a-zA-ZÀ-ÿ\-_\s]+$"
@@ -67,16 +79,22 @@ class User(BaseModel):
     def verify_password(self, password: str) -> bool:
         """Checks input password equals saved."""
         try:
-            return ph.verify(self.password, password)
+            with sentry_sdk.start_span(op="auth.argon2", name="verify"):
+                return ph.verify(self.password, password)
         except VerifyMismatchError:
             return False
 
+    @classmethod
+    def select_detailed(cls):
+        """Returns a query loading users with their role in one round-trip."""
+        return cls.select(cls, Role).join(Role, JOIN.LEFT_OUTER)
+
     def get_data(self):
         """Returns a dictionnary with user's information."""
         user_data = {
             "user_id": self.id,
             "email": self.email,
-            "role_id": self.role.id if self.role else None
+            "role_id": self.role_id  # raw foreign key, no Role query
         }
 
         return user_data
@@ -12,8 +12,11 @@ from epicevents.cli.utils import format_text
 from epicevents.cli.utils import welcome_user
 from epicevents.models.user import User
 from epicevents.permissions.perm import has_permission
+from epicevents.permissions.security import security_events
 from epicevents.config import SECRET_KEY, TOKEN_EXP
 from epicevents.config import SENTRY_ENV
+from epicevents.utils.metrics import metrics
+from epicevents.utils.tracing import name_command_transaction
 
 
 console = Console()
@@ -102,39 +105,35 @@ def authenticate_user(username: str, password: str) -> Optional[dict]:
         console.print(
             format_text('bold', 'red', "❌ Utilisateur non trouvé.")
         )
+        metrics.increment("auth", result="failure", reason="unexisting user")
 
         if SENTRY_ENV == "production":
             # Sends to Sentry if we're in production
             sanitize_argv()
             error_log = f"Utilisateur inexistant : '{username}'."
-            sentry_sdk.set_extra("event_details", {
-                "event": "unexisting user",
-                "source": username,
-            })
-            sentry_sdk.capture_message(error_log, level="warning")
+            security_events.record("unexisting user", username, message=error_log)
 
         return None
 
     try:
-        ph.verify(user.password, password)
+        with sentry_sdk.start_span(op="auth.argon2", name="verify"):
+            ph.verify(user.password, password)
     except VerifyMismatchError:
         console.print(
             format_text('bold', 'red', "❌ Mot de passe incorrect.")
         )
+        metrics.increment("auth", result="failure", reason="wrong pw")
 
         if SENTRY_ENV == "production":
             # Sends to Sentry if we're in production
             sanitize_argv()
             error_log = f"Mot de passe erroné : '{username}'."
-            sentry_sdk.set_extra("event_details", {
-                "event": "wrong pw",
-                "source": username,
-            })
-            sentry_sdk.capture_message(error_log, level="warning")
+            security_events.record("wrong pw", username, message=error_log)
 
         return None
 
     token = generate_token(user)
+    metrics.increment("auth", result="success")
     welcome_user()
     return {
         'token': token,
@@ -154,26 +153,35 @@ def is_logged() -> User | None:
 
 def check_auth(ctx: typer.Context) -> None:
     """Checks that user is authentified and allowed before each command."""
-    command: str | None = ctx.invoked_subcommand
+    authorize(ctx, ctx.info_name, ctx.invoked_subcommand)
 
-    if command in ["login", "logout"]:
+
+def authorize(ctx: typer.Context, resource: str, action: str | None) -> None:
+    """Checks that user is authentified and allowed to run an action, and sets ctx.obj to the user."""
+    name_command_transaction(resource, action)
+    metrics.set_command(resource, action)
+
+    if action in ["login", "logout"]:
         return
 
-    user: User | None = is_logged()
+    with sentry_sdk.start_span(op="auth.jwt", name="verify_token"):
+        user: User | None = is_logged()
     if not user:
+        metrics.increment("auth", result="failure", reason="not logged")
         console.print(format_text('bold', 'red', "❌ Vous devez être connecté pour exécuter cette commande."))
         raise typer.Exit(1)
 
     ctx.obj = user
-    resource = ctx.info_name
-    action = command
     target_id = get_target_id_from_args(sys.argv)
 
-    has_perm, error_message = has_permission(user, resource, action, target_id)
+    with sentry_sdk.start_span(op="auth.permission", name=f"{resource}.{action}"):
+        has_perm, error_message = has_permission(user, resource, action, target_id)
 
     if has_perm:
         return
 
+    metrics.increment("permission_denied", role=user.role.name, resource=resource)
+
     # Display & log both the standard error message and the detailed reason if available
     error_log = f"Permission denied for user {user.id} on {resource} {action}"
     if error_message:
@@ -184,15 +192,10 @@ def check_auth(ctx: typer.Context) -> None:
         console.print(format_text('bold', 'red', f"❌ Vous n'avez pas l'autorisation d'exécuter '{resource} {action}'."))
 
     if SENTRY_ENV == "production":
-        # Sends to Sentry if we're in production
-        sentry_sdk.set_extra("event_details", {
-            "event": "unauthorized",
-            "source_id": user.id,
-            "resource": resource,
-            "action": action,
-            "target_id": target_id
-        })
-        sentry_sdk.capture_message(error_log, level="warning")
+        # Sends to Sentry if we're in production (aggregated, see permissions.security)
+        security_events.record(
+            "unauthorized", user.id, resource, action, message=error_log, details={"target_id": target_id}
+        )
 
     raise typer.Exit(1)
 
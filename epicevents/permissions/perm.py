@@ -128,21 +128,41 @@ ROLES_PERMISSIONS = {
         },
         "customer": {
             "read": always_true,
-            "list": always_true
+            "list": always_true,
+            "view": always_true,
+            "reassign": always_true
         },
         "contract": {
             "create": always_true,
             "read": always_true,
             "list": always_true,
-            "update": always_true
+            "update": always_true,
+            "reassign": always_true,
+            "report": always_true,
+            "aging": always_true
         },
         "event": {
             "read": always_true,
             "list": always_true,
-            "update": always_true
+            "calendar": always_true,
+            "update": always_true,
+            "reassign": always_true,
+            "workload": always_true,
+            "auto-assign": always_true,
+            "conflicts": always_true
         },
         "debug": {
-            "commands": always_true
+            "commands": always_true,
+            "explain": always_true
+        },
+        "search": {
+            "search": always_true
+        },
+        "dashboard": {
+            "dashboard": always_true
+        },
+        "export": {
+            "changes": always_true
         }
     },
     "sales": {
@@ -155,6 +175,7 @@ ROLES_PERMISSIONS = {
             "create": always_true,
             "read": always_true,
             "list": always_true,
+            "view": always_true,
             "update": is_owner
         },
         "contract": {
@@ -166,10 +187,15 @@ ROLES_PERMISSIONS = {
             "create": always_true,
             "read": always_true,
             "list": always_true,
+            "calendar": always_true,
             "update": is_my_customer
         },
         "debug": {
-            "commands": always_true
+            "commands": always_true,
+            "explain": always_true
+        },
+        "search": {
+            "search": always_true
         }
     },
     "support": {
@@ -180,7 +206,8 @@ ROLES_PERMISSIONS = {
         },
         "customer": {
             "read": always_true,
-            "list": always_true
+            "list": always_true,
+            "view": always_true
         },
         "contract": {
             "read": always_true,
@@ -188,11 +215,16 @@ ROLES_PERMISSIONS = {
         },
         "event": {
             "list": always_true,
+            "calendar": always_true,
             "read": always_true,
             "update": is_owner
         },
         "debug": {
-            "commands": always_true
+            "commands": always_true,
+            "explain": always_true
+        },
+        "search": {
+            "search": always_true
         }
     }
 }
@@ -279,3 +311,24 @@ def has_permission(user: User, resource: str, action: str, target: Any = None) -
     else:
         # Generic error message for other permission functions
         return False, "Vous n'avez pas l'autorisation requise pour cette action."
+
+
+def filter_permitted(user: User, resource: str, action: str, entities: list) -> tuple:
+    """ Splits already loaded entities between permitted and denied ones.
+
+    Entities are checked as objects, so ownership rules run without a query per target.
+
+    Returns:
+        tuple: (permitted, denied) lists of entities
+    """
+
+    permitted = []
+    denied = []
+    for entity in entities:
+        has_perm, _ = has_permission(user, resource, action, entity)
+        if has_perm:
+            permitted.append(entity)
+        else:
+            denied.append(entity)
+
+    return permitted, denied
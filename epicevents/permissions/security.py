@@ -0,0 +1,119 @@
+import atexit
+import json
+import os
+import time
+import sentry_sdk
+from contextlib import contextmanager
+from pathlib import Path
+from epicevents.config import SECURITY_EVENTS_FILE, SECURITY_EVENTS_WINDOW
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(path: Path):
+    """Holds an exclusive lock on a lock file, blocking until other processes release it."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class SecurityEventBuffer:
+    """
+    Aggregates security events (failed logins, denied permissions) by
+    (event, source, resource, action) and reports each tuple to Sentry once
+    per window, as a single message with its count.
+
+    Each CLI call is a short-lived process, so pending counts are kept in a
+    per-user file between calls (SECURITY_EVENTS_FILE). The buffer is written
+    at exit, after the command's output, and sent once the window has
+    elapsed: capture_message only queues the events for the SDK's background
+    transport. Concurrent calls merge their counts under a file lock.
+    """
+
+    def __init__(self, path: Path = SECURITY_EVENTS_FILE, window: int = SECURITY_EVENTS_WINDOW):
+        self.path = path
+        self.window = window
+        self.pending = {}
+        self._registered = False
+
+    def register(self) -> None:
+        """Flushes the buffer at exit (idempotent)."""
+        if not self._registered:
+            atexit.register(self.flush)
+            self._registered = True
+
+    def record(self, event: str, source, resource: str = None, action: str = None,
+               message: str = "", details: dict = None) -> None:
+        """Counts a security event, keeping the message and details of its first occurrence."""
+        key = json.dumps([event, str(source), resource, action])
+        entry = self.pending.setdefault(key, {"message": message, "details": details or {}, "count": 0})
+        entry["count"] += 1
+        self.register()
+
+    def load(self) -> dict:
+        """Returns the events stored by previous calls."""
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {"started": None, "events": {}}
+
+    def flush(self, force: bool = False) -> None:
+        """Merges pending events into the stored buffer and reports it if the window has elapsed."""
+        if not self.pending and not self.path.exists():
+            return
+
+        with file_lock(self.path.with_suffix(".lock")):
+            stored = self.load()
+            for key, entry in self.pending.items():
+                if key in stored["events"]:
+                    stored["events"][key]["count"] += entry["count"]
+                else:
+                    stored["events"][key] = entry
+            self.pending = {}
+
+            now = time.time()
+            started = stored["started"] or now
+            if force or now - started >= self.window:
+                self.send(stored["events"])
+                self.path.unlink(missing_ok=True)
+                return
+
+            stored["started"] = started
+            temp_path = self.path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps(stored))
+            os.replace(temp_path, self.path)
+
+    def send(self, events: dict) -> None:
+        """Sends one Sentry message per aggregated tuple."""
+        for key, entry in events.items():
+            event, source, resource, action = json.loads(key)
+            with sentry_sdk.new_scope() as scope:
+                scope.set_extra("event_details", {
+                    "event": event,
+                    "source": source,
+                    "resource": resource,
+                    "action": action,
+                    "count": entry["count"],
+                    **entry["details"],
+                })
+                sentry_sdk.capture_message(f"{entry['message']} (x{entry['count']})", level="warning")
+
+
+security_events = SecurityEventBuffer()
@@ -0,0 +1,136 @@
+from datetime import datetime
+from peewee import Case, PostgresqlDatabase, Value, fn
+from epicevents.models.contract import Contract
+from epicevents.models.customer import Customer
+
+try:
+    import numpy as np
+except ImportError:  # Optional: the aging is then computed by the database
+    np = None
+
+
+# Upper bound (days, inclusive) of each bucket, the last one is open
+BUCKET_BOUNDS = [30, 60, 90]
+BUCKET_LABELS = ["0-30", "31-60", "61-90", "90+"]
+GROUP_FIELDS = {"customer": Contract.customer, "rep": Customer.team_contact_id}
+
+
+def receivables_query(columns: list):
+    """Returns the signed contracts with an amount due, joined to their customer."""
+    return (
+        Contract.select(*columns)
+        .join(Customer, on=(Contract.customer == Customer.id))
+        .where(Contract.signed == True, Contract.amount_due > 0)  # noqa: E712
+    )
+
+
+def load_columns() -> tuple:
+    """
+    Reads (amount_total, amount_due, date_created, customer_id, rep_id) as
+    five columns. The tuples cursor is iterated without peewee's row cache.
+    """
+    query = receivables_query([
+        Contract.amount_total, Contract.amount_due, Contract.date_created,
+        Contract.customer, Customer.team_contact_id,
+    ])
+    rows = query.tuples().iterator()
+    columns = tuple(zip(*rows))
+    return columns or ((), (), (), (), ())
+
+
+def aging_numpy(by: str, as_of: datetime) -> list:
+    """Buckets and aggregates the columns with NumPy."""
+    amount_total, amount_due, date_created, customer_ids, rep_ids = load_columns()
+    keys = customer_ids if by == "customer" else rep_ids
+    if not keys:
+        return []
+
+    total = np.asarray(amount_total, dtype=float)
+    due = np.asarray(amount_due, dtype=float)
+    # Ages in whole days, truncated like the SQL fallback
+    age = (np.datetime64(as_of, "s") - np.asarray(date_created, dtype="datetime64[s]")) // np.timedelta64(1, "D")
+    bucket = np.searchsorted(BUCKET_BOUNDS, age, side="left")
+
+    # Contracts without a group (customer without a rep) are keyed -1
+    groups, inverse = np.unique(np.asarray([-1 if key is None else key for key in keys]), return_inverse=True)
+    size = len(groups)
+    buckets = np.bincount(inverse * len(BUCKET_LABELS) + bucket, weights=due, minlength=size * len(BUCKET_LABELS))
+    due_sums = np.bincount(inverse, weights=due, minlength=size)
+    total_sums = np.bincount(inverse, weights=total, minlength=size)
+    age_sums = np.bincount(inverse, weights=due * age, minlength=size)
+    counts = np.bincount(inverse, minlength=size)
+
+    return [
+        {
+            "key": None if groups[index] == -1 else int(groups[index]),
+            "count": int(counts[index]),
+            "buckets": buckets.reshape(size, len(BUCKET_LABELS))[index].tolist(),
+            "due": float(due_sums[index]),
+            "total": float(total_sums[index]),
+            "weighted_age": float(age_sums[index] / due_sums[index]),
+        }
+        for index in range(size)
+    ]
+
+
+def age_expression(as_of: datetime, database):
+    """Returns the SQL expression of a contract's age in whole days."""
+    if isinstance(database, PostgresqlDatabase):
+        return fn.DATE_PART("day", Value(as_of) - Contract.date_created)
+    return (fn.julianday(as_of.isoformat(" ")) - fn.julianday(Contract.date_created)).cast("INTEGER")
+
+
+def aging_sql(by: str, as_of: datetime) -> list:
+    """Buckets and aggregates in a single GROUP BY query."""
+    age = age_expression(as_of, Contract._meta.database)
+    group = GROUP_FIELDS[by]
+
+    bucket_sums = []
+    low = None
+    for index, label in enumerate(BUCKET_LABELS):
+        high = BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else None
+        if low is None:
+            condition = age <= high
+        elif high is None:
+            condition = age > low
+        else:
+            condition = (age > low) & (age <= high)
+        bucket_sums.append(fn.SUM(Case(None, [(condition, Contract.amount_due)], 0)).alias(f"bucket_{index}"))
+        low = high
+
+    query = receivables_query([
+        group.alias("key"),
+        fn.COUNT(Contract.id).alias("count"),
+        *bucket_sums,
+        fn.SUM(Contract.amount_due).alias("due"),
+        fn.SUM(Contract.amount_total).alias("total"),
+        (fn.SUM(Contract.amount_due * age) / fn.SUM(Contract.amount_due)).alias("weighted_age"),
+    ]).group_by(group)
+
+    return [
+        {
+            "key": row["key"],
+            "count": row["count"],
+            "buckets": [float(row[f"bucket_{index}"]) for index in range(len(BUCKET_LABELS))],
+            "due": float(row["due"]),
+            "total": float(row["total"]),
+            "weighted_age": float(row["weighted_age"]),
+        }
+        for row in query.dicts()
+    ]
+
+
+def compute_aging(by: str, as_of: datetime = None, use_numpy: bool = True) -> list:
+    """
+    Returns the aging of the amounts due per customer or sales rep, sorted by amount due.
+
+    Each row holds the group key, the contract count, the amount due per
+    bucket, the amount due and billed, and the average age weighted by the
+    amount due. NumPy is used when installed, the database otherwise.
+    """
+    if by not in GROUP_FIELDS:
+        raise ValueError(f"❌ Erreur : Regroupement '{by}' invalide (customer, rep).")
+
+    as_of = as_of or datetime.now()
+    rows = aging_numpy(by, as_of) if use_numpy and np is not None else aging_sql(by, as_of)
+    return sorted(rows, key=lambda row: row["due"], reverse=True)
@@ -0,0 +1,129 @@
+import re
+from datetime import datetime, timedelta
+from peewee import Tuple, fn
+from epicevents.models.customer import Customer
+from epicevents.models.contract import Contract
+from epicevents.models.event import Event
+from epicevents.models.tombstone import Tombstone
+from epicevents.models.checkpoint import Checkpoint
+
+
+CHANGE_MODELS = {"customer": Customer, "contract": Contract, "event": Event}
+# date_updated is set before commit, so a slower transaction can commit rows
+# older than rows already exported: the last seconds are left to the next export
+SETTLE_DELAY = timedelta(seconds=5)
+PAGE_SIZE = 500
+SINCE_FORMATS = ["%Y-%m-%d", "%Y-%m-%d_%H:%M", "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M:%S"]
+DATE_LIKE = re.compile(r"^\d{4}-\d")
+
+
+def parse_since(value: str) -> datetime | None:
+    """
+    Returns the date of a --since value, None when it is a checkpoint name.
+
+    Raises:
+        ValueError: if the value looks like a date (YYYY-...) but isn't a valid one
+    """
+    for date_format in SINCE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+    if DATE_LIKE.match(value):
+        raise ValueError(f"❌ Erreur : Date '{value}' invalide (YYYY-MM-DD ou YYYY-MM-DD_HH:MM).")
+    return None
+
+
+def positions_since(since: datetime) -> dict:
+    """
+    Returns the positions exporting every change from a date: (date, 0) in each
+    table, and the last tombstone before the date.
+    """
+    positions = {kind: (since, 0) for kind in CHANGE_MODELS}
+    first_deleted = Tombstone.select(fn.MIN(Tombstone.id)).where(Tombstone.deleted_at >= since).scalar()
+    if first_deleted is None:
+        first_deleted = (Tombstone.select(fn.MAX(Tombstone.id)).scalar() or 0) + 1
+    positions["tombstone"] = (None, first_deleted - 1)
+    return positions
+
+
+def checkpoint_exists(name: str) -> bool:
+    """Returns whether a consumer has saved a checkpoint under this name."""
+    return Checkpoint.select().where(Checkpoint.name == name).exists()
+
+
+def load_checkpoint(name: str) -> dict:
+    """Returns the positions saved by a consumer, from the start for the tables it never exported."""
+    positions = {kind: (None, 0) for kind in [*CHANGE_MODELS, "tombstone"]}
+    for checkpoint in Checkpoint.select().where(Checkpoint.name == name):
+        positions[checkpoint.kind] = (checkpoint.date_updated, checkpoint.last_id)
+    return positions
+
+
+def save_checkpoint(name: str, positions: dict) -> None:
+    """Saves the positions of a consumer, one row per table."""
+    rows = [
+        {"name": name, "kind": kind, "date_updated": date_updated, "last_id": last_id}
+        for kind, (date_updated, last_id) in positions.items()
+    ]
+    with Checkpoint._meta.database.atomic():
+        (
+            Checkpoint.insert_many(rows)
+            .on_conflict(
+                conflict_target=[Checkpoint.name, Checkpoint.kind],
+                preserve=[Checkpoint.date_updated, Checkpoint.last_id],
+            )
+            .execute()
+        )
+
+
+def changed_rows(model, position: tuple, until: datetime, page_size: int = PAGE_SIZE):
+    """
+    Yields the rows updated after a (date_updated, id) position and before
+    until, in that order. Each page is a range scan on the (date_updated, id)
+    index, resumed after the last row of the previous one.
+    """
+    date_updated, last_id = position
+    while True:
+        query = model.select().where(model.date_updated < until)
+        if date_updated is not None:
+            query = query.where(Tuple(model.date_updated, model.id) > Tuple(date_updated, last_id))
+        rows = list(query.order_by(model.date_updated, model.id).limit(page_size).dicts())
+        yield from rows
+        if len(rows) < page_size:
+            return
+        date_updated, last_id = rows[-1]["date_updated"], rows[-1]["id"]
+
+
+def deleted_rows(last_id: int, until: datetime, page_size: int = PAGE_SIZE):
+    """Yields the tombstones after an id, paginated on the primary key."""
+    while True:
+        rows = list(
+            Tombstone.select()
+            .where(Tombstone.id > last_id, Tombstone.deleted_at < until)
+            .order_by(Tombstone.id)
+            .limit(page_size)
+        )
+        yield from rows
+        if len(rows) < page_size:
+            return
+        last_id = rows[-1].id
+
+
+def export_changes(positions: dict, until: datetime = None, page_size: int = PAGE_SIZE):
+    """
+    Yields the customers, contracts and events updated since the positions,
+    then the deletions, as change dicts. The positions are moved forward as
+    the changes are yielded, ready to be saved once they are all consumed.
+    """
+    until = until or datetime.now() - SETTLE_DELAY
+    for kind, model in CHANGE_MODELS.items():
+        for row in changed_rows(model, positions[kind], until, page_size):
+            positions[kind] = (row["date_updated"], row["id"])
+            yield {"kind": kind, "op": "upsert", "id": row["id"], "date": row["date_updated"], "data": row}
+
+    for tombstone in deleted_rows(positions["tombstone"][1], until, page_size):
+        positions["tombstone"] = (None, tombstone.id)
+        yield {
+            "kind": tombstone.kind, "op": "delete", "id": tombstone.ref_id, "date": tombstone.deleted_at, "data": None
+        }
@@ -0,0 +1,278 @@
+import math
+import random
+import typer
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from itertools import chain
+from peewee import SqliteDatabase, chunked, fn
+from epicevents.models.database import BaseModel
+from epicevents.models.role import Role
+from epicevents.models.user import User, ph
+from epicevents.models.company import Company
+from epicevents.models.customer import Customer
+from epicevents.models.contract import Contract
+from epicevents.models.event import Event
+from epicevents.utils.rollups import rebuild_rollups
+
+
+FIRST_NAMES = [
+    "Alice", "Bruno", "Camille", "David", "Emma", "Fabien", "Gabriel", "Hugo", "Ines", "Jules",
+    "Karim", "Louise", "Manon", "Nathan", "Olivia", "Paul", "Quentin", "Rose", "Sophie", "Thomas",
+]
+LAST_NAMES = [
+    "Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit", "Durand", "Leroy", "Moreau",
+    "Simon", "Laurent", "Lefebvre", "Michel", "Garcia", "David", "Bertrand", "Roux", "Vincent", "Fournier",
+]
+CITIES = ["Paris", "Lyon", "Marseille", "Bordeaux", "Lille", "Nantes", "Toulouse", "London", "Bruxelles", "Genève"]
+EVENT_TYPES = ["Conférence", "Séminaire", "Gala", "Salon", "Workshop", "Lancement produit", "Assemblée"]
+
+# Bound parameters per INSERT on SQLite (SQLITE_MAX_VARIABLE_NUMBER may be 999)
+SQLITE_MAX_PARAMS = 999
+ROWS_PER_INSERT = 1000
+
+
+def hash_password(password: str) -> str:
+    """Hashes a password (module level so it can run in a process pool)."""
+    return ph.hash(password)
+
+
+def bulk_insert(model, rows, database) -> int:
+    """Streams rows into the table with batched insert_many, returns the number of rows."""
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return 0
+
+    batch_size = ROWS_PER_INSERT
+    if isinstance(database, SqliteDatabase):
+        batch_size = max(1, SQLITE_MAX_PARAMS // len(first))
+
+    count = 0
+    with database.atomic():
+        for batch in chunked(chain([first], rows), batch_size):
+            model.insert_many(batch).execute()
+            count += len(batch)
+
+    return count
+
+
+def max_id(model) -> int:
+    """Returns the highest id of a table (0 if empty)."""
+    return model.select(fn.MAX(model.id)).scalar() or 0
+
+
+def random_date(rng: random.Random, start: datetime, end: datetime) -> datetime:
+    """Returns a random datetime between start and end, rounded to the minute."""
+    seconds = max(0, int((end - start).total_seconds()))
+    return (start + timedelta(seconds=rng.randint(0, seconds))).replace(second=0, microsecond=0)
+
+
+def weighted_owners(rng: random.Random, user_ids: list) -> list:
+    """Gives each user a Pareto weight, so a few users own most of the records."""
+    return [rng.paretovariate(1.5) for _ in user_ids]
+
+
+def create_users(rng: random.Random, counts: dict, workers: int, database) -> dict:
+    """Creates users per role, hashing passwords in a process pool."""
+    offset = max_id(User)
+    roles = {role.name: role.id for role in Role.select()}
+
+    users = []
+    for role_name, count in counts.items():
+        for _ in range(count):
+            number = offset + len(users) + 1
+            users.append({
+                "username": f"{role_name}_{number}",
+                "password": f"{role_name.upper()}_PASS{number}",
+                "email": f"{role_name}_{number}@epicevents.com",
+                "first_name": rng.choice(FIRST_NAMES),
+                "last_name": rng.choice(LAST_NAMES),
+                "phone": f"06{rng.randint(10000000, 99999999)}",
+                "role": roles[role_name],
+            })
+
+    passwords = [user["password"] for user in users]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        hashes = list(pool.map(hash_password, passwords, chunksize=max(1, len(passwords) // 64)))
+    for user, hashed in zip(users, hashes):
+        user["password"] = hashed
+
+    bulk_insert(User, users, database)
+    print(f"✅ {len(users)} users created.")
+
+    created = User.select(User.id, User.role).where(User.id > offset).tuples()
+    role_names = {role_id: name for name, role_id in roles.items()}
+    by_role = {name: [] for name in counts}
+    for user_id, role_id in created:
+        by_role[role_names[role_id]].append(user_id)
+
+    return by_role
+
+
+def create_companies(count: int, database) -> list:
+    """Creates companies and returns their ids."""
+    offset = max_id(Company)
+    bulk_insert(Company, ({"name": f"Company {offset + i + 1}"} for i in range(count)), database)
+    print(f"✅ {count} companies created.")
+    return [company_id for (company_id,) in Company.select(Company.id).where(Company.id > offset).tuples()]
+
+
+def create_customers(rng: random.Random, count: int, company_ids: list, sales_ids: list, now: datetime, database):
+    """Creates customers spread over the last 3 years, 5% of them without sales contact."""
+    offset = max_id(Customer)
+    weights = weighted_owners(rng, sales_ids)
+    start = now - timedelta(days=3 * 365)
+
+    def rows():
+        for i in range(count):
+            number = offset + i + 1
+            first_name = rng.choice(FIRST_NAMES)
+            last_name = rng.choice(LAST_NAMES)
+            date_created = random_date(rng, start, now)
+            yield {
+                "first_name": first_name,
+                "last_name": last_name,
+                "email": f"{first_name.lower()}.{last_name.lower()}.{number}@example.com",
+                "phone": f"06{rng.randint(10000000, 99999999)}",
+                "company": rng.choice(company_ids),
+                "date_created": date_created,
+                "date_updated": random_date(rng, date_created, now),
+                "team_contact_id": rng.choices(sales_ids, weights)[0] if rng.random() > 0.05 else None,
+            }
+
+    bulk_insert(Customer, rows(), database)
+    print(f"✅ {count} customers created.")
+    return Customer.select(Customer.id, Customer.date_created).where(Customer.id > offset).tuples().iterator()
+
+
+def create_contracts(rng: random.Random, customers, per_customer: float, management_ids: list, now: datetime, database):
+    """Creates contracts (85% signed, mixed payment status), 10% of them without manager."""
+    offset = max_id(Contract)
+    weights = weighted_owners(rng, management_ids)
+
+    def rows():
+        for customer_id, customer_date in customers:
+            # Poisson-like count around the requested average
+            for _ in range(poisson(rng, per_customer)):
+                date_created = random_date(rng, customer_date, now)
+                amount_total = round(rng.lognormvariate(8.5, 1.0), 2)
+                paid = rng.random()
+                if paid < 0.5:
+                    amount_due = 0.0
+                elif paid < 0.8:
+                    amount_due = round(amount_total * rng.random(), 2)
+                else:
+                    amount_due = amount_total
+                yield {
+                    "customer": customer_id,
+                    "signed": rng.random() < 0.85,
+                    "date_created": date_created,
+                    "date_updated": random_date(rng, date_created, now),
+                    "amount_total": amount_total,
+                    "amount_due": amount_due,
+                    "team_contact_id": rng.choices(management_ids, weights)[0] if rng.random() > 0.1 else None,
+                }
+
+    count = bulk_insert(Contract, rows(), database)
+    print(f"✅ {count} contracts created.")
+    return (
+        Contract.select(Contract.id, Contract.date_created)
+        .where((Contract.id > offset) & (Contract.signed == True))  # noqa: E712
+        .tuples()
+        .iterator()
+    )
+
+
+def create_events(rng: random.Random, contracts, per_contract: float, support_ids: list, now: datetime, database):
+    """Creates events for signed contracts, up to a year ahead, 15% of them without support."""
+    weights = weighted_owners(rng, support_ids)
+
+    def rows():
+        for contract_id, contract_date in contracts:
+            for _ in range(poisson(rng, per_contract)):
+                event_date = random_date(rng, contract_date, contract_date + timedelta(days=365))
+                yield {
+                    "contract": contract_id,
+                    "name": f"{rng.choice(EVENT_TYPES)} {rng.choice(LAST_NAMES)}",
+                    "location": rng.choice(CITIES),
+                    "event_date": event_date,
+                    "attendees": max(1, int(rng.lognormvariate(4.0, 0.8))),
+                    "notes": None,
+                    "team_contact_id": rng.choices(support_ids, weights)[0] if rng.random() > 0.15 else None,
+                    "date_created": contract_date,
+                    "date_updated": min(event_date, now),
+                }
+
+    count = bulk_insert(Event, rows(), database)
+    print(f"✅ {count} events created.")
+
+
+def poisson(rng: random.Random, mean: float) -> int:
+    """Draws a Poisson distributed count (Knuth's algorithm, fine for small means)."""
+    limit = math.exp(-mean)
+    count = 0
+    product = rng.random()
+    while product > limit:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+def generate_dataset(
+    customers: int = 1000,
+    contracts_per_customer: float = 1.5,
+    events_per_contract: float = 1.0,
+    customers_per_sales: int = 250,
+    seed: int = None,
+    workers: int = None,
+) -> None:
+    """
+    Fills the bound database (PostgreSQL or the SQLite test database) with a
+    reproducible synthetic dataset, using bulk inserts.
+
+    Users are derived from the customer count: one sales per customers_per_sales
+    customers, one manager per 4 sales and one support per 2 sales.
+    """
+    database = BaseModel._meta.database
+    rng = random.Random(seed)
+    now = datetime.now().replace(second=0, microsecond=0)
+
+    for role in ["admin", "management", "sales", "support"]:
+        Role.get_or_create(name=role)
+
+    sales_count = max(2, math.ceil(customers / customers_per_sales))
+    users = create_users(
+        rng,
+        {"sales": sales_count, "management": max(1, sales_count // 4), "support": max(2, sales_count // 2)},
+        workers,
+        database,
+    )
+
+    company_ids = create_companies(max(1, customers // 5), database)
+    customer_rows = create_customers(rng, customers, company_ids, users["sales"], now, database)
+    contract_rows = create_contracts(rng, customer_rows, contracts_per_customer, users["management"], now, database)
+    create_events(rng, contract_rows, events_per_contract, users["support"], now, database)
+    # Bulk inserts bypass save(), so the rollups are computed once at the end
+    rebuild_rollups(database)
+
+
+def main(
+    customers: float = typer.Option(1000, "--customers", help="Nombre de clients (ex: 1e6)"),
+    contracts_per_customer: float = typer.Option(1.5, "--contracts-per-customer", help="Contrats par client (moyenne)"),
+    events_per_contract: float = typer.Option(
+        1.0, "--events-per-contract", help="Événements par contrat signé (moyenne)"
+    ),
+    customers_per_sales: int = typer.Option(250, "--customers-per-sales", help="Clients par commercial"),
+    seed: int = typer.Option(None, "--seed", help="Graine aléatoire pour un jeu reproductible"),
+    workers: int = typer.Option(None, "--workers", help="Processus utilisés pour hacher les mots de passe"),
+):
+    """Generates a synthetic dataset at the requested scale."""
+    from epicevents.utils.create_test_data import postgre_connect, close_db
+
+    postgre_connect()
+    generate_dataset(int(customers), contracts_per_customer, events_per_contract, customers_per_sales, seed, workers)
+    close_db()
+
+
+if __name__ == "__main__":
+    typer.run(main)
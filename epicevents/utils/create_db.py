@@ -7,10 +7,15 @@ from epicevents.models.company import Company
 from epicevents.models.customer import Customer
 from epicevents.models.contract import Contract
 from epicevents.models.event import Event
+from epicevents.models.tombstone import Tombstone
+from epicevents.models.checkpoint import Checkpoint
+from epicevents.utils.dashboard import create_dashboard_views
+from epicevents.utils.search import create_search_indexes
 
 
 ADMIN_EMAIL = get_key(".env", "ADMIN_EMAIL")
 ADMIN_PASSWORD = get_key(".env", "ADMIN_PASSWORD")
+MODELS = [Role, User, Company, Customer, Contract, Event, Tombstone, Checkpoint]
 
 
 def postgre_connect():
@@ -26,7 +31,9 @@ def postgre_connect():
 def create_db():
     """Table creation."""
     try:
-        psql_db.create_tables([Role, User, Company, Customer, Contract, Event])
+        psql_db.create_tables(MODELS)
+        create_search_indexes(psql_db)
+        create_dashboard_views(psql_db)
         print("✅ Tables created successfully!")
     except Exception as e:
         print(f"❌ Failed to create tables: {e}")
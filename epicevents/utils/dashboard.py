@@ -0,0 +1,151 @@
+from datetime import datetime, timedelta
+from peewee import PostgresqlDatabase
+
+
+# Dashboard views: name -> (query, unique key). The unique index lets
+# PostgreSQL refresh the view concurrently, without blocking its readers.
+DASHBOARD_VIEWS = {
+    "dashboard_pipeline": (
+        "SELECT CASE WHEN NOT signed THEN 'unsigned' WHEN COALESCE(amount_due, 0) > 0 THEN 'due' ELSE 'paid' END "
+        "AS status, COUNT(*) AS contracts, COALESCE(SUM(amount_total), 0) AS total, "
+        'COALESCE(SUM(amount_due), 0) AS due FROM "contract" GROUP BY 1',
+        "status",
+    ),
+    "dashboard_revenue": (
+        "SELECT {month} AS month, COUNT(*) AS contracts, SUM(amount_total) AS billed, "
+        'COALESCE(SUM(amount_due), 0) AS due FROM "contract" WHERE signed GROUP BY 1',
+        "month",
+    ),
+    "dashboard_events_weekly": (
+        "SELECT {week} AS week, COUNT(*) AS events, SUM(attendees) AS attendees, "
+        'SUM(CASE WHEN team_contact_id IS NULL THEN 1 ELSE 0 END) AS unassigned FROM "event" GROUP BY 1',
+        "week",
+    ),
+    "dashboard_unassigned": (
+        "SELECT 'event' AS kind, COUNT(*) AS total FROM \"event\" "
+        "WHERE team_contact_id IS NULL AND event_date >= {now} "
+        "UNION ALL SELECT 'contract', COUNT(*) FROM \"contract\" WHERE team_contact_id IS NULL "
+        "UNION ALL SELECT 'customer', COUNT(*) FROM \"customer\" WHERE team_contact_id IS NULL",
+        "kind",
+    ),
+}
+
+# Engine specific expressions: months as 'YYYY-MM', weeks as their monday 'YYYY-MM-DD'
+POSTGRES_EXPRESSIONS = {
+    "month": "to_char(date_created, 'YYYY-MM')",
+    "week": "to_char(date_trunc('week', event_date), 'YYYY-MM-DD')",
+    "now": "LOCALTIMESTAMP",
+}
+SQLITE_EXPRESSIONS = {
+    "month": "strftime('%Y-%m', date_created)",
+    "week": "date(event_date, '-' || ((CAST(strftime('%w', event_date) AS INTEGER) + 6) % 7) || ' days')",
+    "now": "datetime('now', 'localtime')",
+}
+
+
+def view_query(database, name: str) -> str:
+    """Returns the query of a dashboard view for the database engine."""
+    expressions = POSTGRES_EXPRESSIONS if isinstance(database, PostgresqlDatabase) else SQLITE_EXPRESSIONS
+    return DASHBOARD_VIEWS[name][0].format(**expressions)
+
+
+def record_refresh(database, name: str) -> None:
+    """Stores the refresh time of a view in dashboard_refresh."""
+    param = database.param
+    database.execute_sql(
+        f"INSERT INTO dashboard_refresh (name, refreshed_at) VALUES ({param}, {param}) "
+        "ON CONFLICT (name) DO UPDATE SET refreshed_at = excluded.refreshed_at",
+        (name, datetime.now().isoformat(" ")),
+    )
+
+
+def create_dashboard_views(database) -> None:
+    """
+    Creates the dashboard views and their refresh log.
+
+    PostgreSQL: materialized views with a unique index each. SQLite, which has
+    none: snapshot tables filled by the same queries.
+    """
+    postgres = isinstance(database, PostgresqlDatabase)
+    with database.atomic():
+        database.execute_sql(
+            "CREATE TABLE IF NOT EXISTS dashboard_refresh "
+            "(name VARCHAR(50) PRIMARY KEY, refreshed_at TIMESTAMP NOT NULL)"
+        )
+        for name, (_, key) in DASHBOARD_VIEWS.items():
+            kind = "MATERIALIZED VIEW" if postgres else "TABLE"
+            database.execute_sql(f"CREATE {kind} IF NOT EXISTS {name} AS {view_query(database, name)}")
+            database.execute_sql(f"CREATE UNIQUE INDEX IF NOT EXISTS {name}_key ON {name} ({key})")
+            record_refresh(database, name)
+
+
+def ensure_dashboard_views(database) -> None:
+    """Creates the dashboard views when missing, e.g. on a database created before them (see db upgrade)."""
+    if not database.table_exists("dashboard_refresh"):
+        create_dashboard_views(database)
+
+
+def refresh_dashboard(database) -> None:
+    """Recomputes every dashboard view, each in its own transaction."""
+    postgres = isinstance(database, PostgresqlDatabase)
+    for name in DASHBOARD_VIEWS:
+        with database.atomic():
+            if postgres:
+                database.execute_sql(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {name}")
+            else:
+                database.execute_sql(f"DELETE FROM {name}")
+                database.execute_sql(f"INSERT INTO {name} {view_query(database, name)}")
+            record_refresh(database, name)
+
+
+def last_refresh(database) -> datetime | None:
+    """Returns the refresh time of the oldest dashboard view."""
+    value = database.execute_sql("SELECT MIN(refreshed_at) FROM dashboard_refresh").fetchone()[0]
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def fetch_dicts(cursor) -> list:
+    """Returns the rows of a cursor as dicts."""
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def load_dashboard(database, months: int = 12, weeks: int = 8, today: datetime = None) -> dict:
+    """
+    Reads the dashboard from its views, each through its unique index.
+
+    Returns:
+        dict: pipeline by status, revenue of the last months, upcoming weeks
+        from the current one, and unassigned counts by kind
+    """
+    today = today or datetime.now()
+    monday = (today - timedelta(days=today.weekday())).strftime("%Y-%m-%d")
+    param = database.param
+    return {
+        "pipeline": fetch_dicts(database.execute_sql("SELECT * FROM dashboard_pipeline ORDER BY status")),
+        "revenue": fetch_dicts(database.execute_sql(
+            f"SELECT * FROM dashboard_revenue ORDER BY month DESC LIMIT {param}", (months,)
+        ))[::-1],
+        "weeks": fetch_dicts(database.execute_sql(
+            f"SELECT * FROM dashboard_events_weekly WHERE week >= {param} ORDER BY week LIMIT {param}", (monday, weeks)
+        )),
+        "unassigned": fetch_dicts(database.execute_sql("SELECT * FROM dashboard_unassigned ORDER BY kind")),
+    }
+
+
+def main():
+    """Refreshes the dashboard views, meant to be scheduled (cron, Windows task scheduler)."""
+    from epicevents.models.database import psql_db
+    from epicevents.utils.create_test_data import postgre_connect, close_db
+
+    postgre_connect()
+    ensure_dashboard_views(psql_db)
+    refresh_dashboard(psql_db)
+    print("✅ Dashboard views refreshed.")
+    close_db()
+
+
+if __name__ == "__main__":
+    main()
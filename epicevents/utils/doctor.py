@@ -0,0 +1,169 @@
+import statistics
+import time
+from abc import ABC, abstractmethod
+from peewee import PostgresqlDatabase
+
+
+PING_COUNT = 5
+LATENCY_WARNING_MS = 10.0
+# Same thresholds as PostgreSQL's autovacuum defaults: 50 rows + 20% (vacuum) / 10% (analyze)
+VACUUM_THRESHOLD, VACUUM_SCALE = 50, 0.2
+ANALYZE_THRESHOLD, ANALYZE_SCALE = 50, 0.1
+CACHE_HIT_MIN = 0.99
+
+HIGH, MEDIUM, LOW = 1, 2, 3
+PRIORITIES = {HIGH: "🔴 haute", MEDIUM: "🟠 moyenne", LOW: "🟢 basse"}
+
+
+class DoctorSource(ABC):
+    """
+    Reads what the doctor checks from a database.
+
+    Foreign keys and indexes come from peewee's introspection, which works on
+    every engine; subclasses provide the engine's table statistics and cache
+    ratio, returning None for what the engine does not track.
+    """
+
+    def __init__(self, database):
+        self.database = database
+
+    def ping(self) -> float:
+        """Returns the round-trip time of a trivial statement, in seconds."""
+        start = time.perf_counter()
+        self.database.execute_sql("SELECT 1").fetchall()
+        return time.perf_counter() - start
+
+    def tables(self) -> list:
+        return self.database.get_tables()
+
+    def foreign_keys(self, table: str) -> list:
+        """Returns the foreign key columns of a table."""
+        return [fk.column for fk in self.database.get_foreign_keys(table)]
+
+    def indexed_columns(self, table: str) -> set:
+        """Returns the columns leading an index of a table (the only ones an index lookup can use)."""
+        return {index.columns[0] for index in self.database.get_indexes(table) if index.columns}
+
+    @abstractmethod
+    def table_stats(self) -> list:
+        """Returns one dict per table: table, live, dead, modified (rows since last analyze), analyzed."""
+
+    def cache_hit_ratio(self):
+        """Returns the share of table blocks read from the cache, or None if unknown."""
+        return None
+
+
+class PostgresSource(DoctorSource):
+    """Reads the statistics collector views of PostgreSQL."""
+
+    def table_stats(self) -> list:
+        cursor = self.database.execute_sql(
+            "SELECT relname, n_live_tup, n_dead_tup, n_mod_since_analyze, "
+            "COALESCE(last_analyze, last_autoanalyze) IS NOT NULL "
+            "FROM pg_stat_user_tables ORDER BY relname"
+        )
+        return [
+            {"table": table, "live": live, "dead": dead, "modified": modified, "analyzed": analyzed}
+            for table, live, dead, modified, analyzed in cursor.fetchall()
+        ]
+
+    def cache_hit_ratio(self):
+        hit, read = self.database.execute_sql(
+            "SELECT COALESCE(SUM(heap_blks_hit), 0), COALESCE(SUM(heap_blks_read), 0) FROM pg_statio_user_tables"
+        ).fetchone()
+        if not hit + read:
+            return None
+        return float(hit) / float(hit + read)
+
+
+class SqliteSource(DoctorSource):
+    """
+    SQLite keeps no dead tuple or cache counters: only row counts and whether
+    ANALYZE has filled sqlite_stat1 are available.
+    """
+
+    def tables(self) -> list:
+        return [table for table in super().tables() if not table.startswith("sqlite_")]
+
+    def table_stats(self) -> list:
+        analyzed = set()
+        if self.database.table_exists("sqlite_stat1"):
+            analyzed = {row[0] for row in self.database.execute_sql("SELECT DISTINCT tbl FROM sqlite_stat1")}
+
+        return [
+            {
+                "table": table,
+                "live": self.database.execute_sql(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0],
+                "dead": None,
+                "modified": None,
+                "analyzed": table in analyzed,
+            }
+            for table in self.tables()
+        ]
+
+
+def source_for(database) -> DoctorSource:
+    """Returns the source matching the database engine."""
+    if isinstance(database, PostgresqlDatabase):
+        return PostgresSource(database)
+    return SqliteSource(database)
+
+
+def diagnose(source: DoctorSource) -> tuple:
+    """
+    Runs every check against a source.
+
+    Returns:
+        tuple: (measures as rows, recommendations as (priority, finding, fix) sorted by priority)
+    """
+    findings = []
+
+    latency = statistics.median(source.ping() for _ in range(PING_COUNT)) * 1000
+    measures = [{"Mesure": "Latence aller-retour", "Valeur": f"{latency:.2f} ms"}]
+    if latency > LATENCY_WARNING_MS:
+        findings.append((
+            MEDIUM,
+            f"Latence de {latency:.1f} ms par requête.",
+            "Rapprocher l'application de la base ou réduire le nombre de requêtes par commande.",
+        ))
+
+    missing = 0
+    for table in source.tables():
+        indexed = source.indexed_columns(table)
+        for column in source.foreign_keys(table):
+            if column not in indexed:
+                missing += 1
+                findings.append((
+                    HIGH,
+                    f"Clé étrangère {table}.{column} sans index.",
+                    f'CREATE INDEX {table}_{column} ON "{table}" ({column});',
+                ))
+    measures.append({"Mesure": "Clés étrangères sans index", "Valeur": str(missing)})
+
+    for stats in source.table_stats():
+        table, live = stats["table"], stats["live"]
+        if stats["dead"] is not None and stats["dead"] > VACUUM_THRESHOLD + VACUUM_SCALE * live:
+            findings.append((
+                MEDIUM,
+                f"{table} : {stats['dead']} lignes mortes pour {live} vivantes.",
+                f'VACUUM (ANALYZE) "{table}";',
+            ))
+        if live and not stats["analyzed"]:
+            findings.append((MEDIUM, f"{table} : aucune statistique.", f'ANALYZE "{table}";'))
+        elif stats["modified"] is not None and stats["modified"] > ANALYZE_THRESHOLD + ANALYZE_SCALE * live:
+            findings.append((
+                LOW,
+                f"{table} : statistiques périmées ({stats['modified']} lignes modifiées).",
+                f'ANALYZE "{table}";',
+            ))
+
+    ratio = source.cache_hit_ratio()
+    measures.append({"Mesure": "Taux de succès du cache", "Valeur": "n/a" if ratio is None else f"{ratio:.2%}"})
+    if ratio is not None and ratio < CACHE_HIT_MIN:
+        findings.append((
+            MEDIUM,
+            f"Taux de succès du cache de {ratio:.2%} (< {CACHE_HIT_MIN:.0%}).",
+            "Augmenter shared_buffers ou la mémoire du serveur.",
+        ))
+
+    return measures, sorted(findings, key=lambda finding: finding[0])
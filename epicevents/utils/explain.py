@@ -0,0 +1,82 @@
+import re
+from peewee import PostgresqlDatabase
+
+
+# Tables large enough for a sequential scan to hurt
+WATCHED_TABLES = ["event", "contract", "customer"]
+
+ALIAS_PATTERN = re.compile(r'"(\w+)" AS "(\w+)"')
+COLUMN_PATTERN = re.compile(r'"(\w+)"\."(\w+)"')
+# PostgreSQL: 'Seq Scan on event t1' / SQLite: 'SCAN t1' (without USING INDEX)
+PG_SEQ_SCAN = re.compile(r"Seq Scan on (\w+)")
+SQLITE_SEQ_SCAN = re.compile(r"^SCAN (\w+)$")
+
+
+def explain(query, database) -> list:
+    """
+    Runs EXPLAIN on a peewee query and returns the plan lines.
+
+    PostgreSQL runs EXPLAIN (ANALYZE, BUFFERS), which executes the query;
+    SQLite only supports EXPLAIN QUERY PLAN.
+    """
+    sql, params = query.sql()
+    if isinstance(database, PostgresqlDatabase):
+        cursor = database.execute_sql(f"EXPLAIN (ANALYZE, BUFFERS) {sql}", params)
+        return [row[0] for row in cursor.fetchall()]
+
+    cursor = database.execute_sql(f"EXPLAIN QUERY PLAN {sql}", params)
+    return [row[-1] for row in cursor.fetchall()]
+
+
+def sequential_scans(plan: list, sql: str) -> list:
+    """Returns the watched tables read by a sequential scan in the plan."""
+    aliases = dict((alias, table) for table, alias in ALIAS_PATTERN.findall(sql))
+
+    tables = []
+    for line in plan:
+        match = PG_SEQ_SCAN.search(line) or SQLITE_SEQ_SCAN.match(line.strip())
+        if match:
+            table = aliases.get(match.group(1), match.group(1))
+            if table in WATCHED_TABLES and table not in tables:
+                tables.append(table)
+    return tables
+
+
+def filtered_columns(table: str, sql: str) -> list:
+    """
+    Returns the columns of a table used in WHERE or, for a joined table, in
+    its JOIN condition. The FROM table is only ever filtered by WHERE.
+    """
+    aliases = {alias for name, alias in ALIAS_PATTERN.findall(sql) if name == table} or {table}
+
+    where = ""
+    if " WHERE " in sql:
+        where = re.split(r" ORDER BY | GROUP BY | LIMIT ", sql.split(" WHERE ", 1)[1])[0]
+    clauses = [where]
+    if not re.search(rf' FROM "{table}"', sql):
+        clauses.append(" ".join(re.findall(r" ON \((.*?)\)", sql)))
+
+    for clause in clauses:
+        columns = []
+        for alias, column in COLUMN_PATTERN.findall(clause):
+            if alias in aliases and column != "id" and column not in columns:
+                columns.append(column)
+        if columns:
+            return columns
+    return []
+
+
+def suggest_index(table: str, sql: str, database) -> str:
+    """Returns the index that would avoid the sequential scan of a table, or why there is none."""
+    columns = filtered_columns(table, sql)
+    if not columns:
+        return "Lecture complète attendue (aucun filtre) : paginer ou limiter la requête."
+
+    existing = [index for index in database.get_indexes(table) if index.columns and index.columns[0] in columns]
+    if existing:
+        return (
+            f"Index existant ({existing[0].name}) ignoré par le planificateur : "
+            f"table petite ou filtre peu sélectif."
+        )
+
+    return f'CREATE INDEX {table}_{"_".join(columns)} ON "{table}" ({", ".join(columns)});'
@@ -0,0 +1,242 @@
+import json
+import math
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from epicevents.config import METRICS_LOG, METRICS_LOG_MAX_BYTES, METRICS_PROM_FILE
+
+
+# Latency buckets (seconds) of the Prometheus histograms
+BUCKETS = [0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+
+def percentile(values: list, rank: float) -> float:
+    """Returns the nearest-rank percentile (rank between 0 and 100) of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(rank / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """Writes a file through a temporary file and a rename, so readers never see it half written."""
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_text(content)
+    os.replace(temp_path, path)
+
+
+def rotated_path(path: Path) -> Path:
+    """Returns the path of the previous generation of a rotated log."""
+    return path.with_name(f"{path.name}.1")
+
+
+class CommandMetrics:
+    """
+    Measures one CLI command: latency, DB time and statement count, plus the
+    auth and permission counters incremented while it runs.
+
+    On close, the measure is appended as one JSON line to METRICS_LOG (a
+    per-user file, rotated to METRICS_LOG.1 once it exceeds max_bytes) and, if
+    METRICS_PROM_FILE is set, cumulated into a Prometheus textfile-collector
+    file (rewritten with an atomic rename).
+    """
+
+    def __init__(self, log_path: str = METRICS_LOG, prom_path: str = METRICS_PROM_FILE,
+                 max_bytes: int = METRICS_LOG_MAX_BYTES):
+        self.log_path = Path(log_path) if log_path else None
+        self.prom_path = Path(prom_path) if prom_path else None
+        self.max_bytes = max_bytes
+        self.command = None
+        self.counters = defaultdict(int)
+        self.db_time = 0.0
+        self.queries = 0
+        self._start = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.log_path is not None or self.prom_path is not None
+
+    def start(self, ctx, database) -> None:
+        """Starts measuring the command and its SQL statements, recorded when ctx closes."""
+        if not self.enabled:
+            return
+
+        self.command = ctx.invoked_subcommand or "cli"
+        self.counters = defaultdict(int)
+        self.db_time = 0.0
+        self.queries = 0
+
+        previous = database.__dict__.get("execute_sql")
+        execute_sql = database.execute_sql
+
+        def timed_execute_sql(sql, params=None, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return execute_sql(sql, params, *args, **kwargs)
+            finally:
+                self.db_time += time.perf_counter() - start
+                self.queries += 1
+
+        database.execute_sql = timed_execute_sql
+        self._start = time.perf_counter()
+        # Called while click unwinds, so sys.exc_info() holds the command's exception if any
+        ctx.call_on_close(lambda: self.finish(database, previous, sys.exc_info()[1]))
+
+    def set_command(self, resource: str, action: str) -> None:
+        self.command = f"{resource}.{action}"
+
+    def increment(self, name: str, **labels) -> None:
+        """Increments a counter, e.g. increment("auth", result="failure")."""
+        label_str = ",".join(f'{key}="{value}"' for key, value in sorted(labels.items()))
+        self.counters[f"{name}{{{label_str}}}" if label_str else name] += 1
+
+    def finish(self, database, previous_execute_sql=None, exception=None) -> None:
+        """Restores database.execute_sql and writes the record."""
+        if previous_execute_sql is not None:
+            database.execute_sql = previous_execute_sql
+        else:
+            database.__dict__.pop("execute_sql", None)
+        exit_code = getattr(exception, "exit_code", 1) if exception else 0
+        record = {
+            "ts": time.time(),
+            "command": self.command,
+            "status": "ok" if not exit_code else "error",
+            "duration": time.perf_counter() - self._start,
+            "db_time": self.db_time,
+            "queries": self.queries,
+            "counters": dict(self.counters),
+        }
+
+        try:
+            if self.log_path:
+                self.append_log(record)
+            if self.prom_path:
+                self.export_prometheus(record)
+        except OSError:
+            # Metrics must never break a command
+            pass
+
+    def append_log(self, record: dict) -> None:
+        """Appends a record to the log, first rotating it if it has grown past max_bytes."""
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.log_path.exists() and self.log_path.stat().st_size >= self.max_bytes:
+            os.replace(self.log_path, rotated_path(self.log_path))
+        with self.log_path.open("a", encoding="utf-8") as log:
+            log.write(json.dumps(record) + "\n")
+
+    def export_prometheus(self, record: dict) -> None:
+        """Cumulates the record into the textfile-collector file and its JSON state."""
+        state_path = self.prom_path.with_name(f"{self.prom_path.name}.state.json")
+        try:
+            state = json.loads(state_path.read_text())
+        except (OSError, ValueError):
+            state = {"commands": {}, "counters": {}}
+
+        key = f'command="{record["command"]}",status="{record["status"]}"'
+        command = state["commands"].setdefault(
+            key, {"count": 0, "duration_sum": 0.0, "db_sum": 0.0, "queries": 0, "buckets": [0] * len(BUCKETS)}
+        )
+        command["count"] += 1
+        command["duration_sum"] += record["duration"]
+        command["db_sum"] += record["db_time"]
+        command["queries"] += record["queries"]
+        for index, bound in enumerate(BUCKETS):
+            if record["duration"] <= bound:
+                command["buckets"][index] += 1
+        for name, value in record["counters"].items():
+            state["counters"][name] = state["counters"].get(name, 0) + value
+
+        write_atomic(state_path, json.dumps(state))
+        write_atomic(self.prom_path, render_prometheus(state))
+
+
+def render_prometheus(state: dict) -> str:
+    """Renders the cumulated state in the Prometheus text exposition format."""
+    lines = [
+        "# HELP epicevents_command_duration_seconds CLI command latency.",
+        "# TYPE epicevents_command_duration_seconds histogram",
+    ]
+    for labels, command in state["commands"].items():
+        for bound, count in zip(BUCKETS, command["buckets"]):
+            lines.append(f'epicevents_command_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+        lines.append(f'epicevents_command_duration_seconds_bucket{{{labels},le="+Inf"}} {command["count"]}')
+        lines.append(f'epicevents_command_duration_seconds_sum{{{labels}}} {command["duration_sum"]}')
+        lines.append(f'epicevents_command_duration_seconds_count{{{labels}}} {command["count"]}')
+
+    lines += [
+        "# HELP epicevents_db_seconds_total Time spent in SQL statements.",
+        "# TYPE epicevents_db_seconds_total counter",
+    ]
+    lines += [f'epicevents_db_seconds_total{{{labels}}} {c["db_sum"]}' for labels, c in state["commands"].items()]
+    lines += [
+        "# HELP epicevents_db_queries_total SQL statements executed.",
+        "# TYPE epicevents_db_queries_total counter",
+    ]
+    lines += [f'epicevents_db_queries_total{{{labels}}} {c["queries"]}' for labels, c in state["commands"].items()]
+
+    for name in sorted({counter.split("{")[0] for counter in state["counters"]}):
+        lines.append(f"# TYPE epicevents_{name}_total counter")
+        for counter, value in sorted(state["counters"].items()):
+            if counter.split("{")[0] == name:
+                labels = counter[len(name):]
+                lines.append(f"epicevents_{name}_total{labels} {value}")
+
+    return "\n".join(lines) + "\n"
+
+
+def read_log(path: Path) -> list:
+    """Returns the records of the metrics log and its rotated generation (skipping truncated lines)."""
+    records = []
+    if not path:
+        return records
+    for log_path in (rotated_path(path), path):
+        if not log_path.exists():
+            continue
+        with log_path.open(encoding="utf-8") as log:
+            for line in log:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    return records
+
+
+def summarize(records: list) -> tuple:
+    """
+    Aggregates log records.
+
+    Returns:
+        tuple: (rows per command with count, errors, p50/p95/p99 and mean DB time, summed counters)
+    """
+    durations = defaultdict(list)
+    db_times = defaultdict(list)
+    errors = defaultdict(int)
+    counters = defaultdict(int)
+    for record in records:
+        command = record.get("command") or "cli"
+        durations[command].append(record["duration"])
+        db_times[command].append(record["db_time"])
+        errors[command] += record["status"] != "ok"
+        for name, value in record.get("counters", {}).items():
+            counters[name] += value
+
+    rows = []
+    for command in sorted(durations):
+        values = durations[command]
+        rows.append({
+            "Commande": command,
+            "Appels": len(values),
+            "Erreurs": errors[command],
+            "p50": f"{percentile(values, 50) * 1000:.1f}",
+            "p95": f"{percentile(values, 95) * 1000:.1f}",
+            "p99": f"{percentile(values, 99) * 1000:.1f}",
+            "BDD moy.": f"{sum(db_times[command]) / len(values) * 1000:.1f}",
+        })
+
+    return rows, dict(counters)
+
+
+metrics = CommandMetrics()
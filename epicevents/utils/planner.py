@@ -0,0 +1,74 @@
+from bisect import bisect_left, insort
+from datetime import timedelta
+
+
+def is_free(busy: list, event_date, duration: timedelta) -> bool:
+    """Returns whether an event starting at event_date overlaps none of the sorted busy starts."""
+    index = bisect_left(busy, event_date)
+    # Only the closest starts on each side can overlap
+    return all(abs(start - event_date) >= duration for start in busy[max(0, index - 1):index + 1])
+
+
+def plan_assignments(events: list, schedules: dict, duration: timedelta) -> tuple:
+    """
+    Assigns events to support users, balancing their attendee load.
+
+    Greedy, largest events first: each event goes to the least loaded
+    support user (attendees, then events, then id) who has no other event
+    overlapping it, events lasting duration as in Event.overlapping. Events
+    nobody can take are left unassigned.
+
+    Args:
+        events (list): (event_id, event_date, attendees) of the events to assign
+        schedules (dict): support user id -> list of (event_date, attendees) already assigned
+        duration (timedelta): length of an event
+
+    Returns:
+        tuple: (assignments as {event_id: support_id}, ids of the events left unassigned)
+    """
+    load = {support_id: sum(attendees for _, attendees in schedule) for support_id, schedule in schedules.items()}
+    count = {support_id: len(schedule) for support_id, schedule in schedules.items()}
+    busy = {support_id: sorted(event_date for event_date, _ in schedule) for support_id, schedule in schedules.items()}
+
+    assignments = {}
+    unassigned = []
+    for event_id, event_date, attendees in sorted(events, key=lambda event: (-event[2], event[1], event[0])):
+        free = [support_id for support_id in schedules if is_free(busy[support_id], event_date, duration)]
+        if not free:
+            unassigned.append(event_id)
+            continue
+
+        support_id = min(free, key=lambda support: (load[support], count[support], support))
+        assignments[event_id] = support_id
+        load[support_id] += attendees
+        count[support_id] += 1
+        insort(busy[support_id], event_date)
+
+    return assignments, unassigned
+
+
+def overlapping_pairs(rows, duration: timedelta) -> list:
+    """
+    Sweeps events sorted by (support id, start) and returns every pair of
+    events of a same support user whose [start, start + duration) overlap.
+
+    Each event is only compared with the following ones until a start falls
+    past its end, so the sweep costs O(n + pairs) after the O(n log n) sort.
+
+    Args:
+        rows: (support_id, event_date, event_id) sorted by support_id then event_date
+        duration (timedelta): length of an event
+
+    Returns:
+        list: (support_id, first event_id, second event_id) tuples
+    """
+    pairs = []
+    active = []  # (event_date, event_id) of the current support, still running
+    current = None
+    for support_id, event_date, event_id in rows:
+        if support_id != current:
+            current, active = support_id, []
+        active = [(start, other_id) for start, other_id in active if start + duration > event_date]
+        pairs.extend((support_id, other_id, event_id) for _, other_id in active)
+        active.append((event_date, event_id))
+    return pairs
@@ -0,0 +1,107 @@
+import time
+from collections import defaultdict
+from rich.console import Console
+from rich.table import Table
+
+
+# Printed on stderr, so profiling never mixes with --jsonl output
+console = Console(stderr=True)
+
+# Statements executed at least this many times are reported as a likely N+1
+DUPLICATE_THRESHOLD = 3
+
+
+class QueryProfiler:
+    """
+    Records every statement sent through database.execute_sql, with its
+    parameters and duration, and prints a summary once the command is over.
+    """
+
+    def __init__(self, database, top: int = 5):
+        self.database = database
+        self.top = top
+        self.queries = []
+        self._previous = None
+
+    def start(self):
+        """Hooks database.execute_sql."""
+        self._previous = self.database.__dict__.get("execute_sql")
+        execute_sql = self.database.execute_sql
+
+        def profiled_execute_sql(sql, params=None, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return execute_sql(sql, params, *args, **kwargs)
+            finally:
+                self.queries.append((sql, params, time.perf_counter() - start))
+
+        self.database.execute_sql = profiled_execute_sql
+        return self
+
+    def stop(self):
+        """Restores database.execute_sql."""
+        if self._previous is not None:
+            self.database.execute_sql = self._previous
+        else:
+            self.database.__dict__.pop("execute_sql", None)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def total_time(self) -> float:
+        return sum(duration for _, _, duration in self.queries)
+
+    def slowest(self) -> list:
+        """Returns the top slowest statements as (sql, params, duration)."""
+        return sorted(self.queries, key=lambda query: query[2], reverse=True)[:self.top]
+
+    def duplicates(self) -> list:
+        """
+        Returns (sql, count, distinct parameter sets, total duration) for the
+        statements executed at least DUPLICATE_THRESHOLD times. Many distinct
+        parameter sets point to an N+1 loop, a single one to an exact repeat.
+        """
+        grouped = defaultdict(list)
+        for sql, params, duration in self.queries:
+            grouped[sql].append((repr(params), duration))
+
+        repeated = [
+            (sql, len(runs), len({params for params, _ in runs}), sum(duration for _, duration in runs))
+            for sql, runs in grouped.items()
+            if len(runs) >= DUPLICATE_THRESHOLD
+        ]
+        return sorted(repeated, key=lambda item: item[1], reverse=True)
+
+    def report(self):
+        """Stops profiling and prints the summary."""
+        self.stop()
+
+        console.print(
+            f"[bold purple]📊 Profil SQL : {len(self.queries)} requête(s), "
+            f"{self.total_time * 1000:.1f} ms en base[/bold purple]"
+        )
+        if not self.queries:
+            return
+
+        table = Table(title=f"Requêtes les plus lentes (top {self.top})", header_style="blue bold")
+        table.add_column("ms", justify="right")
+        table.add_column("SQL")
+        table.add_column("Paramètres")
+        for sql, params, duration in self.slowest():
+            table.add_row(f"{duration * 1000:.2f}", sql, str(list(params or [])))
+        console.print(table)
+
+        duplicates = self.duplicates()
+        if duplicates:
+            table = Table(title="Requêtes répétées (N+1 probable)", header_style="red bold")
+            table.add_column("Exécutions", justify="right")
+            table.add_column("Paramètres distincts", justify="right")
+            table.add_column("ms", justify="right")
+            table.add_column("SQL")
+            for sql, count, distinct, duration in duplicates:
+                table.add_row(str(count), str(distinct), f"{duration * 1000:.1f}", sql)
+            console.print(table)
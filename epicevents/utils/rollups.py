@@ -0,0 +1,56 @@
+from datetime import datetime
+from peewee import fn
+from playhouse.migrate import SchemaMigrator, migrate
+from epicevents.models.customer import Customer
+from epicevents.models.contract import Contract
+from epicevents.models.event import Event
+
+
+ROLLUP_FIELDS = [Customer.contracts_count, Customer.outstanding_total, Contract.events_count]
+
+
+def ensure_rollup_columns(database) -> list:
+    """Adds the rollup columns missing from a database created before them, returns their names."""
+    missing = [
+        field for field in ROLLUP_FIELDS
+        if field.column_name not in {column.name for column in database.get_columns(field.model._meta.table_name)}
+    ]
+    if missing:
+        migrator = SchemaMigrator.from_database(database)
+        migrate(*[
+            migrator.add_column(field.model._meta.table_name, field.column_name, field)
+            for field in missing
+        ])
+    return [f"{field.model._meta.table_name}.{field.column_name}" for field in missing]
+
+
+def rebuild_rollups(database) -> dict:
+    """
+    Recomputes every rollup from the contract and event tables, in one
+    correlated UPDATE per table. Only the rows whose rollups had drifted are
+    written, with their date_updated bumped for the change feed.
+
+    Returns:
+        dict: number of customers and contracts corrected
+    """
+    contracts_count = Contract.select(fn.COUNT(Contract.id)).where(Contract.customer == Customer.id)
+    outstanding_total = (
+        Contract.select(fn.COALESCE(fn.SUM(Contract.amount_due), 0.0))
+        .where(Contract.customer == Customer.id, Contract.signed == True)  # noqa: E712
+    )
+    events_count = Event.select(fn.COUNT(Event.id)).where(Event.contract == Contract.id)
+
+    now = datetime.now()
+    with database.atomic():
+        customers = (
+            Customer.update(contracts_count=contracts_count, outstanding_total=outstanding_total, date_updated=now)
+            .where((Customer.contracts_count != contracts_count) | (Customer.outstanding_total != outstanding_total))
+            .execute()
+        )
+        contracts = (
+            Contract.update(events_count=events_count, date_updated=now)
+            .where(Contract.events_count != events_count)
+            .execute()
+        )
+
+    return {"customers": customers, "contracts": contracts}
@@ -0,0 +1,140 @@
+import re
+from peewee import PostgresqlDatabase
+
+
+# Searchable documents: kind -> (table, title, detail, document). "{t}" is the
+# column prefix: empty in index expressions and queries, "new." in triggers.
+SEARCH_DOCUMENTS = {
+    "customer": (
+        "customer",
+        "{t}first_name || ' ' || {t}last_name",
+        "{t}email",
+        "{t}first_name || ' ' || {t}last_name || ' ' || {t}email",
+    ),
+    "company": ("company", "{t}name", "''", "{t}name"),
+    "event": (
+        "event",
+        "{t}name",
+        "{t}location",
+        "{t}name || ' ' || {t}location || ' ' || coalesce({t}notes, '')",
+    ),
+}
+SEARCH_KINDS = list(SEARCH_DOCUMENTS)
+TOKEN_PATTERN = re.compile(r"\w+")
+COLUMN_PATTERN = re.compile(r"\{t\}(\w+)")
+
+
+def create_search_indexes(database) -> None:
+    """
+    Creates the search indexes.
+
+    PostgreSQL: a pg_trgm GIN index (fuzzy matching) and a tsvector GIN index
+    (word prefixes) on each document expression. SQLite: a search_index FTS5
+    table kept up to date by triggers, rowid = id * 4 + kind index.
+    """
+    if isinstance(database, PostgresqlDatabase):
+        database.execute_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for table, _, _, document in SEARCH_DOCUMENTS.values():
+            document = document.format(t="")
+            database.execute_sql(
+                f'CREATE INDEX IF NOT EXISTS {table}_search_trgm ON "{table}" USING GIN (({document}) gin_trgm_ops)'
+            )
+            database.execute_sql(
+                f"CREATE INDEX IF NOT EXISTS {table}_search_fts ON \"{table}\" "
+                f"USING GIN (to_tsvector('simple', {document}))"
+            )
+        return
+
+    with database.atomic():
+        database.execute_sql("DROP TABLE IF EXISTS search_index")
+        database.execute_sql(
+            "CREATE VIRTUAL TABLE search_index USING fts5("
+            "kind UNINDEXED, ref_id UNINDEXED, title UNINDEXED, detail UNINDEXED, body, "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+        for index, (kind, (table, title, detail, document)) in enumerate(SEARCH_DOCUMENTS.items()):
+            def columns(prefix):
+                return ", ".join([
+                    f"{prefix}id * 4 + {index}", f"'{kind}'", f"{prefix}id",
+                    title.format(t=prefix), detail.format(t=prefix), document.format(t=prefix),
+                ])
+
+            insert = "INSERT INTO search_index (rowid, kind, ref_id, title, detail, body)"
+            database.execute_sql(f'{insert} SELECT {columns("")} FROM "{table}"')
+            database.execute_sql(
+                f'CREATE TRIGGER IF NOT EXISTS {table}_search_ai AFTER INSERT ON "{table}" '
+                f'BEGIN {insert} VALUES ({columns("new.")}); END'
+            )
+            # Only the indexed columns, so rollup updates don't rewrite the index
+            indexed = ", ".join(COLUMN_PATTERN.findall(document))
+            database.execute_sql(
+                f'CREATE TRIGGER IF NOT EXISTS {table}_search_au AFTER UPDATE OF {indexed} ON "{table}" BEGIN '
+                f"DELETE FROM search_index WHERE rowid = old.id * 4 + {index}; "
+                f'{insert} VALUES ({columns("new.")}); END'
+            )
+            database.execute_sql(
+                f'CREATE TRIGGER IF NOT EXISTS {table}_search_ad AFTER DELETE ON "{table}" '
+                f"BEGIN DELETE FROM search_index WHERE rowid = old.id * 4 + {index}; END"
+            )
+
+
+def ensure_search_index(database) -> None:
+    """
+    Creates the search indexes missing from a database, e.g. one created before
+    them. The SQLite search table is only (re)built when its triggers are
+    missing, e.g. after the tables were recreated.
+    """
+    if isinstance(database, PostgresqlDatabase):
+        create_search_indexes(database)
+        return
+
+    cursor = database.execute_sql(
+        "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%_search_a_'"
+    )
+    if cursor.fetchone()[0] < 3 * len(SEARCH_DOCUMENTS):
+        create_search_indexes(database)
+
+
+def search(text: str, database, limit: int = 20) -> list:
+    """
+    Searches customers, companies and events in one query, best matches first.
+
+    Every word of the text is matched as a prefix, any word being enough;
+    PostgreSQL also matches misspelt words through trigram similarity.
+
+    Returns:
+        list: dicts with kind, id, title, detail and score
+    """
+    words = TOKEN_PATTERN.findall(text.lower())
+    if not words:
+        return []
+
+    if isinstance(database, PostgresqlDatabase):
+        tsquery = " | ".join(f"{word}:*" for word in words)
+        parts = []
+        params = []
+        for kind, (table, title, detail, document) in SEARCH_DOCUMENTS.items():
+            document = document.format(t="")
+            parts.append(
+                f"SELECT '{kind}' AS kind, id, {title.format(t='')} AS title, {detail.format(t='')} AS detail, "
+                f"GREATEST(word_similarity(%s, {document}), "
+                f"ts_rank(to_tsvector('simple', {document}), to_tsquery('simple', %s))) AS score "
+                f'FROM "{table}" '
+                f"WHERE %s <%% ({document}) OR to_tsvector('simple', {document}) @@ to_tsquery('simple', %s)"
+            )
+            params += [text, tsquery, text, tsquery]
+        sql = f"SELECT * FROM ({' UNION ALL '.join(parts)}) AS results ORDER BY score DESC LIMIT %s"
+        cursor = database.execute_sql(sql, params + [limit])
+    else:
+        ensure_search_index(database)
+        # bm25() is lower for better matches
+        cursor = database.execute_sql(
+            "SELECT kind, ref_id, title, detail, -bm25(search_index) AS score FROM search_index "
+            "WHERE search_index MATCH ? ORDER BY bm25(search_index) LIMIT ?",
+            (" OR ".join(f'"{word}"*' for word in words), limit),
+        )
+
+    return [
+        {"kind": kind, "id": ref_id, "title": title, "detail": detail, "score": float(score)}
+        for kind, ref_id, title, detail, score in cursor.fetchall()
+    ]
@@ -0,0 +1,30 @@
+import sys
+import sentry_sdk
+
+
+def start_command_transaction(ctx) -> None:
+    """
+    Starts a Sentry transaction for the CLI command, finished when the command's
+    context closes. check_auth renames it 'resource.action' once both are known.
+    Without an initialised SDK or when not sampled, this is a no-op.
+    """
+    transaction = sentry_sdk.start_transaction(op="cli.command", name=ctx.invoked_subcommand or "cli")
+    transaction.__enter__()
+    # Called while click unwinds, so sys.exc_info() holds the command's exception if any
+    ctx.call_on_close(lambda: transaction.__exit__(*sys.exc_info()))
+
+
+def name_command_transaction(resource: str, action: str) -> None:
+    """Names the current transaction after the command."""
+    sentry_sdk.get_current_scope().set_transaction_name(f"{resource}.{action}")
+
+
+def trace_queries(database) -> None:
+    """Wraps database.execute_sql so each statement is recorded as a 'db' span."""
+    execute_sql = database.execute_sql
+
+    def traced_execute_sql(sql, params=None, *args, **kwargs):
+        with sentry_sdk.start_span(op="db", name=sql):
+            return execute_sql(sql, params, *args, **kwargs)
+
+    database.execute_sql = traced_execute_sql
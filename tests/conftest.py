@@ -1,5 +1,6 @@
 import pytest
 import os
+from contextlib import contextmanager
 from datetime import datetime
 from peewee import SqliteDatabase
 import epicevents.models.database as db_module
@@ -20,6 +21,8 @@ from epicevents.models.company import Company
 from epicevents.models.customer import Customer
 from epicevents.models.contract import Contract
 from epicevents.models.event import Event
+from epicevents.models.tombstone import Tombstone
+from epicevents.models.checkpoint import Checkpoint
 import epicevents.models.database as db_module
 
 
@@ -28,11 +31,28 @@ if test_db.is_closed():
     test_db.connect()
 
 # Créer les tables et les rôles de test
-test_db.create_tables([Role, User, Company, Customer, Contract, Event])
+test_db.create_tables([Role, User, Company, Customer, Contract, Event, Tombstone, Checkpoint])
 roles = ["admin", "management", "sales", "support"]
 role_objs = {role: Role.get_or_create(name=role)[0] for role in roles}
 
 
+@pytest.fixture(autouse=True)
+def security_events_file(tmp_path, monkeypatch):
+    """Écrit le tampon des événements de sécurité dans un dossier temporaire."""
+    from epicevents.permissions.security import security_events
+    monkeypatch.setattr(security_events, "path", tmp_path / ".security_events.json")
+    monkeypatch.setattr(security_events, "pending", {})
+
+
+@pytest.fixture(autouse=True)
+def metrics_files(tmp_path, monkeypatch):
+    """Écrit les métriques des commandes dans un dossier temporaire."""
+    from epicevents.utils.metrics import metrics
+    monkeypatch.setattr(metrics, "log_path", tmp_path / ".metrics.jsonl")
+    monkeypatch.setattr(metrics, "prom_path", None)
+    return metrics
+
+
 @pytest.fixture
 def setup_db_tables():
     """Crée les tables nécessaires dans la base de données en mémoire."""
@@ -44,10 +64,10 @@ def setup_db_tables():
         test_db.connect()
     
     # Supprimer les tables si elles existent déjà
-    test_db.drop_tables([Event, Contract, Customer, Company, User, Role], safe=True)
+    test_db.drop_tables([Checkpoint, Tombstone, Event, Contract, Customer, Company, User, Role], safe=True)
     
     # Créer les tables nécessaires pour les tests
-    test_db.create_tables([Role, User, Company, Customer, Contract, Event])
+    test_db.create_tables([Role, User, Company, Customer, Contract, Event, Tombstone, Checkpoint])
     
     # Configurer la variable d'environnement pour le test
     import os
@@ -140,6 +160,36 @@ def runner():
     return CliRunner()
 
 
+# Helper pour enregistrer les requêtes SQL exécutées dans un bloc
+@contextmanager
+def record_queries():
+    """Enregistre les requêtes (sql, params) exécutées sur la base de test."""
+    executed = []
+    original_execute_sql = test_db.execute_sql
+
+    def recording_execute_sql(sql, params=None, *args, **kwargs):
+        executed.append((sql, params))
+        return original_execute_sql(sql, params, *args, **kwargs)
+
+    test_db.execute_sql = recording_execute_sql
+    try:
+        yield executed
+    finally:
+        del test_db.execute_sql
+
+
+# Helper pour borner le nombre de requêtes SQL d'un bloc
+@contextmanager
+def max_queries(limit: int):
+    """Échoue si le bloc exécute plus de `limit` requêtes (détecte les N+1)."""
+    with record_queries() as executed:
+        yield executed
+
+    if len(executed) > limit:
+        statements = "\n".join(f"  {sql} {params}" for sql, params in executed)
+        raise AssertionError(f"{len(executed)} requêtes exécutées, maximum autorisé : {limit}\n{statements}")
+
+
 # Classes de simulation
 class MockRole:
     def __init__(self, name, id):
@@ -1,5 +1,7 @@
 import os
+import json
 import pytest
+from datetime import datetime
 from typer.testing import CliRunner
 from epicevents.cli.contracts import app
 from epicevents.models.contract import Contract
@@ -9,6 +11,7 @@ from epicevents.models.company import Company
 from epicevents.models.role import Role
 from epicevents.models.database import BaseModel
 from peewee import DoesNotExist
+from tests.conftest import record_queries
 
 
 @pytest.fixture
@@ -233,3 +236,133 @@ def test_create_contract_invalid_customer(runner, create_test_data, monkeypatch)
     
     # Vérifier que la commande affiche une erreur appropriée
     assert f"Le client ID {invalid_customer_id} n'existe pas" in result.stdout
+
+
+def test_cli_reassign_contracts(runner, create_test_data, monkeypatch):
+    """Test la réattribution en masse des contrats d'un gestionnaire."""
+    # Données de test
+    data = create_test_data
+    manager = data["manager"]
+    contract = data["contract"]
+
+    # Créer un second gestionnaire
+    manager2 = User.create(
+        username="manager2",
+        email="manager2@epicevents.com",
+        first_name="Manager",
+        last_name="Two",
+        phone="0123456780",
+        password="password123",
+        role=data["management_role"]
+    )
+
+    # Exécuter la commande de réattribution des contrats non réglés
+    result = runner.invoke(
+        app,
+        ["reassign", "--from", str(manager.id), "--to", str(manager2.id), "--due"],
+        obj=manager
+    )
+
+    # Vérifier que la commande s'est exécutée avec succès
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert "1 contrat(s) réattribué(s)" in result.stdout
+    assert Contract.get_by_id(contract.id).team_contact_id.id == manager2.id
+
+    # Un commercial ne peut pas gérer de contrats
+    result_invalid = runner.invoke(
+        app,
+        ["reassign", "--from", str(manager2.id), "--to", str(data["sales_user"].id)],
+        obj=manager
+    )
+
+    assert result_invalid.exit_code == 1
+    assert "Gestionnaire" in result_invalid.stdout
+
+
+def test_cli_read_contract_single_query(runner, create_test_data, monkeypatch):
+    """Test que la lecture d'un contrat ne coûte qu'une requête."""
+    # Données de test
+    data = create_test_data
+    manager = data["manager"]
+    contract = data["contract"]
+
+    # Exécuter la commande en enregistrant les requêtes
+    with record_queries() as queries:
+        result = runner.invoke(app, ["read", str(contract.id)], obj=manager)
+
+    # Vérifier l'affichage des contacts et le nombre de requêtes
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert "Manager TEST" in result.stdout
+    assert "Sales TEST" in result.stdout
+    assert len(queries) == 1
+
+
+def test_cli_report_contracts(runner, create_test_data, monkeypatch):
+    """Test le rapport des contrats regroupés en une seule requête."""
+    # Données de test
+    data = create_test_data
+    manager = data["manager"]
+    customer = data["customer"]
+
+    # Un contrat non signé (inséré sans passer par la validation de save)
+    Contract.insert(
+        customer=customer, signed=False, amount_total=300.0, amount_due=300.0,
+        date_created=datetime(2020, 1, 15), date_updated=datetime(2020, 1, 15)
+    ).execute()
+
+    rows = list(Contract.report("rep"))
+    assert len(rows) == 1
+    assert rows[0]["id"] == data["sales_user"].id
+    assert (rows[0]["signed_count"], rows[0]["unsigned_count"]) == (1, 1)
+    assert (rows[0]["billed"], rows[0]["outstanding"], rows[0]["unsigned_total"]) == (1000.0, 500.0, 300.0)
+
+    # Fenêtre de dates : seul le contrat de 2020 reste
+    rows = list(Contract.report("month", datetime(2020, 1, 1), datetime(2020, 2, 1)))
+    assert len(rows) == 1
+    assert str(rows[0]["month"]).startswith("2020-01")
+    assert rows[0]["billed"] == 0
+
+    # Via la CLI, en une requête
+    with record_queries() as queries:
+        result = runner.invoke(app, ["report", "--by", "company"], obj=manager)
+
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert len(queries) == 1
+    assert "Test Company" in result.stdout
+
+    # Regroupement ou date invalide
+    result_invalid = runner.invoke(app, ["report", "--by", "year"], obj=manager)
+    assert result_invalid.exit_code == 1
+    assert "invalide" in result_invalid.stdout
+    result_date = runner.invoke(app, ["report", "--from", "15/01/2020"], obj=manager)
+    assert result_date.exit_code == 1
+    assert "Date invalide" in result_date.stdout
+
+
+def test_cli_aging_contracts(runner, create_test_data, monkeypatch):
+    """Test la balance âgée des montants dus en JSON, CSV et tableau."""
+    # Données de test
+    data = create_test_data
+    manager = data["manager"]
+    customer = data["customer"]
+
+    # Sortie JSON : le contrat de test (500 dûs) a moins de 30 jours
+    result = runner.invoke(app, ["aging", "--format", "json"], obj=manager)
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    records = json.loads(result.stdout)
+    assert records[0]["group_id"] == customer.id
+    assert records[0]["0-30"] == 500.0
+    assert records[0]["due_ratio"] == 0.5
+
+    # Sortie CSV par commercial
+    result_csv = runner.invoke(app, ["aging", "--by", "rep", "--format", "csv"], obj=manager)
+    assert result_csv.exit_code == 0, f"Erreur: {result_csv.stdout}"
+    assert result_csv.stdout.splitlines()[0].startswith("group_id,group,contracts,0-30")
+
+    # Tableau
+    result_rich = runner.invoke(app, ["aging"], obj=manager)
+    assert "Balance âgée" in result_rich.stdout
+
+    # Format invalide
+    result_invalid = runner.invoke(app, ["aging", "--format", "xml"], obj=manager)
+    assert result_invalid.exit_code == 1
@@ -1,4 +1,5 @@
 import os
+import json
 import pytest
 from datetime import datetime
 from typer.testing import CliRunner
@@ -9,6 +10,7 @@ from epicevents.models.user import User
 from epicevents.models.role import Role
 from epicevents.models.database import BaseModel
 from peewee import DoesNotExist
+from tests.conftest import record_queries
 
 
 @pytest.fixture
@@ -251,3 +253,115 @@ def test_list_customers_filtered_no_result(runner, create_test_data, monkeypatch
     
     # Vérifier qu'un message d'absence de clients est affiché
     assert "Aucun client" in result.stdout or "aucun client" in result.stdout.lower()
+
+
+def test_cli_reassign_customers(runner, create_test_data, monkeypatch):
+    """Test la réattribution en masse des clients d'un commercial."""
+    # Données de test
+    data = create_test_data
+    sales_user = data["sales_user"]
+    sales_user2 = data["sales_user2"]
+    customer = data["customer"]
+
+    # Exécuter la commande de réattribution
+    result = runner.invoke(
+        app,
+        ["reassign", "--from", str(sales_user.id), "--to", str(sales_user2.id), "-c", "Test Company"],
+        obj=sales_user
+    )
+
+    # Vérifier que la commande s'est exécutée avec succès
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert "1 client(s) réattribué(s)" in result.stdout
+    assert Customer.get_by_id(customer.id).team_contact_id.id == sales_user2.id
+
+    # Un utilisateur non commercial est refusé
+    support_user = User.create(
+        username="support",
+        email="support@epicevents.com",
+        first_name="Support",
+        last_name="User",
+        phone="0123456787",
+        password="password123",
+        role=data["support_role"]
+    )
+    result_invalid = runner.invoke(
+        app,
+        ["reassign", "--from", str(sales_user2.id), "--to", str(support_user.id)],
+        obj=sales_user
+    )
+
+    assert result_invalid.exit_code == 1
+    assert "Commercial" in result_invalid.stdout
+    assert Customer.get_by_id(customer.id).team_contact_id.id == sales_user2.id
+
+
+def test_cli_read_customer_single_query(runner, create_test_data, monkeypatch):
+    """Test que la lecture d'un client ne coûte qu'une requête."""
+    # Données de test
+    data = create_test_data
+    sales_user = data["sales_user"]
+    customer = data["customer"]
+
+    # Exécuter la commande en enregistrant les requêtes
+    with record_queries() as queries:
+        result = runner.invoke(app, ["read", str(customer.id)], obj=sales_user)
+
+    # Vérifier l'affichage et le nombre de requêtes
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert "Test Company" in result.stdout
+    assert "Sales USER" in result.stdout
+    assert len(queries) == 1
+
+
+def test_cli_view_customer(runner, create_test_data, monkeypatch):
+    """Test la vue 360 d'un client : contrats et événements en arbre, en 3 requêtes."""
+    from datetime import timedelta
+    from epicevents.models.contract import Contract
+    from epicevents.models.event import Event
+
+    # Données de test
+    data = create_test_data
+    sales_user = data["sales_user"]
+    customer = data["customer"]
+    manager = User.create(
+        username="manager", email="manager@epicevents.com", first_name="Manager", last_name="User",
+        phone="0123456787", password="password123", role=data["management_role"]
+    )
+    support = User.create(
+        username="support", email="support@epicevents.com", first_name="Support", last_name="User",
+        phone="0123456786", password="password123", role=data["support_role"]
+    )
+    contract = Contract.create(
+        customer=customer, signed=True, amount_total=1000.0, amount_due=250.0, team_contact_id=manager
+    )
+    Contract.create(customer=customer, signed=True, amount_total=300.0, amount_due=0.0)
+    Event.create(
+        contract=contract, name="Gala", location="Lyon", event_date=datetime.now() + timedelta(days=5),
+        attendees=80, team_contact_id=support
+    )
+
+    # JSON : arbre complet
+    with record_queries() as queries:
+        result = runner.invoke(app, ["view", str(customer.id), "--json"], obj=sales_user)
+
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert len(queries) == 3
+    tree = json.loads(result.stdout)
+    assert tree["company"]["name"] == "Test Company"
+    assert tree["sales_contact"]["id"] == sales_user.id
+    assert [item["id"] for item in tree["contracts"]] == [contract.id, contract.id + 1]
+    assert tree["contracts"][0]["manager"]["id"] == manager.id
+    assert tree["contracts"][0]["events"][0]["support"]["id"] == support.id
+    assert tree["contracts"][1]["manager"] is None
+    assert tree["contracts"][1]["events"] == []
+
+    # Arbre
+    result_tree = runner.invoke(app, ["view", str(customer.id)], obj=sales_user)
+    assert result_tree.exit_code == 0, f"Erreur: {result_tree.stdout}"
+    assert "Contrats (2)" in result_tree.stdout
+    assert "Gala" in result_tree.stdout
+
+    # Client inexistant
+    result_missing = runner.invoke(app, ["view", "999"], obj=sales_user)
+    assert "n'existe pas" in result_missing.stdout
@@ -0,0 +1,61 @@
+import pytest
+from datetime import datetime, timedelta
+from epicevents.cli.dashboard import app
+from epicevents.models.database import BaseModel
+from epicevents.models.role import Role
+from epicevents.models.user import User
+from epicevents.models.company import Company
+from epicevents.models.customer import Customer
+from epicevents.models.contract import Contract
+from epicevents.permissions.auth import generate_token, remove_token
+
+
+def login(role_name: str) -> User:
+    """Connecte un utilisateur du rôle donné."""
+    user = User.create(
+        username=role_name, email=f"{role_name}@epicevents.com", first_name="Test", last_name="User",
+        phone="0123456789", password="password123", role=Role.get_or_create(name=role_name)[0]
+    )
+    generate_token(user)
+    return user
+
+
+@pytest.fixture
+def manager(setup_db_tables):
+    """Un gestionnaire connecté et un contrat signé à encaisser."""
+    customer = Customer.create(
+        email="client@example.com", first_name="Client", last_name="Test",
+        phone="0987654321", company=Company.create(name="ACME")
+    )
+    Contract.create(customer=customer, signed=True, amount_total=1000.0, amount_due=400.0)
+    yield login("management")
+    remove_token()
+
+
+def test_cli_dashboard(runner, manager):
+    """Test du tableau de bord via la CLI, avec indicateur de fraîcheur."""
+    result = runner.invoke(app, ["--refresh"])
+
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert "il y a 0 min" in result.stdout
+    assert "À encaisser" in result.stdout
+    assert "Chiffre d'affaires par mois" in result.stdout
+    assert "Clients sans commercial" in result.stdout
+
+    database = BaseModel._meta.database
+    database.execute_sql(
+        "UPDATE dashboard_refresh SET refreshed_at = ?", ((datetime.now() - timedelta(hours=2)).isoformat(" "),)
+    )
+    result_stale = runner.invoke(app, [])
+    assert "périmées" in result_stale.stdout
+
+
+def test_cli_dashboard_forbidden(runner, setup_db_tables):
+    """Le tableau de bord est réservé aux gestionnaires."""
+    login("support")
+
+    result = runner.invoke(app, [])
+
+    assert result.exit_code == 1
+    assert "autorisation" in result.stdout
+    remove_token()
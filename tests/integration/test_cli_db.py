@@ -0,0 +1,66 @@
+from epicevents.cli.db import app
+from epicevents.models.company import Company
+from epicevents.models.customer import Customer
+from epicevents.models.contract import Contract
+
+
+def test_cli_rebuild_rollups(runner, setup_db_tables):
+    """Test du recalcul des agrégats via la CLI."""
+    customer = Customer.create(
+        email="client@example.com", first_name="Client", last_name="Test",
+        phone="0987654321", company=Company.create(name="ACME")
+    )
+    Contract.insert(customer=customer, signed=True, amount_total=800.0, amount_due=300.0).execute()
+
+    result = runner.invoke(app, ["rebuild-rollups"])
+
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert "1 client(s) et 0 contrat(s) corrigé(s)" in result.stdout
+    assert Customer.get_by_id(customer.id).outstanding_total == 300.0
+
+
+def test_cli_upgrade(runner, setup_db_tables):
+    """Test de la mise à jour d'une base créée avant le flux de changements."""
+    database = setup_db_tables
+    database.execute_sql('DROP TABLE "tombstone"')
+    database.execute_sql('DROP INDEX "event_date_updated_id"')
+
+    result = runner.invoke(app, ["upgrade"])
+
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert "à jour" in result.stdout
+    assert database.table_exists("tombstone")
+    assert "event_date_updated_id" in [index.name for index in database.get_indexes("event")]
+
+
+def test_cli_upgrade_search_index(runner, setup_db_tables):
+    """Test de la mise à jour d'une base créée avant la recherche globale."""
+    database = setup_db_tables
+    database.execute_sql("DROP TABLE IF EXISTS search_index")
+    company = Company.create(name="Dupont Traiteur")
+
+    result = runner.invoke(app, ["upgrade"])
+
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    # Index créé et rempli par la mise à jour, avant toute recherche
+    rows = database.execute_sql("SELECT kind, ref_id FROM search_index WHERE search_index MATCH 'dupont'").fetchall()
+    assert rows == [("company", company.id)]
+    triggers = database.execute_sql(
+        "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%_search_a_'"
+    ).fetchone()[0]
+    assert triggers == 9
+
+
+def test_cli_upgrade_dashboard_views(runner, setup_db_tables):
+    """Test de la mise à jour d'une base créée avant le tableau de bord."""
+    from epicevents.utils.dashboard import DASHBOARD_VIEWS
+    database = setup_db_tables
+    for name in ["dashboard_refresh", *DASHBOARD_VIEWS]:
+        database.execute_sql(f"DROP TABLE IF EXISTS {name}")
+
+    result = runner.invoke(app, ["upgrade"])
+
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert all(database.table_exists(name) for name in ["dashboard_refresh", *DASHBOARD_VIEWS])
+    refreshed = database.execute_sql("SELECT COUNT(*) FROM dashboard_refresh").fetchone()[0]
+    assert refreshed == len(DASHBOARD_VIEWS)
@@ -136,6 +136,9 @@ def test_debug_permissions_ok(runner, create_test_data, monkeypatch):
 
     # Authentifier l'utilisateur en générant un token
     token = generate_token(admin_user)
+
+    # Quitter la pagination après la première page
+    monkeypatch.setattr("epicevents.cli.utils.keyboard.is_pressed", lambda key: key == "escape")
     
     # Exécuter la commande
     result = runner.invoke(app, ["permissions"], obj=admin_user)
@@ -144,3 +147,72 @@ def test_debug_permissions_ok(runner, create_test_data, monkeypatch):
     assert result.exit_code == 0, f"Erreur: {result.stdout}"
     assert "permissions disponibles" in result.stdout.lower()
 
+
+def test_debug_metrics(runner, create_test_data, metrics_files):
+    """Test du résumé des métriques (p50/p95/p99 par commande)."""
+    data = create_test_data
+    admin_user = data["users"]["admin"]
+
+    # Journal vide
+    result_empty = runner.invoke(app, ["metrics"], obj=admin_user)
+    assert "aucune mesure" in result_empty.stdout.lower()
+
+    # Journal avec quelques appels
+    with metrics_files.log_path.open("w") as log:
+        for duration in [0.1, 0.2, 0.3]:
+            log.write(json.dumps({
+                "ts": datetime.now().timestamp(), "command": "customer.list", "status": "ok",
+                "duration": duration, "db_time": 0.05, "queries": 2,
+                "counters": {'permission_denied{resource="customer",role="support"}': 1}
+            }) + "\n")
+
+    result = runner.invoke(app, ["metrics", "--since", "1"], obj=admin_user)
+
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert "customer.list" in result.stdout
+    assert "200.0" in result.stdout
+    assert "permission_denied" in result.stdout
+
+
+def test_debug_explain(runner, create_test_data):
+    """Test du plan d'exécution de la requête d'une commande list."""
+    data = create_test_data
+    admin_user = data["users"]["admin"]
+
+    result = runner.invoke(app, ["explain", "customer", "list", "--fi"], obj=admin_user)
+
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert "plan d'exécution" in result.stdout.lower()
+    assert '"customer"' in result.stdout
+
+    # Ressource invalide
+    result_invalid = runner.invoke(app, ["explain", "company", "list"], obj=admin_user)
+    assert result_invalid.exit_code == 1
+    assert "invalide" in result_invalid.stdout
+
+
+def test_debug_explain_sales(runner, create_test_data, monkeypatch):
+    """Un commercial peut voir le plan de sa liste filtrée sur ses clients."""
+    from epicevents.cli import init_cli
+    data = create_test_data
+    sales_user = data["users"]["sales"]
+    monkeypatch.setattr("epicevents.permissions.auth.is_logged", lambda: sales_user)
+
+    # Via le callback du groupe, qui vérifie la permission debug explain
+    result = runner.invoke(init_cli(), ["debug", "explain", "customer", "list", "--fi"], obj={})
+
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert "plan d'exécution" in result.stdout.lower()
+    assert '"team_contact_id" = ' in result.stdout.replace("\n", "")
+
+
+def test_debug_doctor(runner, create_test_data):
+    """Test du diagnostic de la base de données."""
+    data = create_test_data
+    admin_user = data["users"]["admin"]
+
+    result = runner.invoke(app, ["doctor"], obj=admin_user)
+
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert "santé de la base" in result.stdout.lower()
+    assert "clés étrangères sans index" in result.stdout.lower()
@@ -1,3 +1,4 @@
+import json
 import pytest
 from datetime import datetime, timedelta
 from typer.testing import CliRunner
@@ -10,6 +11,7 @@ from epicevents.models.company import Company
 from epicevents.models.role import Role
 from epicevents.models.database import BaseModel
 from peewee import DoesNotExist
+from tests.conftest import record_queries
 
 
 @pytest.fixture
@@ -363,3 +365,260 @@ def test_list_events_empty(runner, create_test_data, monkeypatch):
     
     # Vérifier qu'un message approprié est affiché
     assert "aucun événement" in result.stdout.lower() or "aucun event" in result.stdout.lower()
+
+
+def test_cli_reassign_events(runner, create_test_data, monkeypatch):
+    """Test la réattribution en masse des événements d'un support."""
+    # Données de test
+    data = create_test_data
+    manager_user = data["users"]["manager"]
+    support_user = data["users"]["support"]
+    event1 = data["events"]["event1"]
+    event2 = data["events"]["event2"]
+
+    # Créer un second support
+    support_user2 = User.create(
+        username="support2",
+        email="support2@epicevents.com",
+        first_name="Support",
+        last_name="Two",
+        phone="0123456785",
+        password="password123",
+        role=data["roles"]["support"]
+    )
+
+    # Réattribuer uniquement les événements du premier contrat
+    result = runner.invoke(
+        app,
+        [
+            "reassign",
+            "--from", str(support_user.id),
+            "--to", str(support_user2.id),
+            "-ct", str(data["contracts"]["contract1"].id),
+            "--future"
+        ],
+        obj=manager_user
+    )
+
+    # Vérifier que la commande s'est exécutée avec succès
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert "1 événement(s) réattribué(s)" in result.stdout
+    assert Event.get_by_id(event1.id).team_contact_id.id == support_user2.id
+    assert Event.get_by_id(event2.id).team_contact_id.id == support_user.id
+
+
+def test_cli_read_event_single_query(runner, create_test_data, monkeypatch):
+    """Test que la lecture d'un événement ne coûte qu'une requête."""
+    # Données de test
+    data = create_test_data
+    support_user = data["users"]["support"]
+    event = data["events"]["event1"]
+
+    # Exécuter la commande en enregistrant les requêtes
+    with record_queries() as queries:
+        result = runner.invoke(app, ["read", str(event.id)], obj=support_user)
+
+    # Vérifier l'affichage des contacts et le nombre de requêtes
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert "Manager USER" in result.stdout
+    assert "Sales USER" in result.stdout
+    assert "Support USER" in result.stdout
+    assert len(queries) == 1
+
+
+def test_cli_read_multiple_events(runner, create_test_data, monkeypatch):
+    """Test la lecture de plusieurs événements (IDs et plages) en une requête."""
+    # Données de test
+    data = create_test_data
+    support_user = data["users"]["support"]
+    event1 = data["events"]["event1"]
+    event2 = data["events"]["event2"]
+
+    # Exécuter la commande avec une plage et un ID inexistant
+    with record_queries() as queries:
+        result = runner.invoke(app, ["read", f"{event1.id}-{event2.id}", "9999"], obj=support_user)
+
+    # Vérifier l'affichage groupé et le nombre de requêtes
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert "Événements (2)" in result.stdout
+    assert "Conference" in result.stdout
+    assert "Workshop" in result.stdout
+    assert "introuvable(s) : 9999" in result.stdout
+    assert len(queries) == 1
+
+    # Sortie JSONL : une ligne par événement
+    result_jsonl = runner.invoke(app, ["read", str(event1.id), str(event2.id), "--jsonl"], obj=support_user)
+
+    assert result_jsonl.exit_code == 0, f"Erreur: {result_jsonl.stdout}"
+    lines = [json.loads(line) for line in result_jsonl.stdout.strip().splitlines()]
+    assert [line["event_id"] for line in lines] == [event1.id, event2.id]
+    assert lines[0]["contract"]["customer"]["company"] == "ACME"
+
+    # ID invalide
+    result_invalid = runner.invoke(app, ["read", "abc"], obj=support_user)
+    assert "invalide" in result_invalid.stdout
+
+
+def test_cli_events_workload(runner, create_test_data, monkeypatch):
+    """Test la charge des supports et la liste des événements sans support."""
+    # Données de test
+    data = create_test_data
+    manager_user = data["users"]["manager"]
+    support_user = data["users"]["support"]
+
+    # Un événement dans 3 jours, sans support (la conférence tombe dans les 30 jours)
+    Event.create(
+        contract=data["contracts"]["contract1"], name="Cocktail", location="Nice",
+        event_date=datetime.now() + timedelta(days=3), attendees=20
+    )
+
+    rows = list(Event.workload())
+    assert rows == [{
+        "id": support_user.id, "first_name": "Support", "last_name": "User",
+        "upcoming": 2, "attendees": 150, "next_7_days": 0, "next_30_days": 1,
+    }]
+    assert [event.name for event in Event.unassigned()] == ["Cocktail"]
+
+    # Via la CLI, en deux requêtes
+    with record_queries() as queries:
+        result = runner.invoke(app, ["workload"], obj=manager_user)
+
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert len(queries) == 2
+    assert "Charge des supports" in result.stdout
+    assert "Cocktail" in result.stdout
+
+
+def test_cli_auto_assign_events(runner, create_test_data, monkeypatch):
+    """Test l'attribution automatique des événements sans support."""
+    # Données de test
+    data = create_test_data
+    manager_user = data["users"]["manager"]
+
+    # Un second support libre et deux événements sans support
+    support_user2 = User.create(
+        username="support2", email="support2@epicevents.com", first_name="Support", last_name="Two",
+        phone="0123456785", password="password123", role=data["roles"]["support"]
+    )
+    cocktail = Event.create(
+        contract=data["contracts"]["contract1"], name="Cocktail", location="Nice",
+        event_date=datetime.now() + timedelta(days=3), attendees=20
+    )
+    gala = Event.create(
+        contract=data["contracts"]["contract2"], name="Gala", location="Paris",
+        event_date=datetime.now() + timedelta(days=60), attendees=200
+    )
+
+    # Simulation : rien n'est enregistré
+    result_dry = runner.invoke(app, ["auto-assign", "--dry-run"], obj=manager_user)
+    assert result_dry.exit_code == 0, f"Erreur: {result_dry.stdout}"
+    assert "Simulation" in result_dry.stdout
+    assert Event.get_by_id(cocktail.id).team_contact_id is None
+
+    # Le support libre prend le cocktail ; le gala est hors de l'horizon de 30 jours
+    result = runner.invoke(app, ["auto-assign", "--window", "30d"], obj=manager_user)
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert "1 événement(s) attribué(s)" in result.stdout
+    assert Event.get_by_id(cocktail.id).team_contact_id.id == support_user2.id
+    assert Event.get_by_id(gala.id).team_contact_id is None
+
+    # Horizon invalide
+    result_invalid = runner.invoke(app, ["auto-assign", "--window", "un mois"], obj=manager_user)
+    assert result_invalid.exit_code == 1
+
+
+def test_event_schedule_conflicts(runner, create_test_data, monkeypatch):
+    """Test le refus d'un événement qui chevauche le planning du support, et le rapport des conflits."""
+    # Données de test
+    data = create_test_data
+    manager_user = data["users"]["manager"]
+    support_user = data["users"]["support"]
+    event1 = data["events"]["event1"]
+
+    # Même support, une heure après la conférence : refusé
+    with pytest.raises(ValueError, match="déjà l'événement"):
+        Event.create(
+            contract=data["contracts"]["contract1"], name="Afterwork", location="Paris",
+            event_date=event1.event_date + timedelta(hours=1), attendees=20, team_contact_id=support_user
+        )
+
+    # Sans support, puis déplacé le lendemain : accepté
+    afterwork = Event.create(
+        contract=data["contracts"]["contract1"], name="Afterwork", location="Paris",
+        event_date=event1.event_date + timedelta(hours=1), attendees=20
+    )
+    afterwork.event_date = event1.event_date + timedelta(days=1)
+    afterwork.team_contact_id = support_user
+    afterwork.save()
+
+    result_ok = runner.invoke(app, ["conflicts"], obj=manager_user)
+    assert result_ok.exit_code == 0, f"Erreur: {result_ok.stdout}"
+    assert "Aucun conflit" in result_ok.stdout
+
+    # Un conflit inséré sans validation est détecté
+    Event.update(event_date=event1.event_date + timedelta(hours=2)).where(Event.id == afterwork.id).execute()
+    assert Event.conflicts() == [(support_user.id, event1.id, afterwork.id)]
+
+    result = runner.invoke(app, ["conflicts"], obj=manager_user)
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert "Conflits de planning (1)" in result.stdout
+
+
+def test_event_assign_bulk_rejects_overlap(create_test_data):
+    """L'attribution groupée vérifie le planning comme une sauvegarde unitaire."""
+    # Données de test
+    data = create_test_data
+    support_user = data["users"]["support"]
+    event1 = data["events"]["event1"]
+
+    # Un événement sans support, une heure après la conférence du même support
+    afterwork = Event.create(
+        contract=data["contracts"]["contract1"], name="Afterwork", location="Paris",
+        event_date=event1.event_date + timedelta(hours=1), attendees=20
+    )
+
+    with pytest.raises(ValueError, match=f"déjà l'événement {event1.id}"):
+        Event.assign_bulk({afterwork.id: support_user.id})
+    assert Event.get_by_id(afterwork.id).team_contact_id is None
+
+    # Le lendemain : accepté
+    Event.update(event_date=event1.event_date + timedelta(days=1)).where(Event.id == afterwork.id).execute()
+    assert Event.assign_bulk({afterwork.id: support_user.id}) == 1
+
+
+def test_cli_events_calendar(runner, create_test_data, monkeypatch):
+    """Test le calendrier des événements groupés par jour et par semaine."""
+    # Données de test
+    data = create_test_data
+    support_user = data["users"]["support"]
+    event1 = data["events"]["event1"]
+    day = event1.event_date.strftime("%Y-%m-%d")
+
+    # Une seule requête, jour par jour
+    with record_queries() as queries:
+        result = runner.invoke(app, ["calendar", "--from", day, "--to", day], obj=support_user)
+
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert len(queries) == 1
+    assert f"{day} (1)" in result.stdout
+    assert "Conference" in result.stdout
+    assert "Workshop" not in result.stdout
+
+    # Par semaine, filtré sur le support, sur toute la période
+    result_week = runner.invoke(
+        app,
+        ["calendar", "--to", data["events"]["event2"].event_date.strftime("%Y-%m-%d"),
+         "--by", "week", "--user", str(support_user.id)],
+        obj=support_user
+    )
+    assert result_week.exit_code == 0, f"Erreur: {result_week.stdout}"
+    assert "Semaine" in result_week.stdout
+    assert "Workshop" in result_week.stdout
+
+    # Aucun événement dans les 7 prochains jours
+    result_empty = runner.invoke(app, ["calendar"], obj=support_user)
+    assert "Aucun événement" in result_empty.stdout
+
+    # Date invalide
+    result_invalid = runner.invoke(app, ["calendar", "--from", "demain"], obj=support_user)
+    assert result_invalid.exit_code == 1
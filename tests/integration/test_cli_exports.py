@@ -0,0 +1,47 @@
+import json
+from datetime import datetime, timedelta
+from epicevents.cli.exports import app
+from epicevents.models.company import Company
+from epicevents.models.customer import Customer
+from epicevents.models.checkpoint import Checkpoint
+
+
+def test_cli_export_changes(runner, setup_db_tables):
+    """Test de l'export des changements via la CLI, avec point de reprise."""
+    customer = Customer.create(
+        email="client@example.com", first_name="Client", last_name="Test",
+        phone="0987654321", company=Company.create(name="ACME")
+    )
+    # Hors du délai de stabilisation des dernières secondes
+    Customer.update(date_updated=datetime.now() - timedelta(minutes=1)).execute()
+
+    result = runner.invoke(app, ["--since", "2025-01-01", "--checkpoint", "mailing"])
+
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    changes = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [(change["kind"], change["op"], change["id"]) for change in changes] == [("customer", "upsert", customer.id)]
+    assert changes[0]["data"]["email"] == "client@example.com"
+    assert Checkpoint.get(Checkpoint.name == "mailing", Checkpoint.kind == "customer").last_id == customer.id
+
+    result_resumed = runner.invoke(app, ["--since", "mailing", "--format", "rich"])
+    assert "Aucun changement depuis mailing" in result_resumed.stdout
+    assert "Point de reprise 'mailing' enregistré" in result_resumed.stdout
+
+    result_invalid = runner.invoke(app, ["--since", "mailing", "--format", "xml"])
+    assert result_invalid.exit_code == 1
+
+
+def test_cli_export_changes_invalid_since(runner, setup_db_tables):
+    """Une date invalide ou un point de reprise inconnu est refusé, sauf création explicite."""
+    result_date = runner.invoke(app, ["--since", "2025-13-01"])
+    assert result_date.exit_code == 1
+    assert "Date '2025-13-01' invalide" in result_date.stdout
+
+    result_unknown = runner.invoke(app, ["--since", "compta"])
+    assert result_unknown.exit_code == 1
+    assert "Point de reprise 'compta' inconnu" in result_unknown.stdout
+    assert not Checkpoint.select().exists()
+
+    result_created = runner.invoke(app, ["--since", "compta", "--checkpoint", "compta", "--format", "rich"])
+    assert result_created.exit_code == 0, f"Erreur: {result_created.stdout}"
+    assert "Point de reprise 'compta' enregistré" in result_created.stdout
@@ -0,0 +1,99 @@
+import pytest
+from datetime import datetime, timedelta
+from typer.testing import CliRunner
+from epicevents.models.role import Role
+from epicevents.models.user import User
+from epicevents.models.company import Company
+from epicevents.models.customer import Customer
+from epicevents.models.contract import Contract
+from epicevents.models.event import Event
+from epicevents.cli import users, customers, contracts, events
+from tests.conftest import max_queries
+
+
+# (sous-application, commande, rôle de l'utilisateur, budget de requêtes)
+# Les budgets ne dépendent pas du volume : toute requête par ligne les dépasse.
+BUDGETS = [
+    (users.app, ["list"], "admin", 2),
+    (users.app, ["list", "--fi"], "management", 2),
+    (users.app, ["read", "{sales_id}"], "admin", 1),
+    (users.app, ["update", "{sales_id}", "-ph", "0600000000"], "admin", 4),
+    (customers.app, ["list"], "sales", 2),
+    (customers.app, ["list", "--fi"], "sales", 2),
+    (customers.app, ["read", "{customer_id}"], "sales", 1),
+    (customers.app, ["update", "{customer_id}", "-p", "0600000000"], "sales", 4),
+    (contracts.app, ["list"], "management", 1),
+    (contracts.app, ["list", "--fi"], "management", 1),
+    (contracts.app, ["read", "{contract_id}"], "management", 1),
+    (contracts.app, ["update", "{contract_id}", "-sd", "0"], "management", 4),
+    (contracts.app, ["report", "--by", "rep"], "management", 1),
+    (contracts.app, ["report", "--by", "month", "--from", "2000-01-01"], "management", 1),
+    (events.app, ["list"], "support", 2),
+    (events.app, ["list", "--fi"], "support", 2),
+    (events.app, ["read", "{event_id}"], "support", 1),
+    (events.app, ["update", "{event_id}", "-a", "120"], "support", 4),
+    (events.app, ["workload"], "management", 2),
+]
+
+
+@pytest.fixture
+def runner():
+    return CliRunner()
+
+
+@pytest.fixture(params=[5, 50], ids=["5_clients", "50_clients"])
+def create_volume(request, setup_db_tables, monkeypatch):
+    """Crée N clients, chacun avec un contrat signé et un événement."""
+    monkeypatch.setattr("epicevents.cli.utils.keyboard.is_pressed", lambda key: key == "escape")
+
+    users_by_role = {}
+    for index, role_name in enumerate(["admin", "management", "sales", "support"]):
+        users_by_role[role_name] = User.create(
+            username=role_name, email=f"{role_name}@epicevents.com", first_name=role_name.capitalize(),
+            last_name="User", phone=f"012345678{index}", password="password123",
+            role=Role.create(name=role_name)
+        )
+
+    for index in range(request.param):
+        customer = Customer.create(
+            email=f"client{index}@example.com", first_name="Client", last_name="Test", phone="0987654321",
+            company=Company.create(name=f"Company {index}"), team_contact_id=users_by_role["sales"]
+        )
+        contract = Contract.create(
+            customer=customer, signed=True, amount_total=1000.0, amount_due=500.0,
+            team_contact_id=users_by_role["management"] if index % 2 else None
+        )
+        Event.create(
+            contract=contract, name=f"Event {index}", location="Paris",
+            event_date=datetime.now() + timedelta(days=30 + index), attendees=100,
+            team_contact_id=users_by_role["support"]
+        )
+
+    return {
+        "users": users_by_role,
+        "ids": {
+            "sales_id": users_by_role["sales"].id,
+            "customer_id": customer.id,
+            "contract_id": contract.id,
+            "event_id": Event.select().order_by(Event.id.desc()).first().id,
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "sub_app, template, role, budget",
+    BUDGETS,
+    ids=[
+        f"{app.registered_commands[0].callback.__module__.split('.')[-1]} {' '.join(template)}"
+        for app, template, _, _ in BUDGETS
+    ],
+)
+def test_cli_query_budget(runner, create_volume, sub_app, template, role, budget):
+    """Chaque commande respecte son budget de requêtes, quel que soit le volume."""
+    args = [arg.format(**create_volume["ids"]) for arg in template]
+    user = User.select_detailed().where(User.username == role).get()
+
+    with max_queries(budget):
+        result = runner.invoke(sub_app, args, obj=user)
+
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
@@ -0,0 +1,42 @@
+import pytest
+from epicevents.cli.search import app
+from epicevents.models.role import Role
+from epicevents.models.user import User
+from epicevents.models.company import Company
+from epicevents.permissions.auth import generate_token, remove_token
+
+
+@pytest.fixture
+def logged_user(setup_db_tables):
+    """Un utilisateur support connecté."""
+    user = User.create(
+        username="support", email="support@epicevents.com", first_name="Support", last_name="User",
+        phone="0123456789", password="password123", role=Role.create(name="support")
+    )
+    generate_token(user)
+    yield user
+    remove_token()
+
+
+def test_cli_search(runner, logged_user):
+    """Test de la recherche globale via la CLI."""
+    Company.create(name="Dupont Traiteur")
+
+    result = runner.invoke(app, ["Dupont", "Lyon"])
+
+    assert result.exit_code == 0, f"Erreur: {result.stdout}"
+    assert "Entreprise" in result.stdout
+    assert "Dupont Traiteur" in result.stdout
+
+    result_empty = runner.invoke(app, ["Martin"])
+    assert "Aucun résultat" in result_empty.stdout
+
+
+def test_cli_search_requires_login(runner, setup_db_tables):
+    """La recherche exige d'être connecté."""
+    remove_token()
+
+    result = runner.invoke(app, ["Dupont"])
+
+    assert result.exit_code == 1
+    assert "connecté" in result.stdout
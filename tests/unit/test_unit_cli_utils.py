@@ -2,6 +2,7 @@ import pytest
 from epicevents.cli.utils import welcome_user
 from epicevents.cli.utils import display_list
 from epicevents.cli.utils import format_text
+from epicevents.cli.utils import parse_ids
 
 
 def test_format_text_color_fallback():
@@ -28,3 +29,12 @@ def test_welcome_user(capsys):
     
     # Vérifier que le texte attendu est bien présent dans la sortie
     assert "WELCOME TO EPICEVENTS" in captured.out
+
+
+def test_parse_ids():
+    ids, ranges = parse_ids(["12", "15", "40-20"])
+    assert ids == [12, 15]
+    assert ranges == [(20, 40)]
+
+    with pytest.raises(ValueError):
+        parse_ids(["12-abc"])
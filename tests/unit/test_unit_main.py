@@ -4,7 +4,7 @@ import sentry_sdk
 import epicevents.__main__
 from epicevents.__main__ import sentry_init, main
 from epicevents.cli import init_cli, app
-from epicevents.config import SENTRY_DSN, SENTRY_ENV
+from epicevents.config import SENTRY_DSN, SENTRY_ENV, SENTRY_TRACES_SAMPLE_RATE
 
 
 def test_sentry_init(monkeypatch):
@@ -33,7 +33,7 @@ def test_sentry_init(monkeypatch):
     assert init_called[0][1] == {
         "dsn": "https://real-dsn.sentry.io/123",
         "environment": SENTRY_ENV,
-        "traces_sample_rate": 0.0
+        "traces_sample_rate": SENTRY_TRACES_SAMPLE_RATE
     }
 
 
@@ -144,8 +144,8 @@ def test_init_cli():
         # Vérifier que la fonction retourne l'instance app
         assert result is app, "init_cli devrait retourner l'instance app"
         
-        # Vérifier qu'il y a 5 appels à add_typer (un pour chaque sous-commande)
-        assert len(add_typer_calls) == 5, f"Attendu 5 appels à add_typer, obtenu {len(add_typer_calls)}"
+        # Vérifier qu'il y a 7 appels à add_typer (un pour chaque sous-commande)
+        assert len(add_typer_calls) == 7, f"Attendu 7 appels à add_typer, obtenu {len(add_typer_calls)}"
         
         # Vérifier que chaque sous-commande a été ajoutée avec les bons paramètres
         expected_subcommands = [
@@ -153,7 +153,9 @@ def test_init_cli():
             {'name': 'customer', 'help': 'Gestion des clients'},
             {'name': 'contract', 'help': 'Gestion des contrats'},
             {'name': 'event', 'help': 'Gestion des événements'},
-            {'name': 'debug', 'help': 'Fonctions de debug'}
+            {'name': 'debug', 'help': 'Fonctions de debug'},
+            {'name': 'db', 'help': 'Maintenance de la base de données'},
+            {'name': 'export', 'help': 'Export des données'}
         ]
         
         # Vérifier que chaque sous-commande attendue est présente
@@ -172,13 +174,15 @@ def test_init_cli():
             assert found, f"Sous-commande {expected['name']} non trouvée ou avec des paramètres incorrects"
         
         # Vérifier que les modules sont bien importés en vérifiant que les sous-apps existent
-        from epicevents.cli import users, customers, contracts, events, debug
+        from epicevents.cli import users, customers, contracts, events, debug, db, exports
         
         assert add_typer_calls[0]['subapp'] is users.app, "La première sous-app devrait être users.app"
         assert add_typer_calls[1]['subapp'] is customers.app, "La deuxième sous-app devrait être customers.app"
         assert add_typer_calls[2]['subapp'] is contracts.app, "La troisième sous-app devrait être contracts.app"
         assert add_typer_calls[3]['subapp'] is events.app, "La quatrième sous-app devrait être events.app"
         assert add_typer_calls[4]['subapp'] is debug.app, "La cinquième sous-app devrait être debug.app"
+        assert add_typer_calls[5]['subapp'] is db.app, "La sixième sous-app devrait être db.app"
+        assert add_typer_calls[6]['subapp'] is exports.app, "La septième sous-app devrait être exports.app"
     finally:
         # Restaurer la méthode originale
         app.add_typer = original_add_typer
\ No newline at end of file
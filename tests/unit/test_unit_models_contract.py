@@ -48,6 +48,7 @@ def test_contract_save(monkeypatch):
     monkeypatch.setattr(Contract, '_validate_amounts', mock_validate_amounts)
     monkeypatch.setattr(Contract, '_validate_date', mock_validate_date)
     monkeypatch.setattr(Contract, '_validate_team_contact', mock_validate_team_contact)
+    monkeypatch.setattr(Contract, '_move_balance', staticmethod(lambda before, after: None))
     
     # Créer une instance de contrat
     contract = Contract(
@@ -0,0 +1,114 @@
+import pytest
+from datetime import datetime, timedelta
+from epicevents.models.role import Role
+from epicevents.models.user import User
+from epicevents.models.company import Company
+from epicevents.models.customer import Customer
+from epicevents.models.contract import Contract
+from epicevents.models.event import Event
+from tests.conftest import record_queries
+
+
+@pytest.fixture
+def saved_event(setup_db_tables):
+    """Crée un événement complet dans la base de données en mémoire."""
+    sales_role = Role.create(name="sales")
+    management_role = Role.create(name="management")
+    support_role = Role.create(name="support")
+
+    sales = User.create(
+        username="sales", email="sales@epicevents.com", first_name="Sales", last_name="User",
+        phone="0123456787", password="password123", role=sales_role
+    )
+    manager = User.create(
+        username="manager", email="manager@epicevents.com", first_name="Manager", last_name="User",
+        phone="0123456788", password="password123", role=management_role
+    )
+    support = User.create(
+        username="support", email="support@epicevents.com", first_name="Support", last_name="User",
+        phone="0123456786", password="password123", role=support_role
+    )
+    customer = Customer.create(
+        email="john@example.com", first_name="John", last_name="Doe", phone="0987654321",
+        company=Company.create(name="ACME"), team_contact_id=sales
+    )
+    contract = Contract.create(
+        customer=customer, signed=True, amount_total=1000.0, amount_due=500.0, team_contact_id=manager
+    )
+
+    return Event.create(
+        contract=contract,
+        name="Conference",
+        location="Paris",
+        event_date=datetime.now() + timedelta(days=30),
+        attendees=100,
+        team_contact_id=support
+    )
+
+
+def test_new_instance_has_changed():
+    """Une instance non sauvegardée est toujours considérée comme modifiée."""
+    customer = Customer(first_name="John")
+
+    assert customer.is_new()
+    assert customer.has_changed("email")
+
+
+def test_loaded_instance_tracks_original(saved_event):
+    """La valeur d'origine est conservée sans nouvelle requête."""
+    event = Event.get_by_id(saved_event.id)
+    assert not event.has_changed("location")
+
+    event.location = "Lyon"
+    event.location = "Marseille"
+
+    assert event.has_changed("location")
+    assert event.get_original("location") == "Paris"
+    assert not event.has_changed("name")
+
+    # Revenir à la valeur d'origine annule la modification
+    event.location = "Paris"
+    assert not event.has_changed("location")
+
+
+def test_update_writes_changed_columns_only(saved_event, monkeypatch):
+    """La mise à jour n'écrit et ne valide que les champs modifiés."""
+    event = Event.get_by_id(saved_event.id)
+
+    def fail(self):
+        raise AssertionError("Validation inattendue")
+
+    monkeypatch.setattr(Event, "_validate_contract", fail)
+    monkeypatch.setattr(Event, "_validate_event_date", fail)
+    monkeypatch.setattr(Event, "_validate_team_contact", fail)
+
+    event.location = "Lyon"
+    with record_queries() as queries:
+        event.save()
+
+    assert len(queries) == 1
+    sql, params = queries[0]
+    assert sql.startswith("UPDATE")
+    assert '"location"' in sql
+    assert '"name"' not in sql
+    assert Event.get_by_id(event.id).location == "Lyon"
+    assert event.get_original("location") == "Lyon"
+
+
+def test_update_past_event_date_unchanged(saved_event):
+    """Une date inchangée n'est pas revalidée, même si elle est passée."""
+    past_date = datetime.now() - timedelta(days=1)
+    Event.update(event_date=past_date).where(Event.id == saved_event.id).execute()
+
+    event = Event.get_by_id(saved_event.id)
+    event.event_date = past_date
+    event.attendees = 120
+    event.save()
+
+    assert Event.get_by_id(event.id).attendees == 120
+
+    event.event_date = past_date - timedelta(days=1)
+    with pytest.raises(ValueError) as excinfo:
+        event.save()
+
+    assert "ne peut pas être dans le passé" in str(excinfo.value).lower()
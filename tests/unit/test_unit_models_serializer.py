@@ -0,0 +1,80 @@
+import pytest
+from datetime import datetime, timedelta
+from epicevents.models.role import Role
+from epicevents.models.user import User
+from epicevents.models.company import Company
+from epicevents.models.customer import Customer
+from epicevents.models.contract import Contract
+from epicevents.models.event import Event
+from epicevents.models.serializer import batch_get_data
+from tests.conftest import record_queries
+
+
+@pytest.fixture
+def create_events(setup_db_tables):
+    """Crée plusieurs événements liés à des contrats et clients différents."""
+    sales_role = Role.create(name="sales")
+    management_role = Role.create(name="management")
+    support_role = Role.create(name="support")
+
+    sales = User.create(
+        username="sales", email="sales@epicevents.com", first_name="Sales", last_name="User",
+        phone="0123456787", password="password123", role=sales_role
+    )
+    manager = User.create(
+        username="manager", email="manager@epicevents.com", first_name="Manager", last_name="User",
+        phone="0123456788", password="password123", role=management_role
+    )
+    support = User.create(
+        username="support", email="support@epicevents.com", first_name="Support", last_name="User",
+        phone="0123456786", password="password123", role=support_role
+    )
+
+    for index in range(5):
+        customer = Customer.create(
+            email=f"client{index}@example.com", first_name="Client", last_name="Test", phone="0987654321",
+            company=Company.create(name=f"Company {index}"), team_contact_id=sales
+        )
+        contract = Contract.create(
+            customer=customer, signed=True, amount_total=1000.0, amount_due=500.0, team_contact_id=manager
+        )
+        Event.create(
+            contract=contract,
+            name=f"Event {index}",
+            location="Paris",
+            event_date=datetime.now() + timedelta(days=30 + index),
+            attendees=100,
+            team_contact_id=support if index % 2 else None
+        )
+
+
+def test_batch_get_data_events(create_events):
+    """Le sérialiseur groupé renvoie les mêmes dictionnaires que get_data()."""
+    expected = [event.get_data() for event in Event.select().order_by(Event.id)]
+
+    events = list(Event.select().order_by(Event.id))
+    with record_queries() as queries:
+        data = batch_get_data(events)
+
+    assert data == expected
+    # Contrats, clients, entreprises et contacts : une requête par niveau
+    assert len(queries) == 4
+
+
+def test_batch_get_data_reuses_joined_relations(create_events):
+    """Les relations déjà chargées par jointure ne sont pas re-demandées."""
+    contracts = list(Contract.select_detailed().order_by(Contract.id))
+
+    with record_queries() as queries:
+        data = batch_get_data(contracts)
+
+    assert [contract["customer"]["company"] for contract in data] == [f"Company {i}" for i in range(5)]
+    assert len(queries) == 1
+
+
+def test_batch_get_data_empty():
+    """Une liste vide ne lance aucune requête."""
+    with record_queries() as queries:
+        assert batch_get_data([]) == []
+
+    assert len(queries) == 0
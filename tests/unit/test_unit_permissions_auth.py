@@ -9,6 +9,7 @@ from epicevents.permissions.auth import is_logged
 from epicevents.permissions.auth import get_target_id_from_args
 from epicevents.permissions.auth import check_auth
 from tests.conftest import mock_admin_user
+from tests.conftest import MockRole
 
 
 # Tests des fonctions d'authentification
@@ -213,6 +214,7 @@ def test_check_auth(monkeypatch):
         def __init__(self):
             self.id = 1
             self.username = "johndoe"
+            self.role = MockRole("sales", 3)
     
     user_mock = MockUser()
     
@@ -248,7 +250,7 @@ def test_check_auth(monkeypatch):
         def set_context(self, name, data):
             return self
     
-    def mock_capture_message(message, level=None, scope=None):
+    def mock_record(event, source, resource=None, action=None, message="", details=None):
         captured_messages.append(message)
     
     # Appliquer les mocks
@@ -259,7 +261,7 @@ def test_check_auth(monkeypatch):
     monkeypatch.setattr("epicevents.permissions.auth.console.print", mock_print)
     monkeypatch.setattr("epicevents.permissions.auth.format_text", mock_format_text)
     monkeypatch.setattr(sys, "argv", ["program", "command", "arg1", "arg2"])
-    monkeypatch.setattr(sentry_sdk, "capture_message", mock_capture_message)
+    monkeypatch.setattr("epicevents.permissions.auth.security_events.record", mock_record)
     monkeypatch.setattr(sentry_sdk, "Scope", lambda: MockScope())
     monkeypatch.setattr("epicevents.permissions.auth.SENTRY_ENV", "production")
     
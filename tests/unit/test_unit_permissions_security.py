@@ -0,0 +1,69 @@
+import json
+import multiprocessing
+import sentry_sdk
+from epicevents.permissions.security import SecurityEventBuffer
+
+
+def test_security_events_aggregated(tmp_path, monkeypatch):
+    """Les événements identiques sont regroupés et stockés jusqu'à la fin de la fenêtre."""
+    sent = []
+    monkeypatch.setattr(sentry_sdk, "capture_message", lambda message, level=None: sent.append(message))
+    monkeypatch.setattr(SecurityEventBuffer, "register", lambda self: None)
+    buffer = SecurityEventBuffer(path=tmp_path / "events.json", window=300)
+
+    for _ in range(3):
+        buffer.record("wrong pw", "johndoe", message="Mot de passe erroné : 'johndoe'.")
+    buffer.record("unauthorized", 1, "customer", "delete", message="Permission denied")
+    buffer.flush()
+
+    # Fenêtre en cours : rien n'est envoyé, les compteurs sont conservés
+    assert sent == []
+    stored = json.loads((tmp_path / "events.json").read_text())
+    assert sorted(entry["count"] for entry in stored["events"].values()) == [1, 3]
+
+    # Un appel suivant cumule les compteurs
+    buffer.record("wrong pw", "johndoe", message="Mot de passe erroné : 'johndoe'.")
+    buffer.flush(force=True)
+
+    assert sorted(sent) == ["Mot de passe erroné : 'johndoe'. (x4)", "Permission denied (x1)"]
+    assert not (tmp_path / "events.json").exists()
+
+
+def test_security_events_window_elapsed(tmp_path, monkeypatch):
+    """Une fois la fenêtre écoulée, le tampon est envoyé au flush suivant."""
+    sent = []
+    monkeypatch.setattr(sentry_sdk, "capture_message", lambda message, level=None: sent.append(message))
+    monkeypatch.setattr(SecurityEventBuffer, "register", lambda self: None)
+    buffer = SecurityEventBuffer(path=tmp_path / "events.json", window=0)
+
+    buffer.record("unexisting user", "ghost", message="Utilisateur inexistant : 'ghost'.")
+    buffer.flush()
+
+    assert sent == ["Utilisateur inexistant : 'ghost'. (x1)"]
+
+    # Sans événement ni fichier, le flush ne fait rien
+    buffer.flush()
+    assert len(sent) == 1
+
+
+def record_and_flush(path, count):
+    """Processus CLI simulé : enregistre des échecs puis écrit le tampon."""
+    buffer = SecurityEventBuffer(path=path, window=3600)
+    buffer.register = lambda: None
+    for _ in range(count):
+        buffer.record("wrong pw", "johndoe", message="Mot de passe erroné : 'johndoe'.")
+        buffer.flush()
+
+
+def test_security_events_concurrent_flushes(tmp_path):
+    """Des processus concurrents cumulent leurs compteurs sans s'écraser."""
+    path = tmp_path / "state" / "events.json"
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=record_and_flush, args=(path, 20)) for _ in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    stored = json.loads(path.read_text())
+    assert [entry["count"] for entry in stored["events"].values()] == [80]
@@ -0,0 +1,81 @@
+import pytest
+from datetime import datetime, timedelta
+from epicevents.models.role import Role
+from epicevents.models.user import User
+from epicevents.models.company import Company
+from epicevents.models.customer import Customer
+from epicevents.models.contract import Contract
+from epicevents.utils.aging import aging_numpy, aging_sql, compute_aging
+
+
+AS_OF = datetime(2025, 6, 30, 12, 0)
+
+
+@pytest.fixture
+def receivables(setup_db_tables):
+    """Deux clients d'un même commercial, avec des contrats de 10 à 120 jours."""
+    sales = User.create(
+        username="sales", email="sales@epicevents.com", first_name="Sales", last_name="User",
+        phone="0123456789", password="password123", role=Role.create(name="sales")
+    )
+    company = Company.create(name="ACME")
+    customers = [
+        Customer.create(
+            email=f"client{index}@example.com", first_name="Client", last_name="Test",
+            phone="0987654321", company=company, team_contact_id=sales
+        )
+        for index in range(2)
+    ]
+
+    # (client, âge en jours, montant total, montant dû, signé)
+    contracts = [
+        (0, 10, 1000.0, 100.0, True),
+        (0, 45, 1000.0, 200.0, True),
+        (0, 75, 1000.0, 0.0, True),  # réglé : ignoré
+        (1, 120, 500.0, 400.0, True),
+        (1, 30, 500.0, 500.0, False),  # non signé : ignoré
+    ]
+    for customer_index, age, total, due, signed in contracts:
+        created = AS_OF - timedelta(days=age, hours=1)
+        Contract.insert(
+            customer=customers[customer_index], signed=signed, amount_total=total, amount_due=due,
+            date_created=created, date_updated=created
+        ).execute()
+
+    return {"sales": sales, "customers": customers}
+
+
+def test_aging_sql_by_customer(receivables):
+    """Les montants dus sont répartis par tranche d'âge et l'âge moyen est pondéré."""
+    rows = {row["key"]: row for row in aging_sql("customer", AS_OF)}
+    first, second = (rows[customer.id] for customer in receivables["customers"])
+
+    assert first["buckets"] == [100.0, 200.0, 0.0, 0.0]
+    assert (first["count"], first["due"], first["total"]) == (2, 300.0, 2000.0)
+    assert first["weighted_age"] == pytest.approx((100 * 10 + 200 * 45) / 300)
+    assert second["buckets"] == [0.0, 0.0, 0.0, 400.0]
+
+
+def test_compute_aging_by_rep(receivables):
+    """Regroupement par commercial, trié par montant dû."""
+    rows = compute_aging("rep", AS_OF, use_numpy=False)
+
+    assert len(rows) == 1
+    assert rows[0]["key"] == receivables["sales"].id
+    assert rows[0]["buckets"] == [100.0, 200.0, 0.0, 400.0]
+
+    with pytest.raises(ValueError):
+        compute_aging("company", AS_OF)
+
+
+def test_aging_numpy_matches_sql(receivables):
+    """Le calcul NumPy donne les mêmes résultats que le repli SQL."""
+    pytest.importorskip("numpy")
+
+    for by in ["customer", "rep"]:
+        numpy_rows = sorted(aging_numpy(by, AS_OF), key=lambda row: row["key"])
+        sql_rows = sorted(aging_sql(by, AS_OF), key=lambda row: row["key"])
+        assert len(numpy_rows) == len(sql_rows)
+        for numpy_row, sql_row in zip(numpy_rows, sql_rows):
+            assert numpy_row["buckets"] == sql_row["buckets"]
+            assert numpy_row["weighted_age"] == pytest.approx(sql_row["weighted_age"])
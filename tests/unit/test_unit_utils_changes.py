@@ -0,0 +1,145 @@
+import pytest
+from datetime import datetime, timedelta
+from epicevents.models.database import BaseModel
+from epicevents.models.company import Company
+from epicevents.models.customer import Customer
+from epicevents.models.contract import Contract
+from epicevents.models.event import Event
+from epicevents.models.tombstone import Tombstone
+from epicevents.models.role import Role
+from epicevents.models.user import User
+from epicevents.utils.changes import (
+    changed_rows,
+    export_changes,
+    load_checkpoint,
+    parse_since,
+    positions_since,
+    save_checkpoint,
+)
+
+
+START = datetime(2025, 6, 1, 8, 0)
+UNTIL = datetime(2025, 6, 2)
+
+
+@pytest.fixture
+def history(setup_db_tables):
+    """Cinq clients modifiés d'heure en heure, dont deux à la même heure."""
+    company = Company.create(name="ACME")
+    customers = [
+        Customer.create(
+            email=f"client{index}@example.com", first_name="Client", last_name="Test",
+            phone="0987654321", company=company
+        )
+        for index in range(5)
+    ]
+    for index, customer in enumerate(customers):
+        updated = START + timedelta(hours=min(index, 3))
+        Customer.update(date_updated=updated).where(Customer.id == customer.id).execute()
+    return customers
+
+
+def test_parse_since():
+    """Une date ou un nom de point de reprise."""
+    assert parse_since("2025-06-01") == datetime(2025, 6, 1)
+    assert parse_since("2025-06-01_14:30") == datetime(2025, 6, 1, 14, 30)
+    assert parse_since("comptabilite") is None
+    with pytest.raises(ValueError, match="invalide"):
+        parse_since("2025-13-01")
+
+
+def test_changed_rows_keyset_pages(history):
+    """La pagination par (date_updated, id) ne perd ni ne répète aucune ligne, même à date égale."""
+    rows = list(changed_rows(Customer, (START, 0), UNTIL, page_size=2))
+
+    assert [row["id"] for row in rows] == [customer.id for customer in history]
+    assert [row["id"] for row in changed_rows(Customer, (START + timedelta(hours=3), history[3].id), UNTIL)] == [
+        history[4].id
+    ]
+    assert list(changed_rows(Customer, (None, 0), START, page_size=2)) == []
+
+
+def test_changed_rows_uses_index(history):
+    """Le parcours utilise l'index (date_updated, id), pas un parcours de table."""
+    database = BaseModel._meta.database
+    query = (
+        Customer.select().where(Customer.date_updated < UNTIL)
+        .order_by(Customer.date_updated, Customer.id).limit(10)
+    )
+    sql, params = query.sql()
+    plan = " ".join(row[-1] for row in database.execute_sql(f"EXPLAIN QUERY PLAN {sql}", params).fetchall())
+
+    assert "customer_date_updated_id" in plan
+
+
+def test_export_changes_and_checkpoint(history):
+    """Les changements puis les suppressions sont exportés, et le point de reprise ne renvoie que la suite."""
+    contract = Contract.create(customer=history[0], signed=True, amount_total=100.0, amount_due=0.0)
+    event = Event.create(
+        contract=contract, name="Gala", location="Paris",
+        event_date=datetime.now() + timedelta(days=10), attendees=20
+    )
+    event.delete_instance()
+    until = datetime.now() + timedelta(seconds=1)
+
+    positions = positions_since(START)
+    changes = list(export_changes(positions, until))
+
+    assert [(change["kind"], change["op"]) for change in changes] == [
+        *[("customer", "upsert")] * 5, ("contract", "upsert"), ("event", "delete")
+    ]
+    # Le contrat a mis à jour les agrégats du client 0, exporté en dernier
+    assert changes[4]["data"]["email"] == "client0@example.com"
+    assert changes[4]["data"]["contracts_count"] == 1
+    assert changes[-1]["id"] == event.id
+
+    save_checkpoint("comptabilite", positions)
+    Customer.update(date_updated=datetime.now()).where(Customer.id == history[2].id).execute()
+    history[4].delete_instance()
+    until = datetime.now() + timedelta(seconds=1)
+
+    resumed = list(export_changes(load_checkpoint("comptabilite"), until))
+
+    assert [(change["kind"], change["op"], change["id"]) for change in resumed] == [
+        ("customer", "upsert", history[2].id), ("customer", "delete", history[4].id)
+    ]
+    assert Tombstone.select().count() == 2
+
+
+def test_derived_changes_exported(history):
+    """Les agrégats et les SET NULL en cascade remettent les lignes concernées dans le flux."""
+    sales = User.create(
+        username="sales", email="sales@epicevents.com", first_name="Sales", last_name="User",
+        phone="0123456789", password="password123", role=Role.create(name="sales")
+    )
+    Customer.update(team_contact_id=sales).where(Customer.id == history[3].id).execute()
+    positions = positions_since(START)
+    list(export_changes(positions, datetime.now() + timedelta(seconds=1)))
+
+    # Agrégats : le client du nouveau contrat, puis le contrat du nouvel événement
+    contract = Contract.create(customer=history[1], signed=True, amount_total=100.0, amount_due=40.0)
+    Event.create(
+        contract=contract, name="Gala", location="Paris",
+        event_date=datetime.now() + timedelta(days=10), attendees=20
+    )
+    # Suppression du commercial : son client perd son contact
+    sales.delete_instance()
+
+    changes = list(export_changes(positions, datetime.now() + timedelta(seconds=1)))
+
+    customers = {change["id"]: change["data"] for change in changes if change["kind"] == "customer"}
+    assert customers[history[1].id]["outstanding_total"] == 40.0
+    assert customers[history[3].id]["team_contact_id"] is None
+    contracts = [change["data"] for change in changes if change["kind"] == "contract"]
+    assert [row["events_count"] for row in contracts] == [1]
+
+
+def test_positions_since_skips_older_tombstones(history):
+    """Une date de départ ignore les suppressions antérieures."""
+    history[0].delete_instance()
+    Tombstone.update(deleted_at=START - timedelta(days=1)).execute()
+    history[1].delete_instance()
+
+    changes = list(export_changes(positions_since(START), datetime.now() + timedelta(seconds=1)))
+
+    assert [change["id"] for change in changes if change["op"] == "delete"] == [history[1].id]
@@ -0,0 +1,45 @@
+from peewee import JOIN
+from epicevents.models.database import BaseModel
+from epicevents.models.user import User, ph
+from epicevents.models.company import Company
+from epicevents.models.customer import Customer
+from epicevents.models.contract import Contract
+from epicevents.models.event import Event
+from epicevents.utils.create_dataset import generate_dataset
+from epicevents.utils.rollups import rebuild_rollups
+
+
+def orphans(model, field, target) -> int:
+    """Compte les lignes dont la clé étrangère ne pointe vers aucune ligne."""
+    return (
+        model.select()
+        .join(target, on=(field == target.id), join_type=JOIN.LEFT_OUTER)
+        .where(field.is_null(False), target.id.is_null(True))
+        .count()
+    )
+
+
+def test_generate_dataset(setup_db_tables):
+    """Petit jeu de données : nombres de lignes, intégrité des clés et mots de passe hachés en parallèle."""
+    generate_dataset(customers=10, contracts_per_customer=2.0, events_per_contract=1.0, seed=42, workers=2)
+
+    # 2 commerciaux, 1 gestionnaire, 2 supports pour 10 clients
+    assert User.select().count() == 5
+    assert Company.select().count() == 2
+    assert Customer.select().count() == 10
+    assert Contract.select().count() > 0
+    assert Event.select().count() > 0
+
+    assert orphans(Customer, Customer.company, Company) == 0
+    assert orphans(Customer, Customer.team_contact_id, User) == 0
+    assert orphans(Contract, Contract.customer, Customer) == 0
+    assert orphans(Contract, Contract.team_contact_id, User) == 0
+    assert orphans(Event, Event.contract, Contract) == 0
+    assert orphans(Event, Event.team_contact_id, User) == 0
+
+    sales = User.get(User.username == "sales_1")
+    assert ph.verify(sales.password, "SALES_PASS1")
+    assert sales.role.name == "sales"
+
+    # Les agrégats sont recalculés après les insertions en masse
+    assert rebuild_rollups(BaseModel._meta.database) == {"customers": 0, "contracts": 0}
@@ -0,0 +1,76 @@
+import pytest
+from datetime import datetime, timedelta
+from epicevents.models.database import BaseModel
+from epicevents.models.role import Role
+from epicevents.models.user import User
+from epicevents.models.company import Company
+from epicevents.models.customer import Customer
+from epicevents.models.contract import Contract
+from epicevents.models.event import Event
+from epicevents.utils.dashboard import ensure_dashboard_views, last_refresh, load_dashboard, refresh_dashboard
+
+
+TODAY = datetime(2025, 6, 4, 12, 0)  # Un mercredi
+
+
+@pytest.fixture
+def activity(setup_db_tables):
+    """Trois contrats (non signé, à encaisser, soldé) et deux événements sur deux semaines."""
+    support = User.create(
+        username="support", email="support@epicevents.com", first_name="Support", last_name="User",
+        phone="0123456789", password="password123", role=Role.create(name="support")
+    )
+    customer = Customer.create(
+        email="client@example.com", first_name="Client", last_name="Test",
+        phone="0987654321", company=Company.create(name="ACME")
+    )
+    contracts = [
+        (False, 300.0, 300.0, datetime(2025, 5, 10)),
+        (True, 1000.0, 400.0, datetime(2025, 5, 20)),
+        (True, 500.0, 0.0, datetime(2025, 6, 1)),
+    ]
+    for signed, total, due, created in contracts:
+        contract = Contract.insert(
+            customer=customer, signed=signed, amount_total=total, amount_due=due,
+            date_created=created, date_updated=created
+        ).execute()
+
+    for event_date, contact in [(datetime(2025, 6, 5, 14, 0), support), (datetime(2025, 6, 12, 9, 30), None)]:
+        Event.insert(
+            contract=contract, name="Gala", location="Paris", event_date=event_date,
+            attendees=40, team_contact_id=contact
+        ).execute()
+
+    database = BaseModel._meta.database
+    ensure_dashboard_views(database)
+    refresh_dashboard(database)
+    return database
+
+
+def test_dashboard_views(activity):
+    """Les vues agrègent le pipeline, le chiffre d'affaires, les semaines et les éléments à attribuer."""
+    dashboard = load_dashboard(activity, today=TODAY)
+
+    assert [(row["status"], row["contracts"], row["due"]) for row in dashboard["pipeline"]] == [
+        ("due", 1, 400.0), ("paid", 1, 0.0), ("unsigned", 1, 300.0)
+    ]
+    assert [(row["month"], row["billed"]) for row in dashboard["revenue"]] == [("2025-05", 1000.0), ("2025-06", 500.0)]
+    assert [(row["week"], row["events"], row["unassigned"]) for row in dashboard["weeks"]] == [
+        ("2025-06-02", 1, 0), ("2025-06-09", 1, 1)
+    ]
+    assert {row["kind"]: row["total"] for row in dashboard["unassigned"]} == {"contract": 3, "customer": 1, "event": 0}
+
+
+def test_dashboard_limits_and_refresh(activity):
+    """Les lectures sont bornées, et les vues ne changent qu'au rafraîchissement."""
+    dashboard = load_dashboard(activity, months=1, weeks=1, today=TODAY + timedelta(days=7))
+    assert [row["month"] for row in dashboard["revenue"]] == ["2025-06"]
+    assert [row["week"] for row in dashboard["weeks"]] == ["2025-06-09"]
+
+    before = last_refresh(activity)
+    Contract.update(amount_due=0.0).execute()
+    assert load_dashboard(activity, today=TODAY)["pipeline"][0]["status"] == "due"
+
+    refresh_dashboard(activity)
+    assert [row["status"] for row in load_dashboard(activity, today=TODAY)["pipeline"]] == ["paid", "unsigned"]
+    assert last_refresh(activity) >= before
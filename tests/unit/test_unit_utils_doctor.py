@@ -0,0 +1,77 @@
+import pytest
+from peewee import SqliteDatabase
+from epicevents.utils.doctor import HIGH, LOW, MEDIUM, DoctorSource, SqliteSource, diagnose, source_for
+
+
+class FakePostgresSource(DoctorSource):
+    """Source simulée renvoyant des statistiques de type pg_stat_user_tables."""
+
+    def ping(self):
+        return 0.02
+
+    def tables(self):
+        return ["customer"]
+
+    def foreign_keys(self, table):
+        return ["team_contact_id_id", "company_id"]
+
+    def indexed_columns(self, table):
+        return {"company_id"}
+
+    def table_stats(self):
+        return [
+            {"table": "customer", "live": 1000, "dead": 400, "modified": 10, "analyzed": True},
+            {"table": "event", "live": 1000, "dead": 0, "modified": 500, "analyzed": True},
+        ]
+
+    def cache_hit_ratio(self):
+        return 0.9
+
+
+@pytest.fixture
+def sqlite_db():
+    """Base SQLite avec une clé étrangère non indexée."""
+    database = SqliteDatabase(":memory:")
+    database.execute_sql("CREATE TABLE company (id INTEGER PRIMARY KEY)")
+    database.execute_sql(
+        "CREATE TABLE customer (id INTEGER PRIMARY KEY, company_id INTEGER REFERENCES company (id))"
+    )
+    database.execute_sql("INSERT INTO company (id) VALUES (1)")
+    yield database
+    database.close()
+
+
+def test_diagnose_prioritises_findings():
+    """Index manquant, lignes mortes, statistiques périmées et cache sont classés par priorité."""
+    measures, findings = diagnose(FakePostgresSource(None))
+
+    assert [priority for priority, _, _ in findings] == [HIGH, MEDIUM, MEDIUM, MEDIUM, LOW]
+    assert findings[0][2] == 'CREATE INDEX customer_team_contact_id_id ON "customer" (team_contact_id_id);'
+    fixes = [fix for _, _, fix in findings]
+    assert 'VACUUM (ANALYZE) "customer";' in fixes
+    assert 'ANALYZE "event";' in fixes
+    assert {"Mesure": "Taux de succès du cache", "Valeur": "90.00%"} in measures
+
+
+def test_sqlite_source(sqlite_db):
+    """La source SQLite détecte la clé étrangère sans index et l'absence d'ANALYZE."""
+    source = source_for(sqlite_db)
+    assert isinstance(source, SqliteSource)
+
+    _, findings = diagnose(source)
+    assert (HIGH, "Clé étrangère customer.company_id sans index.",
+            'CREATE INDEX customer_company_id ON "customer" (company_id);') in findings
+    assert (MEDIUM, "company : aucune statistique.", 'ANALYZE "company";') in findings
+
+    # Une fois l'index créé et les statistiques calculées, plus rien à signaler
+    sqlite_db.execute_sql('CREATE INDEX customer_company_id ON "customer" (company_id)')
+    sqlite_db.execute_sql("ANALYZE")
+    measures, findings = diagnose(source)
+    assert findings == []
+    assert {"Mesure": "Clés étrangères sans index", "Valeur": "0"} in measures
+
+
+def test_doctor_source_requires_table_stats(sqlite_db):
+    """Une source doit fournir les statistiques de son moteur."""
+    with pytest.raises(TypeError):
+        DoctorSource(sqlite_db)
@@ -0,0 +1,47 @@
+from epicevents.models.database import BaseModel
+from epicevents.models.event import Event
+from epicevents.models.contract import Contract
+from epicevents.utils.explain import explain, filtered_columns, sequential_scans, suggest_index
+
+
+def test_sequential_scans_postgres_and_sqlite():
+    """Les parcours séquentiels sont détectés dans les plans PostgreSQL et SQLite."""
+    sql = 'SELECT * FROM "event" AS "t1" LEFT OUTER JOIN "contract" AS "t2" ON ("t1"."contract_id" = "t2"."id")'
+    pg_plan = [
+        "Hash Left Join  (cost=1.0..2.0 rows=10 width=8) (actual time=0.1..0.2 rows=10 loops=1)",
+        "  ->  Seq Scan on event t1  (cost=0.00..1.10 rows=10 width=8)",
+        "  ->  Seq Scan on company t4  (cost=0.00..1.10 rows=10 width=8)",
+    ]
+    sqlite_plan = ["SCAN t1", "SEARCH t2 USING INTEGER PRIMARY KEY (rowid=?) LEFT-JOIN"]
+
+    assert sequential_scans(pg_plan, sql) == ["event"]
+    assert sequential_scans(sqlite_plan, sql) == ["event"]
+    assert sequential_scans(["SEARCH t1 USING INDEX event_team_contact_id (team_contact_id=?)"], sql) == []
+
+
+def test_filtered_columns():
+    """WHERE pour la table principale, condition de jointure pour les tables jointes."""
+    sql = (
+        'SELECT * FROM "event" AS "t1" LEFT OUTER JOIN "contract" AS "t2" ON ("t1"."contract_id" = "t2"."id") '
+        'WHERE ("t1"."event_date" > ?) ORDER BY "t1"."id"'
+    )
+
+    assert filtered_columns("event", sql) == ["event_date"]
+    assert filtered_columns("contract", sql) == []
+    assert filtered_columns("event", 'SELECT * FROM "event" AS "t1"') == []
+
+
+def test_explain_and_suggest_index(setup_db_tables):
+    """Le plan SQLite est lu et l'index manquant est proposé."""
+    database = BaseModel._meta.database
+    query = Event.select().where(Event.location == "Paris")
+    sql, _ = query.sql()
+
+    plan = explain(query, database)
+
+    assert sequential_scans(plan, sql) == ["event"]
+    assert suggest_index("event", sql, database) == 'CREATE INDEX event_location ON "event" (location);'
+
+    # Index déjà présent (clé étrangère)
+    sql, _ = Contract.select().where(Contract.customer == 1).sql()
+    assert "contract_customer_id" in suggest_index("contract", sql, database)
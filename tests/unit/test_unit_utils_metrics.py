@@ -0,0 +1,73 @@
+from typer.testing import CliRunner
+from epicevents.cli import init_cli
+from epicevents.utils.metrics import CommandMetrics, percentile, read_log, summarize
+
+
+def test_percentile():
+    """Percentile au rang le plus proche."""
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([0.2], 99) == 0.2
+    assert percentile([], 50) == 0.0
+
+
+def test_command_metrics_recorded(metrics_files, tmp_path, monkeypatch):
+    """Chaque commande ajoute une ligne au journal et cumule le fichier Prometheus."""
+    monkeypatch.setattr("epicevents.permissions.auth.is_logged", lambda: None)
+    monkeypatch.setattr(metrics_files, "prom_path", tmp_path / "epicevents.prom")
+    app = init_cli()
+
+    for _ in range(2):
+        result = CliRunner().invoke(app, ["debug", "token"], obj={})
+        assert result.exit_code == 1
+
+    records = read_log(metrics_files.log_path)
+    assert len(records) == 2
+    assert records[0]["command"] == "debug.token"
+    assert records[0]["status"] == "error"
+    assert records[0]["counters"] == {'auth{reason="not logged",result="failure"}': 1}
+
+    prom = (tmp_path / "epicevents.prom").read_text()
+    assert 'epicevents_command_duration_seconds_count{command="debug.token",status="error"} 2' in prom
+    assert 'epicevents_auth_total{reason="not logged",result="failure"} 2' in prom
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_summarize():
+    """Le résumé regroupe les appels par commande."""
+    records = [
+        {"command": "customer.list", "status": "ok", "duration": 0.1 * i, "db_time": 0.01, "counters": {}}
+        for i in range(1, 11)
+    ]
+    records.append({
+        "command": "user.login", "status": "error", "duration": 0.5, "db_time": 0.0,
+        "counters": {'auth{reason="wrong pw",result="failure"}': 1}
+    })
+
+    rows, counters = summarize(records)
+
+    assert [row["Commande"] for row in rows] == ["customer.list", "user.login"]
+    assert rows[0]["Appels"] == 10
+    assert rows[0]["p50"] == "500.0"
+    assert rows[0]["p99"] == "1000.0"
+    assert rows[1]["Erreurs"] == 1
+    assert counters == {'auth{reason="wrong pw",result="failure"}': 1}
+
+
+def test_metrics_log_rotated(tmp_path):
+    """Au-delà de la taille maximale, le journal est archivé et la lecture couvre les deux fichiers."""
+    recorder = CommandMetrics(log_path=tmp_path / "state" / "metrics.jsonl", prom_path=None, max_bytes=150)
+    records = [
+        {"command": f"customer.list{i}", "status": "ok", "duration": 0.1, "db_time": 0.0, "counters": {}}
+        for i in range(5)
+    ]
+    for record in records:
+        recorder.append_log(record)
+
+    assert (tmp_path / "state" / "metrics.jsonl.1").exists()
+    assert recorder.log_path.stat().st_size < 400
+    # Seule la génération précédente est conservée
+    assert [record["command"] for record in read_log(recorder.log_path)][-2:] == ["customer.list3", "customer.list4"]
+    assert len(read_log(recorder.log_path)) < len(records)
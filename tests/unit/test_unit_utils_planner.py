@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta
+from epicevents.utils.planner import overlapping_pairs, plan_assignments
+
+
+DAY_1 = datetime(2030, 5, 1, 10, 0)
+DAY_2 = datetime(2030, 5, 2, 10, 0)
+DURATION = timedelta(hours=4)
+
+
+def test_plan_assignments_balances_attendees():
+    """Les plus gros événements d'abord, chacun au support le moins chargé."""
+    events = [(1, DAY_1, 300), (2, DAY_2, 100), (3, DAY_2, 150)]
+    schedules = {10: [], 20: [(datetime(2030, 5, 3, 9, 0), 200)]}
+
+    assignments, unassigned = plan_assignments(events, schedules, DURATION)
+
+    # 1 (300) -> 10 ; 3 (150) -> 20 (200 < 300) ; 2 (100) -> 10 (300 < 350)
+    assert assignments == {1: 10, 3: 20, 2: 10}
+    assert unassigned == []
+
+
+def test_plan_assignments_overlap_conflicts():
+    """Un support n'a jamais deux événements qui se chevauchent, le même jour ou non."""
+    events = [(1, DAY_1, 50), (2, DAY_1.replace(hour=12), 50), (3, DAY_1, 10), (4, DAY_1.replace(hour=18), 5)]
+    schedules = {10: [], 20: [(DAY_2, 10)]}
+
+    assignments, unassigned = plan_assignments(events, schedules, DURATION)
+
+    # 4 commence 8 h après 1 : même jour, mais sans chevauchement
+    assert assignments == {1: 10, 2: 20, 4: 10}
+    assert unassigned == [3]
+
+
+def test_plan_assignments_across_midnight():
+    """23:00 puis 01:00 le lendemain se chevauchent, comme pour Event.overlapping."""
+    late = datetime(2030, 5, 1, 23, 0)
+    events = [(1, late + timedelta(hours=2), 50)]
+    schedules = {10: [(late, 10)], 20: [(late, 100)]}
+
+    assert plan_assignments(events, schedules, DURATION) == ({}, [1])
+    assert plan_assignments(events, {**schedules, 30: [(late - DURATION, 500)]}, DURATION) == ({1: 30}, [])
+
+
+def test_overlapping_pairs():
+    """Balayage trié : seuls les événements d'un même support qui se chevauchent."""
+    rows = [
+        (10, datetime(2030, 5, 1, 9, 0), 1),
+        (10, datetime(2030, 5, 1, 11, 0), 2),
+        (10, datetime(2030, 5, 1, 12, 30), 3),
+        (10, datetime(2030, 5, 1, 17, 0), 4),
+        (20, datetime(2030, 5, 1, 17, 0), 5),
+    ]
+
+    assert overlapping_pairs(rows, timedelta(hours=4)) == [(10, 1, 2), (10, 1, 3), (10, 2, 3)]
+    assert overlapping_pairs(rows, timedelta(hours=1)) == []
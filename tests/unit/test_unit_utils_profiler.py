@@ -0,0 +1,57 @@
+from epicevents.models.role import Role
+from epicevents.models.database import BaseModel
+from epicevents.utils.profiler import QueryProfiler
+
+
+def test_profiler_records_queries(setup_db_tables):
+    """Le profileur enregistre chaque requête avec ses paramètres et sa durée."""
+    database = BaseModel._meta.database
+
+    with QueryProfiler(database) as profiler:
+        Role.get_or_none(Role.name == "admin")
+
+    assert len(profiler.queries) == 1
+    sql, params, duration = profiler.queries[0]
+    assert sql.startswith("SELECT")
+    assert "admin" in params
+    assert duration >= 0
+    # Le hook est retiré à la sortie
+    assert "execute_sql" not in database.__dict__
+
+
+def test_profiler_detects_duplicates(setup_db_tables):
+    """Une même requête répétée avec des paramètres différents est signalée."""
+    for name in ["admin", "sales", "support"]:
+        Role.create(name=name)
+
+    with QueryProfiler(BaseModel._meta.database, top=2) as profiler:
+        for role_id in [1, 2, 3]:
+            Role.get_by_id(role_id)
+        Role.select().count()
+
+    duplicates = profiler.duplicates()
+    assert len(duplicates) == 1
+    assert duplicates[0][1:3] == (3, 3)
+    assert len(profiler.slowest()) == 2
+
+
+def test_profiler_separates_exact_repeats(setup_db_tables):
+    """Une requête répétée à l'identique n'a qu'un jeu de paramètres distinct."""
+    Role.create(name="admin")
+
+    with QueryProfiler(BaseModel._meta.database) as profiler:
+        for _ in range(3):
+            Role.get_by_id(1)
+
+    assert profiler.duplicates()[0][1:3] == (3, 1)
+
+
+def test_profiler_report(setup_db_tables, capsys):
+    """Le résumé est affiché sur la sortie d'erreur."""
+    profiler = QueryProfiler(BaseModel._meta.database).start()
+    Role.select().count()
+    profiler.report()
+
+    captured = capsys.readouterr()
+    assert "Profil SQL : 1 requête(s)" in captured.err
+    assert "execute_sql" not in BaseModel._meta.database.__dict__
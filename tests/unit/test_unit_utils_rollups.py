@@ -0,0 +1,97 @@
+import pytest
+from datetime import datetime, timedelta
+from peewee import SqliteDatabase
+from epicevents.models.database import BaseModel
+from epicevents.models.role import Role
+from epicevents.models.user import User
+from epicevents.models.company import Company
+from epicevents.models.customer import Customer
+from epicevents.models.contract import Contract
+from epicevents.models.event import Event
+from epicevents.utils.rollups import ensure_rollup_columns, rebuild_rollups
+
+
+@pytest.fixture
+def customers(setup_db_tables):
+    """Deux clients d'une même entreprise."""
+    company = Company.create(name="ACME")
+    return [
+        Customer.create(
+            email=f"client{index}@example.com", first_name="Client", last_name="Test",
+            phone="0987654321", company=company
+        )
+        for index in range(2)
+    ]
+
+
+def rollups(customer):
+    """Relit les agrégats d'un client."""
+    customer = Customer.get_by_id(customer.id)
+    return customer.contracts_count, customer.outstanding_total
+
+
+def test_contract_rollups_incremental(customers):
+    """Les agrégats clients suivent la création, la modification et la suppression des contrats."""
+    first, second = customers
+    contract = Contract.create(customer=first, signed=True, amount_total=1000.0, amount_due=400.0)
+    Contract.create(customer=first, signed=True, amount_total=500.0, amount_due=100.0)
+    assert rollups(first) == (2, 500.0)
+
+    contract.amount_due = 150.0
+    contract.save()
+    assert rollups(first) == (2, 250.0)
+
+    contract.customer = second
+    contract.save()
+    assert rollups(first) == (1, 100.0)
+    assert rollups(second) == (1, 150.0)
+
+    contract.delete_instance()
+    assert rollups(second) == (0, 0.0)
+
+
+def test_event_rollup_incremental(customers):
+    """Le nombre d'événements d'un contrat suit la création, le changement de contrat et la suppression."""
+    first = Contract.create(customer=customers[0], signed=True, amount_total=1000.0, amount_due=0.0)
+    second = Contract.create(customer=customers[0], signed=True, amount_total=1000.0, amount_due=0.0)
+    event = Event.create(
+        contract=first, name="Gala", location="Paris",
+        event_date=datetime.now() + timedelta(days=10), attendees=50
+    )
+    assert Contract.get_by_id(first.id).events_count == 1
+
+    event.contract = second
+    event.save()
+    assert (Contract.get_by_id(first.id).events_count, Contract.get_by_id(second.id).events_count) == (0, 1)
+
+    event.delete_instance()
+    assert Contract.get_by_id(second.id).events_count == 0
+
+
+def test_rebuild_rollups(customers):
+    """La reconstruction corrige uniquement les lignes désynchronisées (insertions en masse)."""
+    database = BaseModel._meta.database
+    Contract.insert(customer=customers[0], signed=True, amount_total=800.0, amount_due=300.0).execute()
+    Contract.insert(customer=customers[0], signed=False, amount_total=200.0, amount_due=200.0).execute()
+    contract = Contract.create(customer=customers[1], signed=True, amount_total=100.0, amount_due=0.0)
+    Event.insert(
+        contract=contract, name="Gala", location="Paris", event_date=datetime.now(), attendees=10
+    ).execute()
+
+    assert rebuild_rollups(database) == {"customers": 1, "contracts": 1}
+    assert rollups(customers[0]) == (2, 300.0)
+    assert Contract.get_by_id(contract.id).events_count == 1
+    assert rebuild_rollups(database) == {"customers": 0, "contracts": 0}
+
+
+def test_ensure_rollup_columns():
+    """Les colonnes manquantes d'une ancienne base sont ajoutées."""
+    database = SqliteDatabase(":memory:")
+    models = [Role, User, Company, Customer, Contract, Event]
+    with database.bind_ctx(models):
+        database.create_tables(models)
+        database.execute_sql("ALTER TABLE contract DROP COLUMN events_count")
+
+        assert ensure_rollup_columns(database) == ["contract.events_count"]
+        assert "events_count" in [column.name for column in database.get_columns("contract")]
+        assert ensure_rollup_columns(database) == []
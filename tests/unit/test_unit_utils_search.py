@@ -0,0 +1,60 @@
+import pytest
+from datetime import datetime, timedelta
+from epicevents.models.database import BaseModel
+from epicevents.models.role import Role
+from epicevents.models.user import User
+from epicevents.models.company import Company
+from epicevents.models.customer import Customer
+from epicevents.models.contract import Contract
+from epicevents.models.event import Event
+from epicevents.utils.search import search
+
+
+@pytest.fixture
+def searchable(setup_db_tables):
+    """Un client Dupont, son entreprise et un événement à Lyon."""
+    sales = User.create(
+        username="sales", email="sales@epicevents.com", first_name="Sales", last_name="User",
+        phone="0123456789", password="password123", role=Role.create(name="sales")
+    )
+    company = Company.create(name="Lumière Industries")
+    customer = Customer.create(
+        email="jean.dupont@example.com", first_name="Jean", last_name="Dupont",
+        phone="0987654321", company=company, team_contact_id=sales
+    )
+    contract = Contract.create(customer=customer, signed=True, amount_total=1000.0, amount_due=0.0)
+    event = Event.create(
+        contract=contract, name="Séminaire Dupont", location="Lyon",
+        event_date=datetime.now() + timedelta(days=10), attendees=40, notes="Salle panoramique"
+    )
+    return {"company": company, "customer": customer, "event": event}
+
+
+def test_search_ranks_across_entities(searchable):
+    """Une seule recherche couvre clients et événements, le meilleur résultat en premier."""
+    database = BaseModel._meta.database
+
+    results = search("Dupont Lyon", database)
+
+    assert [(result["kind"], result["id"]) for result in results] == [
+        ("event", searchable["event"].id), ("customer", searchable["customer"].id)
+    ]
+    assert results[0]["title"] == "Séminaire Dupont"
+    assert results[0]["detail"] == "Lyon"
+
+
+def test_search_prefix_accents_and_sync(searchable):
+    """Préfixes, accents ignorés, et index tenu à jour par les déclencheurs."""
+    database = BaseModel._meta.database
+
+    assert [result["kind"] for result in search("lumi", database)] == ["company"]
+    assert [result["kind"] for result in search("seminaire", database)] == ["event"]
+    assert search("!!!", database) == []
+
+    # Mise à jour et suppression sont répercutées
+    Company.update(name="Globex").where(Company.id == searchable["company"].id).execute()
+    assert search("lumiere", database) == []
+    assert [result["title"] for result in search("globex", database)] == ["Globex"]
+
+    Event.delete().where(Event.id == searchable["event"].id).execute()
+    assert [result["kind"] for result in search("panoramique", database)] == []
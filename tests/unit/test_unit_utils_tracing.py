@@ -0,0 +1,59 @@
+import pytest
+import sentry_sdk
+from epicevents.models.role import Role
+from epicevents.models.database import BaseModel
+from epicevents.utils.tracing import name_command_transaction
+from epicevents.utils.tracing import trace_queries
+
+
+@pytest.fixture
+def sent_transactions():
+    """Client Sentry local au test : les transactions sont capturées au lieu d'être envoyées."""
+    captured = []
+
+    def capture(event, hint):
+        captured.append(event)
+        return None
+
+    client = sentry_sdk.Client(
+        dsn="https://key@sentry.invalid/1", traces_sample_rate=1.0, before_send_transaction=capture
+    )
+    with sentry_sdk.isolation_scope() as scope:
+        scope.set_client(client)
+        yield captured
+
+
+def test_trace_queries(setup_db_tables, sent_transactions):
+    """Chaque requête SQL devient un span 'db' de la transaction."""
+    database = BaseModel._meta.database
+    trace_queries(database)
+
+    try:
+        with sentry_sdk.start_transaction(op="cli.command", name="role"):
+            name_command_transaction("role", "list")
+            Role.select().count()
+    finally:
+        del database.execute_sql
+
+    assert len(sent_transactions) == 1
+    transaction = sent_transactions[0]
+    spans = [span for span in transaction["spans"] if span["op"] == "db"]
+    assert transaction["transaction"] == "role.list"
+    assert len(spans) == 1
+    assert spans[0]["description"].startswith("SELECT COUNT")
+
+
+def test_command_transaction(sent_transactions, monkeypatch):
+    """Une commande CLI produit une transaction 'resource.action' avec le span JWT."""
+    from typer.testing import CliRunner
+    from epicevents.cli import init_cli
+
+    monkeypatch.setattr("epicevents.permissions.auth.is_logged", lambda: None)
+
+    result = CliRunner().invoke(init_cli(), ["debug", "token"], obj={})
+
+    assert result.exit_code == 1
+    assert len(sent_transactions) == 1
+    transaction = sent_transactions[0]
+    assert transaction["transaction"] == "debug.token"
+    assert [span["op"] for span in transaction["spans"]] == ["auth.jwt"]